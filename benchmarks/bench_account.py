@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+"""
+Cost of creating an Account, as done once per request by most
+applications, and of using one sub-resource of it.
+
+    python -m benchmarks.bench_account [accounts]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from timeit import timeit
+
+from iris_sdk import Account, Client
+
+DEFAULT_ACCOUNTS = 20000
+
+def allocations(func):
+
+    """Bytes and blocks still held by the result of "func" """
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    del result
+    return (sum(stat.size_diff for stat in stats),
+        sum(stat.count_diff for stat in stats))
+
+def main(count=DEFAULT_ACCOUNTS):
+
+    client = Client("http://localhost/api", 1, "foo", "bar")
+    scenarios = [
+        ("Account(client=...)", lambda: Account(client=client)),
+        ("Account(client=...).orders", lambda: Account(client=client).orders),
+    ]
+
+    for name, func in scenarios:
+        func()
+        elapsed = timeit(func, number=count)
+        size, blocks = allocations(func)
+        print("{:28} {:8.1f} us, {:7} bytes in {:5} blocks".format(
+            name, elapsed / count * 1e6, size, blocks))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+
+"""
+Cost of the instrumentation hooks per request: none, the base no-op
+Instrumentation and a Collector, then the collected phases.
+
+    python -m benchmarks.bench_instrumentation [requests]
+"""
+
+import sys
+
+from time import perf_counter
+
+from iris_sdk import Client, Tns
+from iris_sdk.utils.instrumentation import Collector, Instrumentation
+from tests.stub_server import StubServer, tn_get
+
+DEFAULT_REQUESTS = 5000
+
+def run(url, instrumentation, total):
+    with Client(url, 1, "foo", "bar", instrumentation=instrumentation) \
+            as client:
+        tns = Tns(client=client)
+        tns.get("7576768750")
+        start = perf_counter()
+        for i in range(total):
+            tns.get("7576768750")
+        return (perf_counter() - start) / total
+
+def main(total=DEFAULT_REQUESTS):
+    collector = Collector()
+    with StubServer({"/api/tns": tn_get}) as server:
+        for name, instrumentation in (("none", None),
+                ("no-op", Instrumentation()), ("collector", collector)):
+            print("{:10} {:7.1f} us/request".format(name,
+                run(server.url, instrumentation, total) * 1e6))
+    for (endpoint, phase), stats in sorted(collector.summary().items()):
+        print("    {} {:10} p50 {:7.1f} us  p99 {:7.1f} us".format(endpoint,
+            phase, stats.p50 * 1e6, stats.p99 * 1e6))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
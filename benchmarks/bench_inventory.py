@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+"""
+Time of a full sync of the TnInventory from a local Iris stub, of a second
+sync with nothing changed, and the latency of lookups in the mirror against
+a request to the stub.
+
+    python -m benchmarks.bench_inventory [numbers] [page size]
+"""
+
+import sys
+
+from time import perf_counter
+
+from benchmarks.iris_stub import ACCOUNT_ID, IrisStub
+from iris_sdk import Client, TnInventory, Tns
+from tests import payloads
+from tests.stub_server import StubServer
+
+DEFAULT_NUMBERS = 100000
+DEFAULT_PAGE_SIZE = 1000
+LOOKUPS = 10000
+
+def timing(func, number):
+
+    """Microseconds per call of "func" """
+
+    start = perf_counter()
+    for i in range(number):
+        func()
+    return (perf_counter() - start) / number * 1e6
+
+def main(numbers=DEFAULT_NUMBERS, size=DEFAULT_PAGE_SIZE):
+    stub = IrisStub(numbers=numbers)
+    with StubServer({"/api": stub}) as server, \
+            Client(server.url, ACCOUNT_ID, "foo", "bar") as client, \
+            TnInventory() as inventory:
+        tns = Tns(client=client)
+        for name in ("full sync", "resync"):
+            start = perf_counter()
+            result = inventory.sync(tns, {"page": 1, "size": size})
+            assert result.seen == numbers, name
+            print("{:10} {:7.2f} s, {} changed".format(name,
+                perf_counter() - start, result.changed))
+
+        number = payloads.FIRST_TN + numbers // 2
+        lookups = [
+            ("get", lambda: inventory.get(number)),
+            ("find", lambda: inventory.find(state="NJ", limit=10)),
+            ("count", lambda: inventory.count(rate_center="JERSEYCITY")),
+            ("request", lambda: tns.list({"page": 1, "size": 1})),
+        ]
+        for name, func in lookups:
+            print("{:10} {:9.1f} us".format(name, timing(func,
+                (LOOKUPS if name != "request" else LOOKUPS // 100))))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
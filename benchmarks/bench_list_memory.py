@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+"""
+Memory held by the items of a large /tns listing, full resources vs.
+compact records.
+
+    python -m benchmarks.bench_list_memory [numbers]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from time import perf_counter
+
+from iris_sdk import Client, Tns
+from tests import payloads
+from tests.stub_server import StubServer
+
+DEFAULT_NUMBERS = 1000000
+
+def main(count=DEFAULT_NUMBERS):
+
+    tns_xml = payloads.tns(count)
+    routes = {"/api/tns": lambda *args: (200, tns_xml)}
+
+    print("tns: {} numbers, {:.1f} MB".format(count, len(tns_xml) / 2**20))
+
+    with StubServer(routes) as server:
+        for compact in (False, True):
+            with Client(server.url, 1, "foo", "bar", stream=True,
+                    compact=compact) as client:
+                gc.collect()
+                tracemalloc.start()
+                start = perf_counter()
+                items = Tns(client=client).list({}).items
+                elapsed = perf_counter() - start
+                gc.collect()
+                held = tracemalloc.get_traced_memory()[0]
+                tracemalloc.stop()
+            assert len(items) == count
+            assert items[-1].full_number == str(payloads.FIRST_TN + count - 1)
+            del items
+            print("    {:7} {:8.1f} MB, {:5} bytes per number, {:.2f} s"
+                .format(("compact" if compact else "full"), held / 2**20,
+                    held // count, elapsed))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
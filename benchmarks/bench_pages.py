@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+"""
+Time to list every page of the telephone numbers inventory: one page after
+the other, with prefetch and fanned out to 8 and 32 workers, against a
+local Iris stub answering after "latency" milliseconds.
+
+    python -m benchmarks.bench_pages [pages] [page size] [latency]
+"""
+
+import sys
+
+from time import perf_counter
+
+from benchmarks.iris_stub import ACCOUNT_ID, IrisStub
+from iris_sdk import Client, Tns
+from tests.stub_server import StubServer
+
+DEFAULT_LATENCY = 20
+DEFAULT_PAGE_SIZE = 25
+DEFAULT_PAGES = 400
+WORKERS = (8, 32)
+
+def crawl(url, size, **kwargs):
+    with Client(url, ACCOUNT_ID, "foo", "bar", pool_maxsize=32) as client:
+        start = perf_counter()
+        count = sum(1 for tn in Tns(client=client).iter_all(
+            {"page": 1, "size": size}, **kwargs))
+        return count, perf_counter() - start
+
+def main(pages=DEFAULT_PAGES, size=DEFAULT_PAGE_SIZE,
+        latency=DEFAULT_LATENCY):
+    stub = IrisStub(numbers=pages * size, latency=latency / 1e3)
+    with StubServer({"/api": stub}) as server:
+        # Warm up the stub's cache
+        crawl(server.url, size, max_workers=32)
+        runs = [("serial", {}), ("prefetch", {"prefetch": True})] + \
+            [("{} workers".format(workers), {"max_workers": workers})
+            for workers in WORKERS]
+        serial = None
+        for name, kwargs in runs:
+            count, elapsed = crawl(server.url, size, **kwargs)
+            assert count == pages * size, name
+            serial = (serial or elapsed)
+            print("{:10} {:7.2f} s ({:.1f}x)".format(name, elapsed,
+                serial / elapsed))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:4]])
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+"""
+Peak memory of listing large Tns / InServiceNumbers pages, buffered vs.
+streaming parse.
+
+    python -m benchmarks.bench_parse_memory [numbers]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from time import perf_counter
+
+from iris_sdk import Account, Client, Tns
+from tests import payloads
+from tests.stub_server import StubServer
+
+DEFAULT_NUMBERS = 50000
+
+def measure(client, list_page):
+    gc.collect()
+    tracemalloc.start()
+    start = perf_counter()
+    count = len(list_page(client).items)
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, peak, elapsed
+
+def main(count=DEFAULT_NUMBERS):
+
+    tns_xml = payloads.tns(count)
+    isn_xml = payloads.in_service_numbers(count)
+
+    routes = {
+        "/api/tns": lambda *args: (200, tns_xml),
+        "/api/accounts/1/inserviceNumbers": lambda *args: (200, isn_xml),
+    }
+
+    scenarios = [
+        ("tns", len(tns_xml), lambda client: Tns(client=client).list({})),
+        ("inserviceNumbers", len(isn_xml), lambda client:
+            Account(client=client).in_service_numbers.list()),
+    ]
+
+    with StubServer(routes) as server:
+        for name, size, list_page in scenarios:
+            print("{}: {} numbers, {:.1f} MB".format(name, count, size/2**20))
+            for stream in (False, True):
+                with Client(server.url, 1, "foo", "bar",
+                        stream=stream) as client:
+                    items, peak, elapsed = measure(client, list_page)
+                assert items == count
+                print("    {:9} peak {:7.1f} MB, {:.2f} s".format(
+                    ("streaming" if stream else "buffered"), peak/2**20,
+                    elapsed))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+"""
+Requests per second with and without connection pooling.
+
+    python -m benchmarks.bench_pooling [requests] [threads]
+"""
+
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+import requests
+
+from iris_sdk import Client, Tns
+from tests.stub_server import StubServer, tn_get
+
+DEFAULT_REQUESTS = 2000
+DEFAULT_THREADS = 8
+
+class _UnpooledSession(requests.Session):
+
+    """The pre-pooling behaviour: a new connection for every request"""
+
+    def request(self, *args, **kwargs):
+        with requests.Session() as session:
+            return session.request(*args, **kwargs)
+
+def run(client, total, threads):
+    tns = Tns(client=client)
+    start = perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(lambda i: tns.get("7576768750"), range(total)))
+    return total / (perf_counter() - start)
+
+def main(total=DEFAULT_REQUESTS, threads=DEFAULT_THREADS):
+    with StubServer({"/api/tns": tn_get}) as server:
+        with Client(server.url, 1, "foo", "bar",
+                session=_UnpooledSession()) as client:
+            unpooled = run(client, total, threads)
+        with Client(server.url, 1, "foo", "bar",
+                pool_maxsize=threads) as client:
+            pooled = run(client, total, threads)
+    print("unpooled: {:.0f} req/s".format(unpooled))
+    print("pooled:   {:.0f} req/s ({:.1f}x)".format(pooled, pooled/unpooled))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
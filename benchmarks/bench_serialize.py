@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+"""
+Serialization cost of LidbOrder, DldaOrder, TnOptionOrder and
+LineOptionOrder payloads of many numbers: element tree with every XML
+backend against the compiled serializer, in milliseconds per payload.
+
+    python -m benchmarks.bench_serialize [numbers per payload]
+"""
+
+import sys
+
+from timeit import repeat
+
+from iris_sdk import Account, Client
+from iris_sdk.utils.xml_backend import BACKENDS, etree, set_backend
+from tests import payloads
+
+DEFAULT_NUMBERS = 10000
+NUMBER = 5
+REPEAT = 3
+
+def orders(account, count):
+
+    """The payloads, with "count" numbers each"""
+
+    tns = [str(tn) for tn in payloads.numbers(count)]
+
+    lidb = account.lidbs.create({"customer_order_id": "123",
+        "lidb_tn_groups": {"lidb_tn_group": [{
+            "telephone_numbers": {"telephone_number": tns},
+            "subscriber_information": "Steve", "use_type": "RESIDENTIAL",
+            "visibility": "PUBLIC"}]}}, False)
+
+    dlda = account.dldas.create({"customer_order_id": "123",
+        "dlda_tn_groups": {"dlda_tn_group": [{
+            "telephone_numbers": {"telephone_number": tns},
+            "account_type": "RESIDENTIAL", "listing_type": "LISTED",
+            "list_address": "true",
+            "listing_name": {"first_name": "first name",
+                "last_name": "last name"},
+            "address": {"house_number": "915", "street_name": "street name",
+                "city": "city", "state_code": "NC", "zip": "27606",
+                "address_type": "DLDA"}}]}}, False)
+
+    tn_option_order = account.tn_option_orders.create({
+        "customer_order_id": "123",
+        "tn_option_groups": {"tn_option_group": [{
+            "number_format": "10digit", "rpid_format": "10digit",
+            "calling_name_display": "on",
+            "telephone_numbers": {"telephone_number": tns}}]}}, False)
+
+    line_option_order = account.line_option_orders
+    line_option_order.tn_line_options.items[:] = []
+    for tn in tns:
+        line_option_order.tn_line_options.add({"telephone_number": tn,
+            "calling_name_display": "on"})
+
+    return [("LidbOrder", lidb), ("DldaOrder", dlda),
+        ("TnOptionOrder", tn_option_order),
+        ("LineOptionOrder", line_option_order)]
+
+def timing(func):
+    return min(repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e3
+
+def serialize(order, compiled):
+    previous = type(order)._compiled_xml
+    type(order)._compiled_xml = compiled
+    try:
+        return order._serialize(), timing(order._serialize)
+    finally:
+        type(order)._compiled_xml = previous
+
+def main(count=DEFAULT_NUMBERS):
+    account = Account(client=Client("http://localhost", 1, "foo", "bar"))
+    backends = [name for name in sorted(BACKENDS)
+        if (etree is not None) or (name != "lxml")]
+    print("{:16} {}".format("ms/payload", " ".join("{:>10}".format(name)
+        for name in backends + ["compiled"])))
+    for name, order in orders(account, count):
+        times = []
+        for backend in backends:
+            previous = set_backend(backend)
+            try:
+                xml, elapsed = serialize(order, False)
+            finally:
+                set_backend(previous)
+            if backend == "stdlib":
+                reference = xml
+            times.append(elapsed)
+        xml, elapsed = serialize(order, True)
+        assert xml == reference, name
+        times.append(elapsed)
+        print("{:16} {}".format(name, " ".join("{:10.2f}".format(elapsed)
+            for elapsed in times)))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+"""
+Calls per second of "get" and "list" on resources shared by 1, 8 and 32
+threads with a stateless client, against a local Iris stub answering after
+a network round trip of "latency" milliseconds. The stub runs in the same
+process, so with no latency the threads only compete for the GIL.
+
+    python -m benchmarks.bench_threads [calls] [page size] [latency]
+"""
+
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from benchmarks.iris_stub import ACCOUNT_ID, IrisStub, ORDER_ID
+from iris_sdk import Account, Client, Tns
+from tests import payloads
+from tests.stub_server import StubServer
+
+DEFAULT_CALLS = 2000
+DEFAULT_LATENCY = 20
+DEFAULT_PAGE_SIZE = 100
+NUMBERS = 10000
+THREADS = (1, 8, 32)
+
+def run(url, calls, size, threads):
+
+    with Client(url, ACCOUNT_ID, "foo", "bar", pool_maxsize=threads,
+            stateless=True) as client:
+
+        # Shared by all the threads
+        orders = Account(client=client).orders
+        tns = Tns(client=client)
+        pages = NUMBERS // size
+
+        def call(index):
+            if index % 2:
+                order = orders.get(ORDER_ID).order
+                assert order.id == ORDER_ID
+            else:
+                page = index // 2 % pages + 1
+                items = tns.list({"page": page, "size": size}).items
+                assert int(items[0].full_number) == \
+                    payloads.FIRST_TN + (page - 1) * size, page
+
+        start = perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(call, range(calls)))
+        return calls / (perf_counter() - start)
+
+def main(calls=DEFAULT_CALLS, size=DEFAULT_PAGE_SIZE,
+        latency=DEFAULT_LATENCY):
+    stub = IrisStub(numbers=NUMBERS, latency=latency / 1e3)
+    with StubServer({"/api": stub}) as server:
+        # Warm up the stub's cache
+        run(server.url, NUMBERS // size * 2, size, 8)
+        single = None
+        for threads in THREADS:
+            rate = run(server.url, calls, size, threads)
+            single = (single or rate)
+            print("{:2} threads: {:6.0f} calls/s ({:.1f}x)".format(threads,
+                rate, rate / single))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:4]])
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+"""
+Time to reconcile two inventories of "numbers" telephone numbers differing
+by 1%, with Python sets of the number strings and with TnSets (NumPy when
+installed, array("q") otherwise), and to group them by NPA-NXX.
+
+    python -m benchmarks.bench_tn_set [numbers]
+"""
+
+import sys
+
+from array import array
+from random import Random
+from time import perf_counter
+
+from iris_sdk.utils import tn_set
+from iris_sdk.utils.tn_set import reconcile, TnSet
+
+DEFAULT_NUMBERS = 5000000
+FIRST_TN = 2012000000
+
+def inventories(count):
+
+    """The numbers in Iris and the billed ones, as strings, 1% apart"""
+
+    random = Random(0)
+    numbers = random.sample(range(FIRST_TN, FIRST_TN + count * 2), count)
+    changed = count // 100
+    iris = numbers[changed:]
+    billed = numbers[:-changed]
+    return [str(tn) for tn in iris], [str(tn) for tn in billed]
+
+def timed(name, func):
+    start = perf_counter()
+    result = func()
+    print("{:24} {:7.2f} s".format(name, perf_counter() - start))
+    return result
+
+def main(count=DEFAULT_NUMBERS):
+    iris, billed = inventories(count)
+    print("{} numbers, {}".format(count,
+        ("NumPy" if tn_set.numpy is not None else "array('q')")))
+
+    def python_sets():
+        iris_set, billed_set = set(iris), set(billed)
+        return (iris_set - billed_set, billed_set - iris_set,
+            iris_set & billed_set)
+
+    expected = timed("python sets", python_sets)
+
+    iris_numbers = array("q", map(int, iris))
+    billed_numbers = array("q", map(int, billed))
+    timed("tn sets from strings", lambda: (TnSet(iris), TnSet(billed)))
+    iris_set, billed_set = timed("tn sets from arrays",
+        lambda: (TnSet(iris_numbers), TnSet(billed_numbers)))
+    report = timed("reconcile", lambda: reconcile(iris_set, billed_set))
+    timed("npa-nxx groups", iris_set.prefixes)
+
+    assert [len(tns) for tns in report] == \
+        [len(tns) for tns in expected]
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""
+XML parsing and serialization cost of OrderResponse, PortIn and
+TelephoneNumber documents, in microseconds per document.
+
+    python -m benchmarks.bench_xml [numbers per document]
+"""
+
+import sys
+
+from timeit import repeat
+from xml.etree.ElementTree import fromstring
+
+from iris_sdk import Account, Client
+from iris_sdk.models.order import Order
+from iris_sdk.models.order_response import OrderResponse
+from iris_sdk.models.portin import PortIn
+from iris_sdk.models.telephone_number import TelephoneNumber
+from tests import payloads
+
+DEFAULT_NUMBERS = 10
+REPEAT = 5
+
+def parse_order(account, root):
+    order = Order(account.orders)
+    response = OrderResponse(account.orders)
+    response.order = order
+    response._from_xml(root)
+    return order
+
+def parse_portin(account, root):
+    portin = PortIn(account.portins)
+    portin._from_xml(root)
+    return portin
+
+def parse_tn(account, root):
+    tndetails = TelephoneNumber(account).tndetails
+    tndetails._from_xml(root)
+    return tndetails
+
+def scenarios(count):
+    return [
+        ("OrderResponse", payloads.order_response(count), parse_order),
+        ("PortIn", payloads.portin(count), parse_portin),
+        ("TelephoneNumber", payloads.telephone_number(), parse_tn),
+    ]
+
+def timing(func, number):
+    return min(repeat(func, number=number, repeat=REPEAT)) / number * 1e6
+
+def main(count=DEFAULT_NUMBERS, number=2000):
+    account = Account(client=Client("http://localhost", 1, "foo", "bar"))
+    print("{:16} {:>10} {:>10}".format("us/document", "parse", "serialize"))
+    for name, xml, parse in scenarios(count):
+        root = fromstring(xml)
+        instance = parse(account, root)
+        parse_us = timing(lambda: parse(account, fromstring(xml)), number)
+        serialize_us = timing(instance._serialize, number)
+        print("{:16} {:10.1f} {:10.1f}".format(name, parse_us, serialize_us))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
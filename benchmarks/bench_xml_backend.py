@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+"""
+Parse, streaming parse and serialize cost of large SearchResult and TNs
+documents with every available XML backend, in milliseconds per document.
+The parsed numbers and the canonical serialized documents are checked to
+be the same for all the backends.
+
+    python -m benchmarks.bench_xml_backend [numbers per document]
+"""
+
+import sys
+
+from timeit import repeat
+from xml.etree.ElementTree import canonicalize
+
+from iris_sdk import Account, Client
+from iris_sdk.models.available_numbers import AvailableNumbers
+from iris_sdk.models.in_service_numbers import InServiceNumbers
+from iris_sdk.utils.xml_backend import BACKENDS, etree, set_backend
+from tests import payloads
+
+CHUNK_SIZE = 65536
+DEFAULT_NUMBERS = 50000
+REPEAT = 3
+
+def search_result(account):
+    resource = AvailableNumbers(account)
+    return resource, lambda: resource.telephone_number_list.telephone_number.items
+
+def search_result_detail(account):
+    resource = AvailableNumbers(account)
+    return resource, lambda: [item.full_number for item in
+        resource.telephone_number_detail_list.telephone_number_detail.items]
+
+def tns(account):
+    resource = InServiceNumbers(account)
+    return resource, lambda: resource.telephone_numbers.telephone_number.items
+
+def scenarios(count):
+    return [
+        ("SearchResult", payloads.search_result(count), search_result),
+        ("SearchResult detail", payloads.search_result(count // 5, True),
+            search_result_detail),
+        ("TNs", payloads.in_service_numbers(count), tns),
+    ]
+
+def backends():
+    return [name for name in sorted(BACKENDS)
+        if (etree is not None) or (name != "lxml")]
+
+def timing(func):
+    return min(repeat(func, number=1, repeat=REPEAT)) * 1e3
+
+def run(account, xml, factory):
+
+    """Timings, parsed numbers and canonical serialized document"""
+
+    def parse():
+        resource, items = factory(account)
+        resource._load(xml)
+        return resource, items
+
+    def stream():
+        resource, items = factory(account)
+        resource._parse_stream(xml[i:i + CHUNK_SIZE]
+            for i in range(0, len(xml), CHUNK_SIZE))
+        return resource, items
+
+    resource, items = parse()
+    numbers = list(items())
+    streamed = stream()[1]
+    assert list(streamed()) == numbers
+    result = {"parse": timing(parse), "stream": timing(stream),
+        "serialize": timing(resource._serialize)}
+    return result, numbers, canonicalize(resource._serialize())
+
+def main(count=DEFAULT_NUMBERS):
+    account = Account(client=Client("http://localhost", 1, "foo", "bar"))
+    print("{:20} {:8} {:>10} {:>10} {:>10}".format("ms/document", "backend",
+        "parse", "stream", "serialize"))
+    for name, xml, factory in scenarios(count):
+        reference = None
+        for backend in backends():
+            previous = set_backend(backend)
+            try:
+                result, numbers, canonical = run(account, xml, factory)
+            finally:
+                set_backend(previous)
+            if reference is None:
+                reference = (numbers, canonical)
+            assert (numbers, canonical) == reference, \
+                "{} differs with {}".format(name, backend)
+            print("{:20} {:8} {:10.1f} {:10.1f} {:10.1f}".format(name,
+                backend, result["parse"], result["stream"],
+                result["serialize"]))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
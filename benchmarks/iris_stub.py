@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+"""
+Local stand-in for the Iris endpoints used by the benchmark suite: accounts,
+tns, orders, portins, inserviceNumbers and lnpchecker, with synthetic
+payloads of any size. Mount it on a StubServer:
+
+    with StubServer({"/api": IrisStub(numbers=100000)}) as server:
+        client = Client(server.url, ACCOUNT_ID, "foo", "bar")
+"""
+
+import re
+
+from threading import Lock
+from time import sleep
+
+from tests import payloads
+from tests.stub_server import XML_TN_GET
+
+ACCOUNT_ID = 9500249
+DEFAULT_PAGE_SIZE = 500
+ORDER_ID = "f30a31a1-1de4-4939-b094-4521bbe5c8df"
+PORTIN_ID = "d28b36f7-fa96-49eb-9556-a40fca49f7c6"
+TN_PATTERN = re.compile(rb"<(?:Tn|TelephoneNumber|PhoneNumber)>(\d+)<")
+
+class IrisStub(object):
+
+    """
+    Route answering like Iris. "numbers", "orders" and "portins" are the
+    sizes of the lists, served in pages of the requested "size" (the page
+    number is the "page" parameter) with the list size as their total
+    count, "order_numbers" - the numbers per
+    order or port-in. "latency" seconds are waited before every answer.
+    Generated documents are cached so the server costs as little as possible
+    to the client measured in the same process.
+    """
+
+    def __init__(self, numbers=10000, orders=1000, portins=1000,
+            order_numbers=10, latency=0):
+        self._cache = {}
+        self._latency = latency
+        self._lock = Lock()
+        self._order_numbers = order_numbers
+        self._sizes = {"tns": numbers, "inserviceNumbers": numbers,
+            "orders": orders, "portins": portins}
+        account = r"/api/accounts/\d+"
+        self._routes = [
+            ("GET", account + r"$", self._account),
+            ("GET", account + r"/inserviceNumbers$",
+                self._page("inserviceNumbers", payloads.in_service_numbers)),
+            ("POST", account + r"/lnpchecker$", self._lnpchecker),
+            ("GET", account + r"/orders$",
+                self._page("orders", payloads.orders)),
+            ("POST", account + r"/orders$",
+                self._created(ORDER_ID, self._order)),
+            ("GET", account + r"/orders/[^/]+$", self._order),
+            ("GET", account + r"/portins$",
+                self._page("portins", payloads.portins)),
+            ("POST", account + r"/portins$",
+                self._created(PORTIN_ID, self._portin)),
+            ("GET", account + r"/portins/[^/]+$", self._portin),
+            ("GET", r"/api/tns$", self._page("tns", payloads.tns)),
+            ("GET", r"/api/tns/\d+$", lambda *args: (200, XML_TN_GET)),
+            ("GET", r"/api/tns/\d+/tndetails$",
+                lambda *args: (200, payloads.telephone_number())),
+        ]
+        self._routes = [(method, re.compile(pattern), handler)
+            for method, pattern, handler in self._routes]
+
+    def __call__(self, method, path, query, body):
+        if self._latency:
+            sleep(self._latency)
+        for route_method, pattern, handler in self._routes:
+            if (route_method == method) and pattern.match(path):
+                return handler(path, query, body)
+        return 404, b""
+
+    def _account(self, path, query, body):
+        return 200, self._cached(("account",), payloads.account, ACCOUNT_ID)
+
+    def _cached(self, key, func, *args):
+        with self._lock:
+            content = self._cache.get(key)
+        if content is None:
+            content = func(*args)
+            with self._lock:
+                self._cache[key] = content
+        return content
+
+    def _created(self, id, handler):
+        def created(path, query, body):
+            status, content = handler(path, query, body)
+            return 201, content, {"Location": "{}/{}".format(path, id)}
+        return created
+
+    def _lnpchecker(self, path, query, body):
+        return 200, payloads.lnpchecker(
+            [int(tn) for tn in TN_PATTERN.findall(body)])
+
+    def _order(self, path, query, body):
+        return 200, self._cached(("order",), payloads.order_response,
+            self._order_numbers)
+
+    def _page(self, name, document):
+
+        """Handler of the paged list "name" of "document(count, start)" """
+
+        def page(path, query, body):
+            total = self._sizes[name]
+            number = int(query.get("page", ["1"])[0])
+            size = int(query.get("size", [str(DEFAULT_PAGE_SIZE)])[0])
+            start = min(total, (number - 1) * size)
+            count = min(size, total - start)
+            next_page = (number + 1 if start + count < total else None)
+            return 200, self._cached((name, number, size), document, count,
+                start, next_page, total)
+
+        return page
+
+    def _portin(self, path, query, body):
+        return 200, self._cached(("portin",), payloads.portin,
+            self._order_numbers)
@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+
+"""
+Offline benchmark suite: list/get/save throughput and latency against the
+local Iris stub, parse and serialize cost, memory peaks and the time spent
+per phase. Writes a JSON report and compares it to a previous one.
+
+    python -m benchmarks.suite [--quick] [--output report.json]
+        [--compare baseline.json] [--tolerance 0.2]
+
+Metric names end with their unit. "_per_s" metrics are better higher, the
+others (ms, us, mb) lower. With --compare the exit status is 1 if a metric
+got worse by more than the tolerance.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from time import perf_counter
+from xml.etree.ElementTree import fromstring
+
+from benchmarks import bench_serialize, bench_xml
+from benchmarks.iris_stub import ACCOUNT_ID, IrisStub
+from iris_sdk import Account, Client, TnInventory, Tns
+from iris_sdk.utils.instrumentation import Collector
+from tests import payloads
+from tests.stub_server import StubServer
+
+PERCENTILES = (50, 95, 99)
+REPORT_VERSION = 1
+
+SIZES = {
+    "full": {"numbers": 50000, "orders": 5000, "portins": 5000,
+        "page_size": 1000, "requests": 2000, "threads": 8,
+        "order_numbers": 100},
+    "quick": {"numbers": 5000, "orders": 500, "portins": 500,
+        "page_size": 500, "requests": 200, "threads": 4,
+        "order_numbers": 10},
+}
+
+ORDER = {
+    "name": "Benchmark order",
+    "site_id": "2297",
+    "customer_order_id": "123456789",
+    "existing_telephone_number_order_type": {
+        "telephone_number_list": {"telephone_number": ["9193752369"]}
+    }
+}
+
+PORTIN = {
+    "billing_telephone_number": "6882015002",
+    "subscriber": {"subscriber_type": "BUSINESS",
+        "business_name": "Acme Corporation",
+        "service_address": {"house_number": "1623",
+            "street_name": "Brockton Ave", "city": "Los Angeles",
+            "state_code": "CA", "zip": "90025", "county": "Los Angeles"}},
+    "loa_authorizing_person": "John Doe",
+    "list_of_phone_numbers": {"phone_number": ["9882015025"]},
+    "site_id": "365",
+}
+
+def percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100.0))]
+
+def latency(func, total):
+
+    """Calls "func" "total" times, returns the throughput and percentiles"""
+
+    func()
+    times = []
+    start = perf_counter()
+    for i in range(total):
+        call_start = perf_counter()
+        func()
+        times.append(perf_counter() - call_start)
+    elapsed = perf_counter() - start
+    result = {"requests_per_s": total / elapsed,
+        "mean_ms": elapsed / total * 1e3}
+    for percent in PERCENTILES:
+        result["p{}_ms".format(percent)] = percentile(times, percent) * 1e3
+    return result
+
+def concurrent(func, total, threads):
+    with ThreadPoolExecutor(threads) as pool:
+        start = perf_counter()
+        list(pool.map(lambda i: func(), range(total)))
+        elapsed = perf_counter() - start
+    return {"requests_per_s": total / elapsed}
+
+def listing(iterate, total):
+
+    """Iterates over every page, returns the items per second"""
+
+    start = perf_counter()
+    count = sum(1 for item in iterate())
+    elapsed = perf_counter() - start
+    assert count == total, (count, total)
+    return {"items_per_s": count / elapsed, "total_ms": elapsed * 1e3}
+
+def memory(func):
+
+    """Peak and retained memory of "func" in MB"""
+
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {"peak_mb": peak / 2**20, "held_mb": held / 2**20}
+
+def http_scenarios(url, sizes):
+
+    results = {}
+    total = sizes["requests"]
+    page = {"size": sizes["page_size"]}
+
+    with Client(url, ACCOUNT_ID, "foo", "bar",
+            pool_maxsize=sizes["threads"]) as client:
+
+        account = Account(client=client)
+        tns = Tns(client=client)
+
+        results["get_account"] = latency(account.get, total)
+        results["get_tn"] = latency(lambda: tns.get("7576768750"), total)
+        results["get_tn_concurrent"] = concurrent(
+            lambda: tns.get("7576768750"), total, sizes["threads"])
+        results["get_order"] = latency(
+            lambda: account.orders.get("f30a31a1"), total)
+        results["get_portin"] = latency(
+            lambda: account.portins.create(save=False).get("d28b36f7"),
+            total)
+        results["save_order"] = latency(
+            lambda: account.orders.create(ORDER), total)
+        results["save_portin"] = latency(
+            lambda: account.portins.create(PORTIN), total)
+
+        results["list_tns"] = listing(
+            lambda: tns.iter_all(dict(page)), sizes["numbers"])
+        results["list_tns_parallel"] = listing(
+            lambda: tns.iter_all(dict(page), max_workers=sizes["threads"]),
+            sizes["numbers"])
+        results["list_in_service_numbers"] = listing(
+            lambda: account.in_service_numbers.iter_all(dict(page)),
+            sizes["numbers"])
+        results["list_orders"] = listing(
+            lambda: account.orders.iter_all(dict(page)), sizes["orders"])
+        results["list_portins"] = listing(
+            lambda: account.portins.iter_all(dict(page)), sizes["portins"])
+
+        results["export_tns"] = listing(
+            lambda: tns.export(dict(page)).rows(), sizes["numbers"])
+        results["export_in_service_numbers"] = listing(
+            lambda: account.in_service_numbers.export(dict(page)).rows(),
+            sizes["numbers"])
+
+        numbers = list(payloads.numbers(sizes["numbers"]))
+        start = perf_counter()
+        checked = account.lnpchecker.bulk(numbers)
+        elapsed = perf_counter() - start
+        assert len(checked.portable_numbers.tn.items) == len(numbers)
+        results["lnpchecker_bulk"] = {
+            "numbers_per_s": len(numbers) / elapsed}
+
+    with Client(url, ACCOUNT_ID, "foo", "bar", pool_maxsize=sizes["threads"],
+            stateless=True) as client:
+        orders = Account(client=client).orders
+        results["get_order_stateless_concurrent"] = concurrent(
+            lambda: orders.get("f30a31a1"), total, sizes["threads"])
+
+    for stream in (False, True):
+        with Client(url, ACCOUNT_ID, "foo", "bar", stream=stream) as client:
+            results["memory_tns_page" + ("_stream" if stream else "")] = \
+                memory(lambda: Tns(client=client).list(
+                    {"size": sizes["numbers"]}).items)
+
+    with Client(url, ACCOUNT_ID, "foo", "bar") as client:
+        results["memory_tns_export"] = memory(
+            lambda: Tns(client=client).export({"size": sizes["numbers"]}))
+
+        with TnInventory() as inventory:
+            results["sync_inventory"] = listing(
+                lambda: range(inventory.sync(Tns(client=client),
+                dict(page)).seen), sizes["numbers"])
+            results["get_inventory"] = latency(
+                lambda: inventory.get(payloads.FIRST_TN), total)
+
+    return results
+
+def phase_scenarios(url, sizes):
+
+    """Median time per phase of the requests, through a Collector"""
+
+    collector = Collector()
+    with Client(url, ACCOUNT_ID, "foo", "bar",
+            instrumentation=collector) as client:
+        account = Account(client=client)
+        for i in range(sizes["requests"] // 10 or 1):
+            Tns(client=client).get("7576768750")
+            account.orders.get("f30a31a1")
+            account.orders.create(ORDER)
+        Tns(client=client).list({"size": sizes["page_size"]})
+
+    return dict(("phase {} {}".format(endpoint, phase),
+            {"p50_us": stats.p50 * 1e6, "count": stats.count})
+        for (endpoint, phase), stats in collector.summary().items())
+
+def xml_scenarios(sizes):
+
+    results = {}
+    account = Account(client=Client("http://localhost", 1, "foo", "bar"))
+    number = max(10, sizes["requests"] // 2)
+
+    for name, xml, parse in bench_xml.scenarios(sizes["order_numbers"]):
+        instance = parse(account, fromstring(xml))
+        results["xml_" + name] = {
+            "parse_us": bench_xml.timing(
+                lambda: parse(account, fromstring(xml)), number),
+            "serialize_us": bench_xml.timing(instance._serialize, number),
+        }
+
+    for name, order in bench_serialize.orders(account,
+            sizes["numbers"] // 5):
+        results["serialize_" + name] = {"compiled_ms": bench_xml.timing(
+            order._serialize, 5) / 1e3}
+
+    xml = payloads.tns(sizes["page_size"])
+    results["xml_tns_page"] = {"parse_us": bench_xml.timing(
+        lambda: Tns(client=account.client)._load(xml.decode()), 5)}
+
+    return results
+
+def run(sizes):
+    stub = IrisStub(numbers=sizes["numbers"], orders=sizes["orders"],
+        portins=sizes["portins"], order_numbers=sizes["order_numbers"])
+    results = {}
+    with StubServer({"/api": stub}) as server:
+        results.update(http_scenarios(server.url, sizes))
+        results.update(phase_scenarios(server.url, sizes))
+    results.update(xml_scenarios(sizes))
+    return results
+
+def compare(report, baseline, tolerance):
+
+    """Prints the changes, returns the metrics worse than "tolerance" """
+
+    regressions = []
+    for scenario, metrics in sorted(report["results"].items()):
+        for name, value in sorted(metrics.items()):
+            old = baseline["results"].get(scenario, {}).get(name)
+            if (not old) or (name == "count"):
+                continue
+            change = value / old - 1
+            worse = (-change if name.endswith("_per_s") else change)
+            flag = ""
+            if worse > tolerance:
+                regressions.append((scenario, name))
+                flag = "  REGRESSION"
+            print("{:45} {:16} {:12.2f} {:+7.1%}{}".format(scenario, name,
+                value, change, flag))
+    return regressions
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().split(
+        "\n")[0])
+    parser.add_argument("--quick", action="store_true",
+        help="small sizes, for a smoke run")
+    parser.add_argument("--output", help="JSON report path")
+    parser.add_argument("--compare", help="JSON report to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+        help="relative change counted as a regression (default 0.2)")
+    args = parser.parse_args(argv)
+
+    sizes = SIZES["quick" if args.quick else "full"]
+    report = {
+        "version": REPORT_VERSION,
+        "created": datetime.utcnow().isoformat() + "Z",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": sizes,
+        "results": run(sizes),
+    }
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            if compare(report, json.load(baseline), args.tolerance):
+                return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
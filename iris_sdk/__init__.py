@@ -1,4 +1,6 @@
+from iris_sdk.async_client import AsyncClient
 from iris_sdk.client import Client
+from iris_sdk.inventory import TnInventory
 from iris_sdk.models.account import Account
 from iris_sdk.models.cities import Cities
 from iris_sdk.models.covered_rate_centers import CoveredRateCenters
@@ -6,6 +8,8 @@ from iris_sdk.models.rate_centers import RateCenters
 from iris_sdk.models.tns import Tns
 from iris_sdk.models.users import Users
 from iris_sdk.utils.rest import RestError
+from iris_sdk.watcher import OrderWatcher
 
 __all__ = ["Client", "Account", "Tns", "Users", "Cities", "RateCenters",
-    "RestError", "CoveredRateCenters", ]
\ No newline at end of file
+    "RestError", "CoveredRateCenters", "OrderWatcher", "TnInventory",
+    "AsyncClient", ]
\ No newline at end of file
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+from asyncio import ensure_future, get_running_loop, \
+    run_coroutine_threadsafe
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from functools import partial, wraps
+
+from iris_sdk.client import Client
+from iris_sdk.include.xml_consts import XML_PARAM_PAGE
+from iris_sdk.utils.async_rest import AsyncRestClient
+from iris_sdk.utils.deadline import propagate
+from iris_sdk.utils.rest import DEFAULT_POOL_MAXSIZE
+
+# The event loop a resource method was awaited in, set in its thread
+_loop = ContextVar("iris_sdk_loop", default=None)
+
+def _threaded(method):
+
+    """
+    Client request methods return awaitables when they're called outside
+    the threads of the resource methods.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if _loop.get() is None:
+            return self.run(method, self, *args, **kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+class _LoopSession(object):
+
+    """
+    The "requests.Session" of the RestClient of an AsyncClient: sends the
+    requests of a resource method's thread through the AsyncRestClient, in
+    the event loop the method was awaited in.
+    """
+
+    def __init__(self, rest):
+        self._rest = rest
+
+    def close(self):
+        pass
+
+    def request(self, method, url, auth=None, headers=None, data=None,
+            params=None, stream=False, timeout=None):
+        return run_coroutine_threadsafe(self._rest.send(method, url, auth,
+            params, data, headers, timeout), _loop.get()).result()
+
+class AsyncClient(Client):
+
+    """
+    Asyncio HTTP requests, see AsyncRestClient.
+
+    Resource methods (get, list, save, create, ...) of resources created with
+    this client return awaitables:
+
+        async with AsyncClient(filename=<path to config>) as client:
+            orders = await Account(client=client).orders.list({"page": 1})
+
+    A method runs once, on one of the client's threads, while it's awaited.
+    Its requests are sent by the event loop it's awaited in, the thread
+    waits for their responses, so the loop is never blocked by a request
+    or a method.
+    "max_workers" - the number of threads, i.e. of methods running at a
+    time, "max_concurrency" by default. "max_concurrency" limits the number
+    of requests in flight. "session" is an "aiohttp.ClientSession", the
+    other settings are the same as in Client. Streamed responses are read
+    whole before they're parsed.
+    """
+
+    _async = True
+
+    def __init__(
+            self, url=None, account_id=None, username=None, password=None,
+            filename=None, session=None, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+            max_concurrency=None, compact=False, max_workers=None,
+            stream=False, cache=None, policy=None, instrumentation=None,
+            stateless=False, timeout=None):
+
+        self._async_rest = AsyncRestClient(session, pool_maxsize,
+            max_concurrency)
+        super().__init__(url, account_id, username, password, filename,
+            _LoopSession(self._async_rest), stream=stream, compact=compact,
+            cache=cache, policy=policy, instrumentation=instrumentation,
+            stateless=stateless, timeout=timeout)
+        self._executor = ThreadPoolExecutor(max_workers or max_concurrency)
+
+    def __enter__(self):
+        raise TypeError("Use 'async with'")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        await self._async_rest.close()
+        self._executor.shutdown(wait=False)
+
+    delete = _threaded(Client.delete)
+    get = _threaded(Client.get)
+    post = _threaded(Client.post)
+    put = _threaded(Client.put)
+
+    def dispatch(self, method, resource, *args, **kwargs):
+
+        """Runs a resource method, see BaseResource"""
+
+        # Nested calls run in the thread of the outer one
+        if _loop.get() is not None:
+            return method(resource, *args, **kwargs)
+
+        return self.run(method, resource, *args, **kwargs)
+
+    async def iter_all(self, resource, params=None, prefetch=False):
+
+        """Asyncio version of BaseResource._iter_all"""
+
+        async def list_page(params):
+            page = resource.__class__(resource._parent, self)
+            return resource._page_items(page, await page.list(params), params)
+
+        params = dict(params or {})
+        page = await list_page(dict(params))
+        pending = None
+
+        try:
+            while page is not None:
+                items, next_page = page
+                pending = None
+                if next_page is not None:
+                    params[XML_PARAM_PAGE] = next_page
+                    pending = dict(params)
+                    if prefetch:
+                        pending = ensure_future(list_page(pending))
+                for item in items:
+                    yield item
+                if pending is None:
+                    page = None
+                elif prefetch:
+                    page = await pending
+                else:
+                    page = await list_page(pending)
+        finally:
+            if prefetch and (pending is not None):
+                pending.cancel()
+
+    async def run(self, func, *args, **kwargs):
+
+        """
+        Calls "func" in one of the client's threads, its requests sent by
+        the running event loop, and returns its result. "func" runs in the
+        Deadline (see utils.deadline) of the caller.
+        """
+
+        loop = get_running_loop()
+        context = copy_context()
+        context.run(_loop.set, loop)
+        return await loop.run_in_executor(self._executor,
+            partial(context.run, propagate(func), *args, **kwargs))
@@ -1,25 +1,102 @@
 #!/usr/bin/env python
 
+import requests
+
 from iris_sdk.utils.config import Config
-from iris_sdk.utils.rest import RestClient
+from iris_sdk.utils.deadline import current_deadline, DeadlineExceeded
+from iris_sdk.utils.rest import DEFAULT_POOL_BLOCK, \
+    DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, RestClient
 
 class Client(object):
 
-    """HTTP requests"""
+    """
+    HTTP requests.
+
+    All the resources created with the same client share its connection
+    pool (see RestClient). Use "close" or a "with" block to release it.
+    With "stream" set, GET responses are parsed as they're downloaded instead
+    of being loaded into memory first.
+    With "compact" set, list items are parsed into slotted records holding
+    just the data (see "compact" in base_resource) rather than full
+    resources.
+    "cache" - a ResponseCache (see utils.cache) for reference data GET
+    requests.
+    "policy" - a RequestPolicy (see utils.policy) retrying, rate limiting
+    and circuit breaking the requests.
+    "instrumentation" - an Instrumentation (see utils.instrumentation) called
+    around the serialization, HTTP and parsing phases of the requests, e.g.
+    a Collector.
+    With "stateless" set, "get" and "list" load the responses into new
+    objects and return them, leaving the resources they're called on
+    untouched, so resources (account.orders, Tns, ...) can be shared between
+    threads. Everything else ("save", "create", ...) still updates the
+    resource it's called on.
+    "timeout" - the connect and read timeouts of the requests in seconds,
+    as a number or a (connect, read) tuple, None to wait forever. The
+    request methods take a "timeout" of their own, a Deadline (see
+    utils.deadline) sets them for the requests of the resources and limits
+    the time operations of several requests take.
+    """
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @property
+    def compact(self):
+        return self._compact
 
     @property
     def config(self):
         return self._config
 
+    @property
+    def instrumentation(self):
+        return self._instrumentation
+
+    @property
+    def policy(self):
+        return self._policy
+
+    @property
+    def stateless(self):
+        return self._stateless
+
+    @property
+    def stream(self):
+        return self._stream
+
+    @property
+    def timeout(self):
+        return self._timeout
+
     def __init__(
             self, url=None, account_id=None, username=None, password=None,
-            filename=None):
+            filename=None, session=None,
+            pool_connections=DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=DEFAULT_POOL_BLOCK,
+            stream=False, compact=False, cache=None, policy=None,
+            instrumentation=None, stateless=False, timeout=None):
 
         if url is None:
             url = "https://dashboard.bandwidth.com/api"
 
         self._config = Config(url, account_id, username, password, filename)
-        self._rest = RestClient()
+        self._rest = RestClient(session, pool_connections, pool_maxsize,
+            pool_block, policy, instrumentation, timeout)
+        self._cache = cache
+        self._compact = compact
+        self._instrumentation = instrumentation
+        self._policy = policy
+        self._stateless = stateless
+        self._stream = stream
+        self._timeout = timeout
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _get_uri(self, section=None):
 
@@ -34,20 +111,42 @@ class Client(object):
 
         return res
 
-    def _request(self,method,section=None,params=None,data=None,headers=None):
-        return self._rest.request(
+    def _request(self,method,section=None,params=None,data=None,headers=None,
+            stream=False, timeout=None):
+        deadline = current_deadline()
+        try:
+            return self._rest.request(
                     method, url=self._get_uri(section),
                     auth=(self.config.username, self.config.password),
-                    params=params, data=data, headers=headers)
-
-    def delete(self, section=None):
-        return self._request("DELETE", section)
-
-    def get(self, section=None, params=None):
-        return self._request("GET", section, params)
-
-    def post(self, section=None, params=None, data=None, headers=None):
-        return self._request("POST", section, params, data, headers)
-
-    def put(self, section=None, params=None, data=None, headers=None):
-        return self._request("PUT", section, params, data, headers)
+                    params=params, data=data, headers=headers, stream=stream,
+                    key=self.config.account_id, timeout=timeout,
+                    deadline=deadline)
+        except requests.exceptions.Timeout as error:
+            if (deadline is None) or (not deadline.expired()):
+                raise
+            raise DeadlineExceeded("Deadline exceeded") from error
+
+    def close(self):
+        self._rest.close()
+
+    def delete(self, section=None, timeout=None):
+        return self._request("DELETE", section, timeout=timeout)
+
+    def get(self, section=None, params=None, stream=False, timeout=None):
+        if self._cache is None:
+            return self._request("GET", section, params, stream=stream,
+                timeout=timeout)
+        return self._cache.request("/" + (section or "").strip("/"),
+            self._get_uri(section), params,
+            lambda headers: self._request("GET", section, params,
+                headers=headers, stream=stream, timeout=timeout))
+
+    def post(self, section=None, params=None, data=None, headers=None,
+            timeout=None):
+        return self._request("POST", section, params, data, headers,
+            timeout=timeout)
+
+    def put(self, section=None, params=None, data=None, headers=None,
+            timeout=None):
+        return self._request("PUT", section, params, data, headers,
+            timeout=timeout)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+
+"""
+Local SQLite mirror of the account's telephone numbers.
+
+The numbers of Tns.export are upserted into a "tns" table keyed by the
+number, with the in-service flag of InServiceNumbers and the site and SIP
+peer every number is assigned to, and indexed for lookups by status, rate
+center, state, LATA, site and peer without requests.
+"""
+
+import sqlite3
+
+from collections import namedtuple
+from time import time
+
+from iris_sdk.utils.columns import ColumnSpec, COLUMN_NUMBER, COLUMN_TEXT, \
+    TN_COLUMNS
+from iris_sdk.utils.concurrency import DEFAULT_MAX_WORKERS, Failure, \
+    map_concurrent
+
+BATCH_SIZE = 1000
+INDEXED_FIELDS = ("status", "rate_center", "state", "lata", "site_id",
+    "sip_peer_id")
+INVENTORY_COLUMNS = TN_COLUMNS + (
+    ColumnSpec("last_modified", "LastModified", COLUMN_TEXT),
+)
+PAGING_PARAMS = ("page", "size")
+SOURCE_ASSIGNMENTS = "assignments"
+SOURCE_IN_SERVICE = "in_service"
+SOURCE_TNS = "tns"
+XML_NAME_TELEPHONE_NUMBER = "TelephoneNumber"
+
+FIELDS = tuple(spec.name for spec in INVENTORY_COLUMNS) + \
+    ("site_id", "sip_peer_id", "in_service")
+
+TnRecord = namedtuple("TnRecord", FIELDS)
+
+SyncResult = namedtuple("SyncResult", ["source", "seen", "changed",
+    "removed"])
+
+class _UpsertSink(object):
+
+    """Export sink upserting the rows "BATCH_SIZE" at a time"""
+
+    def __init__(self, connection, sql, row):
+        self.changed = 0
+        self.seen = 0
+        self._batch = []
+        self._connection = connection
+        self._row = row
+        self._sql = sql
+
+    def __len__(self):
+        return self.seen
+
+    def append(self, record):
+        row = self._row(record)
+        if row is None:
+            return
+        self._batch.append(row)
+        if len(self._batch) >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if not self._batch:
+            return
+        self.changed += self._connection.executemany(self._sql,
+            self._batch).rowcount
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO temp.seen VALUES (?)",
+            ((row[0],) for row in self._batch))
+        self.seen += len(self._batch)
+        self._batch = []
+
+class TnInventory(object):
+
+    """
+    Telephone numbers mirrored into the SQLite database at "path", in
+    memory by default.
+
+    "sync" upserts the numbers of Tns.export, "sync_in_service" sets the
+    in-service flag from InServiceNumbers.export and "sync_assignments"
+    the site and SIP peer of every number. Only the rows that changed are
+    written. A sync without filters other than "page" and "size" in
+    "params" is a full one and also removes the numbers no longer listed,
+    a filtered one (by status, state, date, ... - whatever the endpoint
+    supports) only refreshes the numbers it lists.
+    The rows are TnRecord tuples of FIELDS, numbers as integers. Use an
+    inventory from the thread that created it.
+    """
+
+    @property
+    def connection(self):
+        return self._connection
+
+    def __init__(self, path=":memory:"):
+        self._connection = sqlite3.connect(path)
+        self._create()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.count()
+
+    def _create(self):
+        columns = ", ".join("{} {}".format(spec.name,
+            ("INTEGER" if spec.type == COLUMN_NUMBER else "TEXT"))
+            for spec in INVENTORY_COLUMNS[1:])
+        with self._connection as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS tns "
+                "(full_number INTEGER PRIMARY KEY, {}, site_id TEXT, "
+                "sip_peer_id TEXT, in_service INTEGER NOT NULL DEFAULT 0)".
+                format(columns))
+            for name in INDEXED_FIELDS:
+                connection.execute("CREATE INDEX IF NOT EXISTS tns_{0} "
+                    "ON tns ({0})".format(name))
+            connection.execute("CREATE TABLE IF NOT EXISTS syncs "
+                "(source TEXT PRIMARY KEY, synced REAL, count INTEGER)")
+            connection.execute("CREATE TEMP TABLE IF NOT EXISTS seen "
+                "(full_number INTEGER PRIMARY KEY)")
+            connection.execute("CREATE TEMP TABLE IF NOT EXISTS peers "
+                "(sip_peer_id TEXT PRIMARY KEY)")
+
+    def _sync(self, source, export, sql, row, prune=None, full=False):
+
+        """
+        Runs "export" into a sink upserting "row(record)" with "sql", then
+        "prune", in one transaction. A "full" sync is recorded in "syncs".
+        """
+
+        with self._connection as connection:
+            connection.execute("DELETE FROM temp.seen")
+            sink = _UpsertSink(connection, sql, row)
+            export(sink)
+            sink.flush()
+            removed = (0 if prune is None else
+                connection.execute(prune).rowcount)
+            if full:
+                connection.execute("INSERT OR REPLACE INTO syncs "
+                    "VALUES (?, ?, ?)", (source, time(), sink.seen))
+        return SyncResult(source, sink.seen, sink.changed, removed)
+
+    def _where(self, filters):
+        for name in filters:
+            if name not in FIELDS:
+                raise ValueError("Unknown field: {}".format(name))
+        if not filters:
+            return "", ()
+        names = sorted(filters)
+        return (" WHERE " + " AND ".join("{} = ?".format(name)
+            for name in names), tuple(filters[name] for name in names))
+
+    def close(self):
+        self._connection.close()
+
+    def count(self, **filters):
+
+        """The number of numbers whose FIELDS match "filters" """
+
+        where, args = self._where(filters)
+        return self._connection.execute("SELECT COUNT(*) FROM tns" + where,
+            args).fetchone()[0]
+
+    def find(self, limit=None, **filters):
+
+        """
+        The numbers whose FIELDS match "filters", e.g. find(state="NJ",
+        status="Inservice"), in ascending order, "limit" at most.
+        """
+
+        where, args = self._where(filters)
+        sql = "SELECT full_number FROM tns" + where + " ORDER BY full_number"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args += (limit,)
+        return [row[0] for row in self._connection.execute(sql, args)]
+
+    def get(self, number):
+
+        """The TnRecord of "number", None if it isn't in the inventory"""
+
+        row = self._connection.execute("SELECT * FROM tns "
+            "WHERE full_number = ?", (int(number),)).fetchone()
+        return (None if row is None else TnRecord._make(row))
+
+    def last_sync(self, source=SOURCE_TNS):
+
+        """
+        The "time.time" of the last full sync of "source" (SOURCE_TNS,
+        SOURCE_IN_SERVICE or SOURCE_ASSIGNMENTS), None if there was none.
+        """
+
+        row = self._connection.execute("SELECT synced FROM syncs "
+            "WHERE source = ?", (source,)).fetchone()
+        return (None if row is None else row[0])
+
+    def sync(self, tns, params=None):
+
+        """
+        Upserts the numbers of every page of "tns" (Tns) listed with
+        "params". Returns a SyncResult: the numbers listed, changed and
+        removed.
+        """
+
+        names = [spec.name for spec in INVENTORY_COLUMNS]
+        tags = [spec.tag for spec in INVENTORY_COLUMNS]
+        sql = ("INSERT INTO tns ({0}) VALUES ({1}) ON CONFLICT(full_number) "
+            "DO UPDATE SET {2} WHERE ({3}) IS NOT ({4})".format(
+            ", ".join(names), ", ".join("?" * len(names)),
+            ", ".join("{0} = excluded.{0}".format(name)
+                for name in names[1:]),
+            ", ".join("tns." + name for name in names[1:]),
+            ", ".join("excluded." + name for name in names[1:])))
+
+        def row(record):
+            number = record.get(tags[0])
+            if not number:
+                return None
+            return (int(number),) + tuple(record.get(tag) for tag in tags[1:])
+
+        full = _full(params)
+        return self._sync(SOURCE_TNS, lambda sink: tns.export(params, sink),
+            sql, row, ("DELETE FROM tns WHERE full_number NOT IN "
+            "(SELECT full_number FROM temp.seen)" if full else None), full)
+
+    def sync_assignments(self, account, max_workers=DEFAULT_MAX_WORKERS):
+
+        """
+        Sets the site and SIP peer of the numbers of every SIP peer of
+        every site of "account", listing up to "max_workers" sites or peers
+        at a time. Returns the list of Failure tuples (see
+        utils.concurrency) of the sites and peers that couldn't be listed,
+        their items (site id, peer id), the peer id None for a site. The
+        numbers of those keep their assignment, the others of the numbers
+        no longer on a peer are cleared.
+        """
+
+        if getattr(type(account.client), "_async", False):
+            raise TypeError("Syncs need a synchronous Client")
+
+        sites = account.sites.list().items
+        site_peers, errors = map_concurrent(
+            lambda site: site.sip_peers.list().items, sites, max_workers)
+        failures = [Failure(error.index, (error.item.id, None), error.error)
+            for error in errors]
+
+        peers = [(site.id, peer) for site, items in zip(sites, site_peers)
+            if items is not None for peer in items]
+        peer_tns, errors = map_concurrent(
+            lambda item: item[1].tns.list().items, peers, max_workers)
+        failures.extend(Failure(error.index, (error.item[0],
+            error.item[1].id), error.error) for error in errors)
+
+        def export(sink):
+            for (site_id, peer), tns in zip(peers, peer_tns):
+                if tns is None:
+                    continue
+                for tn in tns:
+                    sink.append((int(tn.full_number), site_id, peer.id))
+
+        sql = ("INSERT INTO tns (full_number, site_id, sip_peer_id) "
+            "VALUES (?, ?, ?) ON CONFLICT(full_number) DO UPDATE SET "
+            "site_id = excluded.site_id, sip_peer_id = excluded.sip_peer_id "
+            "WHERE (tns.site_id, tns.sip_peer_id) IS NOT "
+            "(excluded.site_id, excluded.sip_peer_id)")
+        prune = ("UPDATE tns SET site_id = NULL, sip_peer_id = NULL "
+            "WHERE sip_peer_id IS NOT NULL AND "
+            "full_number NOT IN (SELECT full_number FROM temp.seen)")
+
+        if failures:
+            with self._connection as connection:
+                connection.execute("DELETE FROM temp.peers")
+                connection.executemany("INSERT OR IGNORE INTO temp.peers "
+                    "VALUES (?)", ((peer.id,) for (site_id, peer), tns
+                    in zip(peers, peer_tns) if tns is not None))
+            prune += (" AND sip_peer_id IN "
+                "(SELECT sip_peer_id FROM temp.peers)")
+
+        self._sync(SOURCE_ASSIGNMENTS, export, sql, lambda row: row, prune,
+            not failures)
+        return failures
+
+    def sync_in_service(self, in_service_numbers, params=None):
+
+        """
+        Flags the numbers of every page of "in_service_numbers"
+        (InServiceNumbers) listed with "params" as in service, adding the
+        ones missing. Returns a SyncResult.
+        """
+
+        def row(record):
+            number = record.get(XML_NAME_TELEPHONE_NUMBER)
+            return (int(number),) if number else None
+
+        full = _full(params)
+        return self._sync(SOURCE_IN_SERVICE,
+            lambda sink: in_service_numbers.export(params, sink),
+            "INSERT INTO tns (full_number, in_service) VALUES (?, 1) "
+            "ON CONFLICT(full_number) DO UPDATE SET in_service = 1 "
+            "WHERE tns.in_service = 0",
+            row, ("UPDATE tns SET in_service = 0 WHERE in_service = 1 AND "
+            "full_number NOT IN (SELECT full_number FROM temp.seen)"
+            if full else None), full)
+
+def _full(params):
+
+    """Whether "params" list every number: no filters other than paging"""
+
+    return all(name in PAGING_PARAMS for name in (params or {}))
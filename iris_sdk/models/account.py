@@ -6,7 +6,7 @@ from future.builtins import super
 from iris_sdk.models.account_users import AccountUsers
 from iris_sdk.models.available_npa_nxx import AvailableNpaNxx
 from iris_sdk.models.available_numbers import AvailableNumbers
-from iris_sdk.models.base_resource import BaseResource
+from iris_sdk.models.base_resource import BaseResource, SubResource
 from iris_sdk.models.data.account import AccountData
 from iris_sdk.models.disc_numbers import DiscNumbers
 from iris_sdk.models.disconnects import Disconnects
@@ -33,29 +33,26 @@ class Account(BaseResource, AccountData):
 
     _xpath = XPATH_ACCOUNT
 
-    @property
-    def available_npa_nxx(self):
-        return self._available_npa_nxx
-
-    @property
-    def available_numbers(self):
-        return self._available_numbers
-
-    @property
-    def disconnected_numbers(self):
-        return self._disconnected_numbers
-
-    @property
-    def disconnects(self):
-        return self._disconnects
-
-    @property
-    def dldas(self):
-        return self._dldas
-
-    @property
-    def hosts(self):
-        return self._hosts
+    # Created on first access
+    available_npa_nxx = SubResource(AvailableNpaNxx, "_available_npa_nxx")
+    available_numbers = SubResource(AvailableNumbers, "_available_numbers")
+    disconnected_numbers = SubResource(DiscNumbers, "_disconnected_numbers")
+    disconnects = SubResource(Disconnects, "_disconnects")
+    dldas = SubResource(Dldas, "_dldas")
+    hosts = SubResource(SiteHosts, "_hosts")
+    import_tn_checker = SubResource(ImportTnChecker, "_import_tn_checker")
+    in_service_numbers = SubResource(InServiceNumbers, "_in_service_numbers")
+    lidbs = SubResource(Lidbs, "_lidbs")
+    line_option_orders = SubResource(LineOptionOrder, "_line_option_orders")
+    lnpchecker = SubResource(LnpChecker, "_lnpchecker")
+    orders = SubResource(Orders, "_orders")
+    portins = SubResource(PortIns, "_portins")
+    portouts = SubResource(PortOuts, "_portouts")
+    sites = SubResource(Sites, "_sites")
+    subscriptions = SubResource(Subscriptions, "_subscriptions")
+    tn_option_orders = SubResource(TnOptionOrders, "_tn_option_orders")
+    tnreservation = SubResource(Reservation, "_tnreservation")
+    users = SubResource(AccountUsers, "_users")
 
     @property
     def id(self):
@@ -64,82 +61,11 @@ class Account(BaseResource, AccountData):
     def id(self, id):
         self.account_id = id
 
-    @property
-    def import_tn_checker(self):
-        return self._import_tn_checker
-
-    @property
-    def in_service_numbers(self):
-        return self._in_service_numbers
-
-    @property
-    def lidbs(self):
-        return self._lidbs
-
-    @property
-    def line_option_orders(self):
-        return self._line_option_orders
-
-    @property
-    def lnpchecker(self):
-        return self._lnpchecker
-
-    @property
-    def orders(self):
-        return self._orders
-
-    @property
-    def portins(self):
-        return self._portins
-
-    @property
-    def portouts(self):
-        return self._portouts
-
-    @property
-    def sites(self):
-        return self._sites
-
-    @property
-    def subscriptions(self):
-        return self._subscriptions
-
-    @property
-    def tnreservation(self):
-        return self._tnreservation
-
-    @property
-    def users(self):
-        return self._users
-
-    @property
-    def tn_option_orders(self):
-        return self._tn_option_orders
-
     def __init__(self, parent=None, client=None):
         if client is not None:
             self.id = client.config.account_id
         super().__init__(parent, client)
         AccountData.__init__(self)
-        self._available_npa_nxx = AvailableNpaNxx(self, client)
-        self._available_numbers = AvailableNumbers(self, client)
-        self._disconnected_numbers = DiscNumbers(self, client)
-        self._disconnects = Disconnects(self, client)
-        self._hosts = SiteHosts(self, client)
-        self._import_tn_checker = ImportTnChecker(self, client)
-        self._in_service_numbers = InServiceNumbers(self, client)
-        self._line_option_orders = LineOptionOrder(self, client)
-        self._lnpchecker = LnpChecker(self, client)
-        self._orders = Orders(self, client)
-        self._portins = PortIns(self, client)
-        self._portouts = PortOuts(self, client)
-        self._lidbs = Lidbs(self, client)
-        self._dldas = Dldas(self, client)
-        self._subscriptions = Subscriptions(self, client)
-        self._sites = Sites(self, client)
-        self._tnreservation = Reservation(self, client)
-        self._users = AccountUsers(self, client)
-        self._tn_option_orders = TnOptionOrders(self, client)
 
     def get(self, id=None):
         return self._get_data(id)
@@ -22,8 +22,8 @@ class AvailableNumbers(BaseResource, AvailableNumbersData):
         AvailableNumbersData.__init__(self)
 
     def list(self, params):
-        self.get(params=params)
+        numbers = self.get(params=params)
         if params.get(XML_PARAM_TN_DETAIL, "") == XML_TRUE:
-            return self.telephone_number_detail_list.telephone_number_detail
+            return numbers.telephone_number_detail_list.telephone_number_detail
         else:
-            return self.telephone_number_list.telephone_number
\ No newline at end of file
+            return numbers.telephone_number_list.telephone_number
\ No newline at end of file
@@ -1,13 +1,27 @@
 #!/usr/bin/env python
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import wraps
 from inspect import getmro
-from io import BytesIO
-from xml.etree.ElementTree import Element, ElementTree, fromstring, SubElement
+from itertools import chain
+from mmap import ACCESS_READ, mmap as map_file
+from os import fspath, fstat, PathLike
+from sys import intern
 
+from iris_sdk.include.xml_consts import XML_PARAM_PAGE, XML_PARAM_SIZE
+from iris_sdk.models.maps import property_names
 from iris_sdk.models.maps.base_map import BaseMap
+from iris_sdk.utils.instrumentation import measure, PHASE_FROM_XML, \
+    PHASE_FROMSTRING, PHASE_PARSE_STREAM, PHASE_SERIALIZE, scope
+from iris_sdk.utils.deadline import propagate
 from iris_sdk.utils.rest import HTTP_OK
 from iris_sdk.utils.strings import Converter
+from iris_sdk.utils.xml_backend import get_backend
 
+ASYNC_METHODS = ("__call__", "change", "create", "delete", "download",
+    "get", "get_status", "list", "save", "update")
 BASE_MAP_SUFFIX = "Map"
 BASE_PROP_CLIENT = "client"
 BASE_PROP_ITEMS = "items"
@@ -16,6 +30,11 @@ BASE_PROP_NODE_SAVE = "_node_name_save"
 BASE_PROP_XPATH = "xpath"
 BASE_PROP_XPATH_SEPARATOR = "{"
 HEADER_LOCATION = "location"
+STREAM_CHILDREN = 0
+STREAM_CHUNK_SIZE = 65536
+STREAM_FIND = 1
+XML_DECLARATION = "<?xml version='1.0' encoding='UTF-8'?>\n"
+XML_NAME_LINKS = "Links"
 
 class BaseData(object):
 
@@ -27,6 +46,10 @@ class BaseData(object):
 
         for prop in dir(self):
 
+            # Sub-resources not created yet have nothing to flush
+            if not SubResource.created(self, prop):
+                continue
+
             property = getattr(self, prop)
 
             # Might be needed
@@ -145,20 +168,301 @@ class BaseResourceList(BaseResourceSimpleList):
         self.items.append(item)
         return item
 
+class XmlBinding(object):
+
+    """
+    The XML element <-> property correspondence of a model class, computed
+    once per class and shared by its instances (see "binding").
+
+    "fields" - (property, tag) pairs written by "_to_xml", taken from the
+    class's "*Map" base in "dir" order, None if there's no map,
+    "has_parent" - whether the class is a REST resource (takes a parent when
+    created as a list item),
+    "properties" - parsed tag -> (property name, has property), filled in as
+    the tags are seen,
+    "tags" - (property, "<Tag>", "</Tag>", "<Tag />") of the "fields", the
+    static parts written by the compiled serializer (see "_compiled_xml").
+    """
+
+    @property
+    def tags(self):
+        if self._tags is None and self.fields is not None:
+            self._tags = [(prop, "<{}>".format(tag), "</{}>".format(tag),
+                "<{} />".format(tag)) for prop, tag in self.fields]
+        return self._tags
+
+    def __init__(self, class_type):
+
+        self.has_parent = (BaseResource in class_type.__bases__)
+        self.properties = {}
+        self.fields = None
+        self._tags = None
+
+        for classtype in getmro(class_type):
+            if (classtype.__name__.endswith(BASE_MAP_SUFFIX) and
+                    classtype.__name__ != BaseMap.__name__):
+                self.fields = [(prop, _converter.to_camelcase(prop))
+                    for prop in dir(classtype) if not prop.startswith("_")]
+                break
+
+    def property(self, tag, instance):
+        try:
+            return self.properties[tag]
+        except KeyError:
+            name = _converter.to_underscore(tag)
+            self.properties[tag] = (name, hasattr(instance, name))
+            return self.properties[tag]
+
+_bindings = {}
+_converter = Converter()
+
+# Tags and names of the maps are the bulk of all the conversions
+Converter.seed(property_names())
+
+def binding(class_type):
+
+    """Returns the XmlBinding of a class"""
+
+    try:
+        return _bindings[class_type]
+    except KeyError:
+        return _bindings.setdefault(class_type, XmlBinding(class_type))
+
+def _escape(text):
+    if ("&" in text) or ("<" in text) or (">" in text):
+        text = text.replace("&", "&amp;").replace("<", "&lt;").replace(
+            ">", "&gt;")
+    return text
+
+def _write_xml(inst, out):
+
+    """
+    Appends the XML strings of the properties of "inst" to "out", the same
+    as "_to_xml" followed by ElementTree's serialization.
+    """
+
+    tags = binding(inst.__class__).tags
+    if tags is None:
+        return
+
+    for prop, start, end, empty in tags:
+
+        property = getattr(inst, prop)
+
+        if callable(property) or property is None:
+            continue
+
+        if isinstance(property, BaseResourceList):
+            for item in property.items:
+                pos = len(out)
+                out.append(start)
+                _write_xml(item, out)
+                if len(out) == pos + 1:
+                    out[pos] = empty
+                else:
+                    out.append(end)
+            continue
+
+        if isinstance(property, BaseResourceSimpleList):
+            for item in property.items:
+                text = str(item)
+                out.append((start + _escape(text) + end) if text else empty)
+            continue
+
+        if isinstance(property, BaseMap):
+            # Dropped if empty
+            pos = len(out)
+            out.append(start)
+            _write_xml(property, out)
+            if len(out) == pos + 1:
+                del out[pos]
+            else:
+                out.append(end)
+            continue
+
+        text = str(property)
+        out.append((start + _escape(text) + end) if text else empty)
+
+class CompactData(object):
+
+    """
+    Slotted record holding the map properties of a list item in compact
+    mode (see "compact").
+
+    Properties start as None, except the nested data objects (lists,
+    addresses, ...), copied from an empty instance of the original class on
+    first access. Plain properties of the original data classes are kept,
+    resource ones (sub-resources, REST methods) aren't.
+    """
+
+    __slots__ = ()
+
+    _nested = {}
+    _node_name = None
+    _plain = ()
+    _prototype = None
+
+    def __init__(self):
+        for name in self._plain:
+            setattr(self, name, None)
+
+    def __getattr__(self, name):
+        try:
+            value = self._nested[name]
+        except KeyError:
+            raise AttributeError(name)
+        # Links to the empty instance aren't copied
+        value = deepcopy(value, {id(self._prototype): None})
+        setattr(self, name, value)
+        return value
+
+_compact_classes = {}
+
+def compact(class_type):
+
+    """
+    Returns the CompactData class used instead of "class_type" for compact
+    list items, or "class_type" itself if it has no map.
+    """
+
+    try:
+        return _compact_classes[class_type]
+    except KeyError:
+        return _compact_classes.setdefault(class_type,
+            _compact_class(class_type))
+
+def _compact_class(class_type):
+
+    fields = binding(class_type).fields
+    if fields is None:
+        return class_type
+
+    names = tuple(prop for prop, tag in fields)
+    prototype = class_type()
+    nested = dict((name, getattr(prototype, name)) for name in names
+        if getattr(prototype, name) is not None)
+    attrs = {
+        "__slots__": names,
+        "_nested": nested,
+        "_plain": tuple(name for name in names if name not in nested),
+        "_prototype": prototype
+    }
+
+    for classtype in reversed(getmro(class_type)):
+        if issubclass(classtype, BaseResource) or (classtype is BaseData):
+            continue
+        for name, attr in vars(classtype).items():
+            if isinstance(attr, property) and (name not in names):
+                attrs[name] = attr
+
+    return type("Compact" + class_type.__name__, (CompactData,), attrs)
+
+def awaitable(method):
+
+    """
+    Resource methods return awaitables when the client is an AsyncClient.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        client = self._client
+        if getattr(type(client), "_async", False):
+            return client.dispatch(method, self, *args, **kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+class SubResource(object):
+
+    """
+    Read-only property holding a child resource, created on first access
+    and kept in the instance attribute "name":
+
+        orders = SubResource(Orders, "_orders")
+    """
+
+    @property
+    def name(self):
+        return self._name
+
+    def __init__(self, class_type, name):
+        self._class_type = class_type
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self._name]
+        except KeyError:
+            return instance.__dict__.setdefault(self._name,
+                self._class_type(instance, instance.client))
+
+    def __set__(self, instance, value):
+        raise AttributeError("can't set attribute")
+
+    @staticmethod
+    def attach(instance, prop, value):
+
+        """Keeps "value" as the child resource "prop" of "instance" """
+
+        instance.__dict__[getattr(type(instance), prop).name] = value
+
+    @staticmethod
+    def created(instance, prop):
+
+        """False if "prop" is a SubResource not accessed yet"""
+
+        attr = getattr(type(instance), prop, None)
+        return (not isinstance(attr, SubResource)) or \
+            (attr.name in instance.__dict__)
+
+    @staticmethod
+    def find(instance, name):
+
+        """Returns the SubResource kept in the attribute "name" or None"""
+
+        class_type = type(instance)
+        try:
+            props = _sub_resources[class_type]
+        except KeyError:
+            props = _sub_resources.setdefault(class_type, dict(
+                (attr.name, attr) for attr in
+                (getattr(class_type, prop) for prop in dir(class_type))
+                if isinstance(attr, SubResource)))
+        return props.get(name)
+
+_sub_resources = {}
+
 class BaseResource(BaseData):
 
     """
     REST resource.
 
     "_node_name" - corresponding XML element name,
+    "_compiled_xml" - if True, "_serialize" writes the XML straight to a
+    string from the precomputed tags of the classes instead of building an
+    element tree, for large payloads sent over and over,
+    "_count_property" - the property holding the total number of items of
+    a paginated list, for requesting its pages in parallel (see
+    "_iter_all"),
+    "_private" - set on the instances created by the SDK itself for a single
+    request (see "_fresh"), never shared between threads,
     "_save_post" - uses POST if True, PUT - otherwise,
     "_xpath_save" - if set, uses this for saving,
     "client" does http requests,
     "xpath" returns the REST resource's relative path.
+
+    The "ASYNC_METHODS" of descendants are wrapped with "awaitable".
     """
 
+    _client = None
+    _compiled_xml = False
+    _converter = _converter
+    _count_property = None
     _id = None
     _parent = None
+    _private = False
     _node_name = None
     _node_name_save = None
     _save_post = False
@@ -183,24 +487,173 @@ class BaseResource(BaseData):
     def xpath(self):
         return self._xpath
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in ASYNC_METHODS:
+            if name in cls.__dict__:
+                setattr(cls, name, awaitable(cls.__dict__[name]))
+
     def __init__(self, parent=None, client=None):
-        self._converter = Converter()
         self._parent = parent
         self._client = client
         if (client is None) and (parent is not None):
             self._client = parent.client
 
+    def __getattr__(self, name):
+
+        # Backing attributes of the sub-resources not accessed yet
+        prop = SubResource.find(self, name)
+        if prop is None:
+            raise AttributeError(name)
+        return prop.__get__(self)
+
     def _delete_file(self, xpath, id):
         if id is None:
             raise ValueError("No id specified")
         path = ""
         if xpath is not None:
             path = xpath.format(id)
-        response = self._client.delete(section=self.get_xpath() + path)
+        response = self._send(xpath, self._client.delete,
+            section=self.get_xpath() + path)
         return response.status_code == HTTP_OK
 
+    def _detached(self):
+
+        """
+        The instance "get" and "list" load the response into: this one, or,
+        with a stateless client (see Client), a fresh one with the same id so
+        that the resource itself is never modified.
+        """
+
+        if self._private or \
+                (not getattr(self._client, "stateless", False)):
+            return self
+        inst = self._fresh()
+        inst.id = self.id
+        return inst
+
+    def _download_file(self, xpath, id, destination, chunk_size):
+
+        """
+        Writes the file to "destination", a path or an object with "write",
+        as it's downloaded. Returns the number of bytes written.
+        """
+
+        response = self._get_file(xpath, id, stream=True)
+        size = 0
+
+        try:
+            if isinstance(destination, str):
+                with open(destination, "wb") as writer:
+                    for chunk in response.iter_content(chunk_size):
+                        writer.write(chunk)
+                        size += len(chunk)
+            else:
+                for chunk in response.iter_content(chunk_size):
+                    destination.write(chunk)
+                    size += len(chunk)
+        finally:
+            response.close()
+
+        return size
+
     def _element_from_string(self, str):
-        return fromstring(str)
+        return get_backend().fromstring(str)
+
+    def _export(self, sink, params, list_tag, item_tag):
+
+        """
+        Passes the "item_tag" elements of the "list_tag" list of every page
+        to "sink" (see utils.columns), following "links.next". Every item
+        is appended as a dict of its child elements' tags and texts,
+        {item_tag: text} if it has no children. No resource objects are
+        created for the items. With a streaming client the pages are parsed
+        as they are downloaded.
+        """
+
+        if getattr(type(self._client), "_async", False):
+            raise TypeError("Exports need a synchronous Client")
+
+        params = dict(params or {})
+        instrumentation = getattr(self._client, "instrumentation", None)
+        resource = type(self).__name__
+        endpoint = self._xpath_template()
+
+        while True:
+            page = self._fresh()
+            if self._client.stream:
+                response = page._get(params=params, stream=True)
+                try:
+                    chunks = response.iter_content(STREAM_CHUNK_SIZE)
+                    if instrumentation is None:
+                        page._export_stream(chunks, sink, list_tag, item_tag)
+                    else:
+                        with measure(instrumentation, PHASE_PARSE_STREAM,
+                                resource, endpoint):
+                            page._export_stream(chunks, sink, list_tag,
+                                item_tag)
+                finally:
+                    response.close()
+            else:
+                content = page._get(params=params).content
+                if content:
+                    if instrumentation is None:
+                        root = page._element_from_string(content)
+                    else:
+                        with measure(instrumentation, PHASE_FROMSTRING,
+                                resource, endpoint, size=len(content)):
+                            root = page._element_from_string(content)
+                    page._export_tree(root, sink, list_tag, item_tag)
+            next_page = self._next_page(page, params)
+            if next_page is None:
+                return sink
+            params[XML_PARAM_PAGE] = next_page
+
+    def _export_stream(self, chunks, sink, list_tag, item_tag):
+        parser = get_backend().pull_parser()
+        stack = []
+        record = {}
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, el in parser.read_events():
+                if event == "start":
+                    stack.append(el)
+                    continue
+                stack.pop()
+                if not stack:
+                    continue
+                parent = stack[-1]
+                if parent.tag == list_tag:
+                    if el.tag == item_tag:
+                        if not record:
+                            record[item_tag] = el.text
+                        sink.append(record)
+                        record = {}
+                        del parent[:]
+                elif (parent.tag == item_tag) and (len(stack) > 1) and \
+                        (stack[-2].tag == list_tag):
+                    record[el.tag] = el.text
+                elif parent.tag == XML_NAME_LINKS:
+                    setattr(self.links, self._converter.to_underscore(
+                        el.tag), el.text)
+        parser.close()
+
+    def _export_tree(self, root, sink, list_tag, item_tag):
+        for el in root.iterfind(XML_NAME_LINKS + "/*"):
+            setattr(self.links, self._converter.to_underscore(el.tag),
+                el.text)
+        append = sink.append
+        for item in root.iterfind(list_tag + "/" + item_tag):
+            append({el.tag: el.text for el in item} or
+                {item_tag: item.text})
+
+    def _fresh(self):
+
+        """A new private instance of the class with the same parent"""
+
+        inst = self.__class__(self._parent, self._client)
+        inst._private = True
+        return inst
 
     def _from_xml(self, element, instance=None):
 
@@ -241,27 +694,32 @@ class BaseResource(BaseData):
 
         # The provided element is actually the one we're searching for
         if element.tag == search_name:
-            element_children = element.getchildren()
+            element_children = list(element)
         else:
             element_children = element.findall(search_name)
 
+        properties = binding(inst.__class__)
+
         for el in element_children:
 
-            tag = self._converter.to_underscore(el.tag)
+            tag, has_property = properties.property(el.tag, inst)
 
             property = None
-            if not hasattr(inst, tag):
+            if not has_property:
                 # Not the base class
                 if instance is not None:
                     continue
             else:
                 property = getattr(inst, tag)
 
-            if len(el.getchildren()) == 0:
+            if len(el) == 0:
                 if el.text is not None:
                     # Simple list - multiple "<tag></tag>" lines
                     if isinstance(property, BaseResourceSimpleList):
                         property.items.append(el.text)
+                    elif isinstance(inst, CompactData):
+                        # Repeated values (states, statuses, ...) are shared
+                        setattr(inst, tag, intern(el.text))
                     else:
                         setattr(inst, tag, el.text)
                 continue
@@ -270,81 +728,315 @@ class BaseResource(BaseData):
 
             # List of instances - add an item and parse recursively
             if isinstance(property, BaseResourceList):
-                # Set parents for REST resources
-                has_parent = False
-                for class_type in property.class_type.__bases__:
-                    if class_type == BaseResource:
-                        has_parent = True
-                        break
-                self._class = property.class_type
-                if has_parent:
-                    item = property.class_type(property.parent)
-                else:
-                    item = property.class_type()
-                property.items.append(item)
-                _inst = property.items[-1]
+                _inst = self._new_list_item(property)
 
             # Instance's class mirrors the element's structure
             self._from_xml(el, _inst)
 
-    def _get(self, id=None, params=None):
+    def _from_xml_stream(self, chunks):
+
+        """
+        Streaming "_from_xml" for the XML data in "chunks" (bytes).
+
+        The object is filled as the elements arrive, parsed elements are
+        dropped right away, so the whole document is never kept in memory.
+        Every open element has a frame on the stack:
+        [element, instance, property name, property, children, has children]
+        where "children" is how its child elements are handled:
+        (STREAM_CHILDREN, instance, is base) - as properties of "instance",
+        (STREAM_FIND, None, None) - only "_node_name" ones, the rest skipped,
+        None - all skipped.
+        """
+
+        parser = get_backend().pull_parser()
+        stack = []
+
+        node_name = None
+        if hasattr(self, BASE_PROP_NODE):
+            node_name = self._node_name
+        search_name = (node_name or self.__class__.__name__)
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, el in parser.read_events():
+                if event == "start":
+                    if not stack:
+                        # Root
+                        stack.append([el, None, None, None,
+                            self._stream_children(el, None, search_name),
+                            False])
+                        continue
+                    frame = stack[-1]
+                    if not frame[5]:
+                        frame[5] = True
+                        if frame[1] is not None:
+                            frame[4] = self._stream_descend(frame,
+                                search_name)
+                    stack.append(self._stream_frame(el, frame[4],
+                        search_name))
+                    continue
+                frame = stack.pop()
+                if (frame[1] is not None) and (not frame[5]) and \
+                        (el.text is not None):
+                    # Simple list - multiple "<tag></tag>" lines
+                    if isinstance(frame[3], BaseResourceSimpleList):
+                        frame[3].items.append(el.text)
+                    elif isinstance(frame[1], CompactData):
+                        setattr(frame[1], frame[2], intern(el.text))
+                    else:
+                        setattr(frame[1], frame[2], el.text)
+                if stack:
+                    del stack[-1][0][:]
+
+        parser.close()
+
+    def _get(self, id=None, params=None, stream=False):
         new_id = (id or self.id)
         self.clear()
         self.id = new_id
         xpath = self.get_xpath()
         if (self.id is None) and (BASE_PROP_XPATH_SEPARATOR in xpath):
             raise ValueError("No id specified")
-        return self._client.get(self.get_xpath(), params)
+        if stream:
+            return self._send(None, self._client.get, self.get_xpath(), params,
+                stream=True)
+        return self._send(None, self._client.get, self.get_xpath(), params)
 
     def _get_data(self, id=None, params=None):
-        content = self._get(id, params).content.decode(encoding="UTF-8")
+        inst = self._detached()
+        if self._client.stream:
+            response = inst._get(id, params, stream=True)
+            try:
+                chunks = response.iter_content(STREAM_CHUNK_SIZE)
+                # Empty responses
+                for chunk in chunks:
+                    if chunk:
+                        inst._parse_stream(chain((chunk,), chunks))
+                        break
+            finally:
+                response.close()
+            return inst
+        # Bytes, the parser decodes them as the XML declaration says
+        content = inst._get(id, params).content
         if content:
-            root = self._element_from_string(content)
-            self._from_xml(root)
-        return self
+            inst._load(content)
+        return inst
 
-    def _get_file(self, xpath, id):
+    def _get_file(self, xpath, id, stream=False):
         if id is None:
             raise ValueError("No id specified")
         path = ""
         if xpath is not None:
             path = xpath.format(id)
-        return self._client.get(section=self.get_xpath() + path)
+        return self._send(xpath, self._client.get,
+            section=self.get_xpath() + path, stream=stream)
 
     def _get_status(self, id=None, params=None):
-        return self._get(id, params).status
+        return self._detached()._get(id, params).status
+
+    def _iter_all(self, params=None, prefetch=False, max_workers=None):
+
+        """
+        Iterates over the items of every page of "list", following
+        "links.next". Pages are requested when needed by a fresh instance of
+        the class, so only the current page is kept in memory, two - with
+        "prefetch", which requests the next page in the background while the
+        current one is iterated over.
+        With "max_workers" the first page is requested alone, then, if the
+        list is paged by page numbers, the remaining pages are told from its
+        total count ("_count_property") and the page size and requested up
+        to "max_workers" at a time, the items still coming in order. Lists
+        paged by cursors (the first number of the next page, ...) are walked
+        with "prefetch".
+        With an AsyncClient an async iterator is returned.
+        """
+
+        if getattr(type(self._client), "_async", False):
+            if max_workers is not None:
+                raise TypeError("Use asyncio.gather with an AsyncClient")
+            return self._client.iter_all(self, params, prefetch)
+
+        if max_workers is not None:
+            return self._parallel_iter_all(params, max_workers)
+
+        return self._sync_iter_all(params, prefetch)
+
+    def _list_page(self, params):
+
+        """
+        Returns the items of a page and the next page, None if it's the last
+        one.
+        """
+
+        page = self._fresh()
+        return self._page_items(page, page.list(params), params)
+
+    def _next_page(self, page, params):
+
+        """The page after "page", None if it's the last one"""
+
+        next_page = page.links.next
+        # parse_qs lists
+        if isinstance(next_page, list):
+            next_page = (next_page[0] if next_page else None)
+        if (not next_page) or \
+                (str(next_page) == str(params.get(XML_PARAM_PAGE))):
+            next_page = None
+        return next_page
+
+    def _page_items(self, page, items, params):
+        return items.items, self._next_page(page, params)
+
+    def _page_numbers(self, page, params, count, next_page):
+
+        """
+        The numbers of the pages after "page", requested with "params" and
+        holding "count" items, None if the list isn't paged by numbers.
+        """
+
+        if (next_page is None) or (self._count_property is None):
+            return None
+        try:
+            total = int(getattr(page, self._count_property))
+            first = int(params.get(XML_PARAM_PAGE, 1))
+            size = int(params.get(XML_PARAM_SIZE, count))
+        except (TypeError, ValueError):
+            return None
+        if (size < 1) or (str(next_page) != str(first + 1)):
+            return None
+        return range(first + 1, -(-total // size) + 1)
+
+    def _parallel_iter_all(self, params, max_workers):
+
+        params = dict(params or {})
+        page = self._fresh()
+        items, next_page = self._page_items(page, page.list(dict(params)),
+            params)
+        numbers = self._page_numbers(page, params, len(items), next_page)
+
+        if numbers is None:
+            for item in items:
+                yield item
+            if next_page is not None:
+                params[XML_PARAM_PAGE] = next_page
+                for item in self._sync_iter_all(params, True):
+                    yield item
+            return
+
+        def fetch(number):
+            page_params = dict(params)
+            page_params[XML_PARAM_PAGE] = number
+            return self._list_page(page_params)[0]
+
+        fetch = propagate(fetch)
+        numbers = iter(numbers)
+        executor = ThreadPoolExecutor(max_workers)
+        pending = deque()
+
+        try:
+            # At most "max_workers" pages requested ahead of the one iterated
+            for number in numbers:
+                pending.append(executor.submit(fetch, number))
+                if len(pending) == max_workers:
+                    break
+            for item in items:
+                yield item
+            while pending:
+                items = pending.popleft().result()
+                for number in numbers:
+                    pending.append(executor.submit(fetch, number))
+                    break
+                for item in items:
+                    yield item
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _load(self, content):
+
+        """Parses the XML string "content" into the resource"""
+
+        instrumentation = getattr(self._client, "instrumentation", None)
+        if instrumentation is None:
+            self._from_xml(self._element_from_string(content))
+            return self
+
+        resource = type(self).__name__
+        endpoint = self._xpath_template()
+        with measure(instrumentation, PHASE_FROMSTRING, resource, endpoint,
+                size=len(content)):
+            root = self._element_from_string(content)
+        with measure(instrumentation, PHASE_FROM_XML, resource, endpoint):
+            self._from_xml(root)
+        return self
+
+    def _new_list_item(self, property):
+
+        """Appends an item to a BaseResourceList property"""
+
+        class_type = property.class_type
+        if getattr(self._client, "compact", False) is True:
+            class_type = compact(class_type)
+
+        # Set parents for REST resources
+        if binding(class_type).has_parent:
+            item = class_type(property.parent)
+        else:
+            item = class_type()
+        property.items.append(item)
+        return item
+
+    def _parse_stream(self, chunks):
+        instrumentation = getattr(self._client, "instrumentation", None)
+        if instrumentation is None:
+            return self._from_xml_stream(chunks)
+        with measure(instrumentation, PHASE_PARSE_STREAM, type(self).__name__,
+                self._xpath_template()):
+            self._from_xml_stream(chunks)
 
     def _post(self, xpath, data, params):
-        return self._client.post(section=xpath, params=params, data=data)
+        return self._send(None, self._client.post, section=xpath,
+            params=params, data=data)
 
     def _post_data(self, response_instance=None, params=None):
         content = self._save(return_content=True, params=params)
         if content:
-            root = self._element_from_string(content)
             inst = (response_instance or self)
             inst.clear()
-            inst._from_xml(root)
+            inst._load(content)
             return inst
         return self
 
     def _put(self, xpath, data):
-        return self._client.put(section=xpath, data=data)
+        return self._send(None, self._client.put, section=xpath, data=data)
 
     def _save(self, return_content=False, params=None):
 
-        data = self._serialize()
+        # New resources are posted to the parent
+        resource = self
+        if (self.id is None) and (not self._save_post):
+            resource = self._parent
+
+        instrumentation = getattr(self._client, "instrumentation", None)
+        if instrumentation is None:
+            data = self._serialize()
+        else:
+            with measure(instrumentation, PHASE_SERIALIZE, type(self).__name__,
+                    resource._xpath_template(True)) as span:
+                data = self._serialize()
+                span.size = len(data)
 
-        if (self.id is not None) and (not self._save_post):
+        if (resource is self) and (not self._save_post):
             response = self._put(self.get_xpath(True), data)
             if return_content:
                 return response.content.decode(encoding="UTF-8")
             else:
                 return response.status_code == HTTP_OK
 
-        resource = (self if self._save_post else self._parent)
         path = resource.get_xpath(True)
 
-        response = self._post(path, data, params)
+        response = resource._post(path, data, params)
 
         location = None
         if HEADER_LOCATION in response.headers:
@@ -361,7 +1053,30 @@ class BaseResource(BaseData):
         else:
            return True
 
-    def _send_file(self, xpath, filename, headers, id=None):
+    def _send(self, xpath, request, *args, **kwargs):
+
+        """
+        Calls the client's "request" method, attributing the request to the
+        resource for the instrumentation. "xpath" - the template of the path
+        appended to the resource's one, if any.
+        """
+
+        instrumentation = getattr(self._client, "instrumentation", None)
+        if instrumentation is None:
+            return request(*args, **kwargs)
+        with scope(type(self).__name__, self._xpath_template() + (xpath or "")):
+            return request(*args, **kwargs)
+
+    def _send_file(self, xpath, filename, headers, id=None, mmap=False,
+            data=None):
+
+        """
+        Uploads "filename": a path, a file-like object or an iterable of byte
+        chunks, or "data", the bytes of the file, instead. Files are sent in
+        blocks as they're read, iterables - with chunked transfer encoding.
+        With "mmap" a file at the path is memory-mapped instead of read,
+        except with an AsyncClient.
+        """
 
         path = ""
         request = self._client.post
@@ -370,9 +1085,26 @@ class BaseResource(BaseData):
                 path = xpath.format(id)
             request = self._client.put
 
-        with open(filename, 'rb') as file_data:
-            response = request(section=self.get_xpath() + path,
-                        data=file_data, headers=headers)
+        if (data is not None) or \
+                (not isinstance(filename, (str, bytes, PathLike))):
+            response = self._send(xpath, request,
+                section=self.get_xpath() + path,
+                data=(filename if data is None else data), headers=headers)
+        else:
+            with open(fspath(filename), 'rb') as file_data:
+                data = file_data
+                # Empty files can't be mapped, aiohttp doesn't send maps
+                if mmap and fstat(file_data.fileno()).st_size and \
+                        (not getattr(type(self._client), "_async", False)):
+                    data = map_file(file_data.fileno(), 0,
+                        access=ACCESS_READ)
+                try:
+                    response = self._send(xpath, request,
+                        section=self.get_xpath() + path, data=data,
+                        headers=headers)
+                finally:
+                    if data is not file_data:
+                        data.close()
 
         location = None
         if HEADER_LOCATION in response.headers:
@@ -384,10 +1116,85 @@ class BaseResource(BaseData):
             return response.status_code == HTTP_OK
 
     def _serialize(self):
-        root = ElementTree(self._to_xml())
-        data_io = BytesIO()
-        root.write(data_io, encoding="UTF-8", xml_declaration=True)
-        return data_io.getvalue()
+        if not self._compiled_xml:
+            return get_backend().tostring(self._to_xml())
+        name = (self._node_name_save or self._node_name or
+            self.__class__.__name__)
+        out = [XML_DECLARATION, "<", name, ">"]
+        _write_xml(self, out)
+        if len(out) == 4:
+            out[3] = " />"
+        else:
+            out.extend(("</", name, ">"))
+        return "".join(out).encode("UTF-8", "xmlcharrefreplace")
+
+    def _stream_children(self, element, instance, search_name):
+        if instance is not None:
+            return (STREAM_CHILDREN, instance, False)
+        if element.tag == search_name:
+            return (STREAM_CHILDREN, self, True)
+        return (STREAM_FIND, None, None)
+
+    def _stream_descend(self, frame, search_name):
+
+        """The element turned out to have children"""
+
+        inst = frame[3]
+        if isinstance(inst, BaseResourceList):
+            inst = self._new_list_item(inst)
+        return self._stream_children(frame[0], inst, search_name)
+
+    def _stream_frame(self, element, children, search_name):
+
+        if children is None:
+            return [element, None, None, None, None, False]
+
+        if children[0] == STREAM_FIND:
+            if element.tag != search_name:
+                return [element, None, None, None, None, False]
+            children = (STREAM_CHILDREN, self, True)
+
+        inst = children[1]
+        tag, has_property = binding(inst.__class__).property(element.tag,
+            inst)
+
+        property = None
+        if not has_property:
+            # Not the base class
+            if not children[2]:
+                return [element, None, None, None, None, False]
+        else:
+            property = getattr(inst, tag)
+
+        return [element, inst, tag, property, None, False]
+
+    def _sync_iter_all(self, params, prefetch):
+
+        params = dict(params or {})
+        executor = (ThreadPoolExecutor(1) if prefetch else None)
+
+        try:
+            page = self._list_page(params)
+            while page is not None:
+                items, next_page = page
+                pending = None
+                if next_page is not None:
+                    params[XML_PARAM_PAGE] = next_page
+                    pending = dict(params)
+                    if prefetch:
+                        pending = executor.submit(propagate(self._list_page),
+                            pending)
+                for item in items:
+                    yield item
+                if pending is None:
+                    page = None
+                elif prefetch:
+                    page = pending.result()
+                else:
+                    page = self._list_page(pending)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
 
     def _to_xml(self, element=None, instance=None):
 
@@ -409,66 +1216,73 @@ class BaseResource(BaseData):
             if inst._node_name_save is not None:
                 node_name = inst._node_name_save
 
-        elem = (Element(node_name) if element is None else element)
-
-        map = None
+        backend = get_backend()
+        elem = (backend.Element(node_name) if element is None else element)
 
         # "Map" is a base class that sets the correspondence between XML
         # elements and class properties, i.e. what's not in this class doesn't
         # get written to the file.
 
-        for classtype in getmro(inst.__class__):
-            if (classtype.__name__.endswith(BASE_MAP_SUFFIX) and
-                    classtype.__name__ != BaseMap.__name__):
-                map = classtype
-                break
+        fields = binding(inst.__class__).fields
 
-        if map is None:
+        if fields is None:
             return elem
 
-        for prop in dir(map):
+        for prop, tag in fields:
 
             property = getattr(inst, prop)
 
-            if (prop.startswith("_") or
-                callable(property) or
-                property is None):
+            if callable(property) or property is None:
                 continue
 
             # Lists
 
             if isinstance(property, BaseResourceList):
                 for item in property.items:
-                    el = SubElement(elem, self._converter.to_camelcase(prop))
+                    el = backend.SubElement(elem, tag)
                     self._to_xml(el, item)
                 continue
 
             if isinstance(property, BaseResourceSimpleList):
                 for item in property.items:
-                    el = SubElement(elem, self._converter.to_camelcase(prop))
+                    el = backend.SubElement(elem, tag)
                     el.text = str(item)
                 continue
 
             # Everything else
 
-            el = SubElement(elem, self._converter.to_camelcase(prop))
+            el = backend.SubElement(elem, tag)
 
             if isinstance(property, BaseMap):
                 self._to_xml(el, property)
-                if (len(el.getchildren()) == 0) and (el.text is None):
+                if (len(el) == 0) and (el.text is None):
                     elem.remove(el)
             else:
                 el.text = str(property)
 
         return elem
 
+    def _xpath_template(self, save_path=False):
+
+        """The xpath with placeholders for the ids: /accounts/{}/tns/{}"""
+
+        parent_path = ""
+        if self._parent is not None:
+            parent_path = self._parent._xpath_template(save_path)
+        if save_path and (self._xpath_save is not None):
+            return parent_path + self._xpath_save
+        return parent_path + self._xpath
+
+    @awaitable
     def delete(self):
-        response = self._client.delete(self.get_xpath())
+        response = self._send(None, self._client.delete, self.get_xpath())
         return response.status_code == HTTP_OK
 
+    @awaitable
     def get(self, id=None, params=None):
         return self._get_data(id, params)
 
+    @awaitable
     def get_status(self, id=None, params=None):
         return self._get_status(self.get_xpath(id), params)
 
@@ -482,5 +1296,6 @@ class BaseResource(BaseData):
         xpath = parent_path + own_path
         return xpath.format(self.id)
 
+    @awaitable
     def save(self):
         self._save()
@@ -13,6 +13,7 @@ class CoveredRateCenters(BaseResource, CoveredRateCentersData):
 
     """Covered rate centers"""
 
+    _count_property = "total_count"
     _xpath = XPATH_COVERED_RATE_CENTERS
 
     def __init__(self, parent=None, client=None):
@@ -22,5 +23,8 @@ class CoveredRateCenters(BaseResource, CoveredRateCentersData):
     def get(self, id):
         return RateCenter(self).get(id)
 
+    def iter_all(self, params=None, prefetch=False, max_workers=None):
+        return self._iter_all(params, prefetch, max_workers)
+
     def list(self, params):
         return self._get_data(params=params).covered_rate_center
\ No newline at end of file
@@ -7,14 +7,18 @@ from iris_sdk.include.xml_consts import XML_PARAM_TN_DETAIL, XML_TRUE
 from iris_sdk.models.base_resource import BaseResource
 from iris_sdk.models.data.disc_numbers import DiscNumbersData
 from iris_sdk.models.totals import Totals
+from iris_sdk.utils.columns import IN_SERVICE_COLUMNS, TnTable
 
 XML_NAME_DISC_NUMBERS = "TNs"
+XML_NAME_TELEPHONE_NUMBER = "TelephoneNumber"
+XML_NAME_TELEPHONE_NUMBERS = "TelephoneNumbers"
 XPATH_DISC_NUMBERS = "/discnumbers"
 
 class DiscNumbers(BaseResource, DiscNumbersData):
 
     """Disconnected numbers for account"""
 
+    _count_property = "total_count"
     _node_name = XML_NAME_DISC_NUMBERS
     _xpath = XPATH_DISC_NUMBERS
 
@@ -27,6 +31,21 @@ class DiscNumbers(BaseResource, DiscNumbersData):
         DiscNumbersData.__init__(self)
         self._totals = Totals(self)
 
+    def export(self, params=None, sink=None):
+
+        """
+        Exports the numbers of every page into "sink", a TnTable of the
+        IN_SERVICE_COLUMNS by default, or a CsvWriter (see utils.columns).
+        Returns the sink.
+        """
+
+        return self._export(
+            (TnTable(IN_SERVICE_COLUMNS) if sink is None else sink), params,
+            XML_NAME_TELEPHONE_NUMBERS, XML_NAME_TELEPHONE_NUMBER)
+
+    def iter_all(self, params=None, prefetch=False, max_workers=None):
+        return self._iter_all(params, prefetch, max_workers)
+
     def list(self, params):
         return self._get_data(params=params).telephone_numbers.\
             telephone_number
\ No newline at end of file
@@ -37,8 +37,9 @@ class Disconnect(BaseResource, DisconnectData):
     def get(self, params=None):
         _id = self.id
         order_response = DisconnectOrderResponse(self._parent)
-        self.clear()
-        order_response.order_request = self
+        order_request = self._detached()
+        order_request.clear()
+        order_response.order_request = order_request
         return order_response.get(_id, params=params)
 
     def save(self):
@@ -46,6 +47,6 @@ class Disconnect(BaseResource, DisconnectData):
         order_response = DisconnectOrderResponse(self._parent)
         self.clear()
         order_response.order_request = self
-        order_response._from_xml(self._element_from_string(str))
+        order_response._load(str)
         self.order_status = order_response.order_status
         return True
\ No newline at end of file
@@ -34,5 +34,10 @@ class DisconnectOrderResponse(BaseResource, OrderResponseData):
         super().__init__(parent, client)
         OrderResponseData.__init__(self)
 
+    def _fresh(self):
+        inst = super()._fresh()
+        inst.order_request = self.order_request._fresh()
+        return inst
+
     def get(self, id=None, params=None):
         return self._get_data((id or self.id), params=params)
\ No newline at end of file
@@ -30,5 +30,8 @@ class Disconnects(BaseResource, DisconnectsData):
     def get(self, id, params=None):
         return Disconnect(self).get(id, params=params)
 
+    def iter_all(self, params=None, prefetch=False):
+        return self._iter_all(params, prefetch)
+
     def list(self, params):
         return self._get_data(params=params).order_id_user_id_date
\ No newline at end of file
@@ -15,6 +15,7 @@ class Dlda(BaseResource, DldaData):
 
     """ DLDA order """
 
+    _compiled_xml = True
     _node_name = XML_NAME_DLDA
     _xpath = XPATH_DLDA
 
@@ -40,5 +41,5 @@ class Dlda(BaseResource, DldaData):
     def save(self):
         str = self._save(True)
         self.clear()
-        self._from_xml(self._element_from_string(str))
+        self._load(str)
         return True
\ No newline at end of file
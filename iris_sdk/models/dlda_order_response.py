@@ -32,5 +32,10 @@ class DldaOrderResponse(BaseResource, DldaOrderResponseData):
         super().__init__(parent, client)
         DldaOrderResponseData.__init__(self)
 
+    def _fresh(self):
+        inst = super()._fresh()
+        inst.dlda_order = self.dlda_order._fresh()
+        return inst
+
     def get(self, id=None, params=None):
         return self._get_data((id or self.id), params=params)
\ No newline at end of file
@@ -6,14 +6,18 @@ from future.builtins import super
 from iris_sdk.models.totals import Totals
 from iris_sdk.models.base_resource import BaseResource
 from iris_sdk.models.data.in_service_numbers import InServiceNumbersData
+from iris_sdk.utils.columns import IN_SERVICE_COLUMNS, TnTable
 
 XML_NAME_IN_SERVICE_NUMBERS = "TNs"
+XML_NAME_TELEPHONE_NUMBER = "TelephoneNumber"
+XML_NAME_TELEPHONE_NUMBERS = "TelephoneNumbers"
 XPATH_IN_SERVICE_NUMBERS = "/inserviceNumbers"
 
 class InServiceNumbers(BaseResource, InServiceNumbersData):
 
     """In-service numbers for account"""
 
+    _count_property = "total_count"
     _node_name = XML_NAME_IN_SERVICE_NUMBERS
     _xpath = XPATH_IN_SERVICE_NUMBERS
 
@@ -26,6 +30,21 @@ class InServiceNumbers(BaseResource, InServiceNumbersData):
         InServiceNumbersData.__init__(self)
         self._totals = Totals(self, client)
 
+    def export(self, params=None, sink=None):
+
+        """
+        Exports the numbers of every page into "sink", a TnTable of the
+        IN_SERVICE_COLUMNS by default, or a CsvWriter (see utils.columns).
+        Returns the sink.
+        """
+
+        return self._export(
+            (TnTable(IN_SERVICE_COLUMNS) if sink is None else sink), params,
+            XML_NAME_TELEPHONE_NUMBERS, XML_NAME_TELEPHONE_NUMBER)
+
+    def iter_all(self, params=None, prefetch=False, max_workers=None):
+        return self._iter_all(params, prefetch, max_workers)
+
     def list(self, params=None):
-        self._get_data(params=params)
-        return self.telephone_numbers.telephone_number
\ No newline at end of file
+        return self._get_data(params=params).telephone_numbers.\
+            telephone_number
\ No newline at end of file
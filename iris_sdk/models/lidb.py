@@ -13,6 +13,7 @@ class Lidb(BaseResource, LidbData):
 
     """ CNAM Update (LIDB) order """
 
+    _compiled_xml = True
     _node_name = XML_NAME_LIDB
     _xpath = XPATH_LIDB
 
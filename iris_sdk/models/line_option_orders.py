@@ -16,6 +16,7 @@ class LineOptionOrder(BaseResource, LineOptionOrderData):
     Establish Calling Name Display settings for a collection of TNs at a time
     """
 
+    _compiled_xml = True
     _node_name = XML_NAME_LINE_OPTION_ORDERS
     _save_post = True
     _xpath = XPATH_LINE_OPTION_ORDERS
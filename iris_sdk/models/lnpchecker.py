@@ -5,8 +5,12 @@ from future.builtins import super
 
 from iris_sdk.models.base_resource import BaseResource
 from iris_sdk.models.data.lnpchecker import LnpCheckerData
-from iris_sdk.models.lnpchecker_response import LnpCheckerResponse
+from iris_sdk.models.lnpchecker_response import LnpCheckerBulkResponse, \
+    LnpCheckerResponse
+from iris_sdk.utils.concurrency import chunks, DEFAULT_MAX_WORKERS, \
+    map_concurrent
 
+LNP_CHECKER_CHUNK_SIZE = 1000
 XML_NAME_LNP_CHECKER = "NumberPortabilityRequest"
 XPATH_LNP_CHECKER = "/lnpchecker"
 
@@ -25,4 +29,32 @@ class LnpChecker(BaseResource, LnpCheckerData):
 
     def __init__(self, parent=None, client=None):
         super().__init__(parent, client)
-        LnpCheckerData.__init__(self)
\ No newline at end of file
+        LnpCheckerData.__init__(self)
+
+    def bulk(self, numbers, params=None, chunk_size=LNP_CHECKER_CHUNK_SIZE,
+            max_workers=DEFAULT_MAX_WORKERS):
+
+        """
+        Checks "numbers" in requests of "chunk_size" numbers, up to
+        "max_workers" of them at a time over the client's connection pool,
+        and returns an LnpCheckerBulkResponse.
+        A failed chunk doesn't stop the others, see its "errors".
+        Under AsyncClient gather the calls of the chunks instead.
+        """
+
+        if getattr(type(self._client), "_async", False):
+            raise TypeError("Use asyncio.gather with an AsyncClient")
+
+        def check(numbers):
+            return LnpChecker(self._parent, self._client)(numbers, params)
+
+        responses, errors = map_concurrent(check, chunks(numbers, chunk_size),
+            max_workers)
+
+        result = LnpCheckerBulkResponse()
+        for response in responses:
+            if response is not None:
+                result.merge(response)
+        result.errors.extend(errors)
+
+        return result
@@ -6,6 +6,8 @@ from future.builtins import super
 from iris_sdk.models.base_resource import BaseResource
 from iris_sdk.models.data.lnpchecker_response import LnpCheckerResponseData
 
+LNP_RATE_CENTER_LISTS = ("partner_supported_rate_centers",
+    "supported_rate_centers", "unsupported_rate_centers")
 XML_NAME_LNP_CHECKER_RESPONSE = "NumberPortabilityResponse"
 
 class LnpCheckerResponse(BaseResource, LnpCheckerResponseData):
@@ -16,4 +18,66 @@ class LnpCheckerResponse(BaseResource, LnpCheckerResponseData):
 
     def __init__(self, parent=None, client=None):
         super().__init__(parent, client)
-        LnpCheckerResponseData.__init__(self)
\ No newline at end of file
+        LnpCheckerResponseData.__init__(self)
+
+class LnpCheckerBulkResponse(LnpCheckerResponse):
+
+    """
+    Responses of a chunked check (see LnpChecker.bulk) merged into one.
+
+    Rate center groups with the same rate center, city, state and LATA are
+    joined, the numbers of the same losing carrier (SPID) are collected.
+    "errors" - Failure tuples (see utils.concurrency) of the chunks that
+    couldn't be checked: chunk index, its numbers and the exception.
+    "losing_carriers" - a LosingCarrierTnList per losing carrier, the
+    first one is also "supported_losing_carriers.losing_carrier_tn_list".
+    """
+
+    @property
+    def errors(self):
+        return self._errors
+
+    @property
+    def losing_carriers(self):
+        return self._losing_carriers
+
+    def __init__(self, parent=None, client=None):
+        super().__init__(parent, client)
+        self._carriers = {}
+        self._errors = []
+        self._groups = {}
+        self._losing_carriers = []
+
+    def merge(self, response):
+
+        """Adds the results of a chunk's response"""
+
+        self.portable_numbers.items.extend(response.portable_numbers.items)
+
+        for name in LNP_RATE_CENTER_LISTS:
+            groups = getattr(self, name).rate_center_group
+            for group in getattr(response, name).items:
+                key = (name, group.rate_center, group.city, group.state,
+                    group.lata)
+                if key in self._groups:
+                    self._groups[key].tn_list.items.extend(
+                        group.tn_list.items)
+                else:
+                    self._groups[key] = group
+                    groups.items.append(group)
+
+        carrier = response.supported_losing_carriers.losing_carrier_tn_list
+        if (carrier.losing_carrier_spid is None) and \
+                (not carrier.tn_list.items):
+            return self
+        merged = self._carriers.get(carrier.losing_carrier_spid)
+        if merged is not None:
+            merged.tn_list.items.extend(carrier.tn_list.items)
+        else:
+            self._carriers[carrier.losing_carrier_spid] = carrier
+            self._losing_carriers.append(carrier)
+            if len(self._losing_carriers) == 1:
+                self.supported_losing_carriers.losing_carrier_tn_list = \
+                    carrier
+
+        return self
@@ -4,9 +4,10 @@ from __future__ import division, absolute_import, print_function
 from future.builtins import super
 
 from iris_sdk.include.xml_consts import XML_PARAM_METADATA, XML_TRUE
-from iris_sdk.models.base_resource import BaseResource
+from iris_sdk.models.base_resource import BaseResource, STREAM_CHUNK_SIZE
 from iris_sdk.models.data.loas import LoasData
 from iris_sdk.models.file_meta_data import FileMetaData
+from iris_sdk.utils.concurrency import DEFAULT_MAX_WORKERS, map_concurrent
 
 XML_NAME_LOAS = "FileListResponse"
 XPATH_LOAS_FILENAME = "/{}"
@@ -14,7 +15,15 @@ XPATH_LOAS = "/loas"
 
 class Loas(BaseResource, LoasData):
 
-    """Local number portability order LOAs"""
+    """
+    Local number portability order LOAs.
+
+    Files are uploaded and downloaded in chunks, except that an AsyncClient
+    reads downloads whole and doesn't take iterables of chunks. "filename"
+    can be a path, a file-like object or an iterable of byte chunks,
+    "data" - the bytes of a file already in memory, see
+    BaseResource._send_file.
+    """
 
     _node_name = XML_NAME_LOAS
     _xpath = XPATH_LOAS
@@ -28,21 +37,50 @@ class Loas(BaseResource, LoasData):
         LoasData.__init__(self)
         self._metadata = FileMetaData(self, client)
 
-    def create(self, filename, headers):
-        return self._send_file("", filename, headers)
+    def create(self, filename, headers, mmap=False, data=None):
+        return self._send_file("", filename, headers, mmap=mmap, data=data)
+
+    def create_all(self, filenames, headers, mmap=False,
+            max_workers=DEFAULT_MAX_WORKERS):
+
+        """
+        Uploads the files, "max_workers" at a time. Returns the new file
+        names in the order of "filenames" and the list of Failure tuples
+        (see utils.concurrency) of the uploads that failed.
+        """
+
+        if getattr(type(self._client), "_async", False):
+            raise TypeError("Use asyncio.gather with an AsyncClient")
+
+        def create(filename):
+            return Loas(self._parent, self._client).create(filename, headers,
+                mmap)
+
+        return map_concurrent(create, filenames, max_workers)
 
     def delete(self, id):
         return self._delete_file(XPATH_LOAS_FILENAME, id)
 
-    def get(self, id):
-        return self._get_file(XPATH_LOAS_FILENAME, id)
+    def download(self, id, destination, chunk_size=STREAM_CHUNK_SIZE):
+
+        """
+        Writes the file to "destination", a path or an object with "write".
+        Returns the file size.
+        """
+
+        return self._download_file(XPATH_LOAS_FILENAME, id, destination,
+            chunk_size)
+
+    def get(self, id, stream=False):
+        return self._get_file(XPATH_LOAS_FILENAME, id, stream)
 
     def list(self, params=None):
-        self._get_data(params=params)
+        loas = self._get_data(params=params)
         if params.get(XML_PARAM_METADATA.lower(), "") == XML_TRUE:
-            return self.file_data
+            return loas.file_data
         else:
-            return self.file_names
+            return loas.file_names
 
-    def update(self, id, filename, headers):
-        return self._send_file(XPATH_LOAS_FILENAME, filename, headers, id)
\ No newline at end of file
+    def update(self, id, filename, headers, mmap=False, data=None):
+        return self._send_file(XPATH_LOAS_FILENAME, filename, headers, id,
+            mmap, data)
\ No newline at end of file
@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+
+from importlib import import_module
+from pkgutil import walk_packages
+
+from iris_sdk.models.maps.base_map import BaseMap
+
+def property_names():
+
+    """Public property names of every map in this package"""
+
+    names = set()
+
+    for loader, name, is_package in walk_packages(__path__, __name__ + "."):
+        module = import_module(name)
+        for value in vars(module).values():
+            if isinstance(value, type) and issubclass(value, BaseMap):
+                names.update(prop for prop in vars(value)
+                    if not prop.startswith("_"))
+
+    return sorted(names)
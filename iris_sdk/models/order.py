@@ -48,6 +48,6 @@ class Order(BaseResource, OrderData):
         order_response = OrderResponse(self._parent)
         self.clear()
         order_response.order = self
-        order_response._from_xml(self._element_from_string(str))
+        order_response._load(str)
         self.order_status = order_response.order_status
         return True
\ No newline at end of file
@@ -32,5 +32,62 @@ class OrderResponse(BaseResource, OrderResponseData):
         super().__init__(parent, client)
         OrderResponseData.__init__(self)
 
+    def _fresh(self):
+        inst = super()._fresh()
+        inst.order = self.order._fresh()
+        return inst
+
     def get(self, id=None, params=None):
-        return self._get_data((id or self.id), params=params)
\ No newline at end of file
+        return self._get_data((id or self.id), params=params)
+
+class OrderBulkResponse(OrderResponse):
+
+    """
+    Responses of the orders of a chunked order (see Orders.bulk) merged
+    into one.
+
+    "orders" - the Order of every chunk, None for the chunks that couldn't
+    be submitted.
+    "errors" - Failure tuples (see utils.concurrency) of the chunks that
+    couldn't be submitted or followed to completion: chunk index, its
+    numbers and the exception. Their numbers are in "failed_numbers".
+    """
+
+    @property
+    def errors(self):
+        return self._errors
+
+    @property
+    def orders(self):
+        return self._orders
+
+    def __init__(self, parent=None, client=None):
+        super().__init__(parent, client)
+        self._errors = []
+        self._orders = []
+
+    def fail(self, failure):
+
+        """Adds a chunk that failed"""
+
+        self._errors.append(failure)
+        self.failed_numbers.items.extend(failure.item)
+        self.failed_quantity = str(int(self.failed_quantity or 0) +
+            len(failure.item))
+        return self
+
+    def merge(self, response):
+
+        """Adds the results of a chunk's order response"""
+
+        self.completed_numbers.items.extend(response.completed_numbers.items)
+        self.failed_numbers.items.extend(response.failed_numbers.items)
+        self.error_list.error.items.extend(response.error_list.error.items)
+
+        for prop in ("completed_quantity", "failed_quantity",
+                "pending_quantity"):
+            if getattr(response, prop) is not None:
+                setattr(self, prop, str(int(getattr(self, prop) or 0) +
+                    int(getattr(response, prop))))
+
+        return self
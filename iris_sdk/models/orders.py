@@ -6,7 +6,15 @@ from future.builtins import super
 from iris_sdk.models.base_resource import BaseResource
 from iris_sdk.models.data.orders import OrdersData
 from iris_sdk.models.order import Order
+from iris_sdk.models.order_response import OrderBulkResponse
+from iris_sdk.utils.concurrency import chunks, DEFAULT_MAX_WORKERS, \
+    Failure, map_concurrent
+from iris_sdk.watcher import OrderWatcher
 
+ORDER_CHUNK_SIZE = 5000
+ORDER_COMPLETE = "COMPLETE"
+ORDER_FAILED = "FAILED"
+ORDER_PARTIAL = "PARTIAL"
 XML_NAME_ORDERS = "ListOrderIdUserIdDate"
 XPATH_ORDERS = "/orders"
 
@@ -21,6 +29,80 @@ class Orders(BaseResource, OrdersData):
         super().__init__(parent, client)
         OrdersData.__init__(self, self)
 
+    def bulk(self, data, numbers, reservations=None,
+            chunk_size=ORDER_CHUNK_SIZE, max_workers=DEFAULT_MAX_WORKERS,
+            wait=True, watcher=None, timeout=None):
+
+        """
+        Orders the existing "numbers" in orders of "chunk_size" numbers at
+        most, each created from "data" as with "create", e.g. the name and
+        site. "reservations" maps numbers to their reservation ids.
+        Up to "max_workers" orders are submitted at a time.
+
+        With "wait" the orders are followed until complete by "watcher", a
+        new OrderWatcher if None, for up to "timeout" seconds each.
+        Returns an OrderBulkResponse: the completed and failed numbers and
+        the errors of all the orders, "order_status" is COMPLETE, PARTIAL or
+        FAILED. Without "wait" only the submitted "orders" and the "errors"
+        are set.
+        """
+
+        if getattr(type(self._client), "_async", False):
+            raise TypeError("Use asyncio.gather with an AsyncClient")
+
+        reservations = (reservations or {})
+        parts = chunks(numbers, chunk_size)
+
+        def submit(numbers):
+            order = Order(self).set_from_dict(data)
+            for number in numbers:
+                order.add_tn(number)
+                if number in reservations:
+                    order.add_reservation(reservations[number])
+            order.save()
+            return order
+
+        orders, failures = map_concurrent(submit, parts, max_workers)
+
+        result = OrderBulkResponse(self)
+        result.orders.extend(orders)
+        for failure in failures:
+            result.fail(failure)
+
+        if not wait:
+            return result
+
+        own_watcher = (watcher is None)
+        if own_watcher:
+            watcher = OrderWatcher(max_workers)
+
+        statuses = []
+        try:
+            futures = [(index, watcher.watch(order, timeout=timeout))
+                for index, order in enumerate(orders) if order is not None]
+            for index, future in futures:
+                try:
+                    response = future.result()
+                except Exception as error:
+                    result.fail(Failure(index, parts[index], error))
+                    continue
+                result.merge(response)
+                statuses.append(response.order_status)
+        finally:
+            if own_watcher:
+                watcher.close()
+
+        if (not result.errors) and \
+                all(status == ORDER_COMPLETE for status in statuses):
+            result.order_status = ORDER_COMPLETE
+        elif any(status in (ORDER_COMPLETE, ORDER_PARTIAL)
+                for status in statuses):
+            result.order_status = ORDER_PARTIAL
+        else:
+            result.order_status = ORDER_FAILED
+
+        return result
+
     def create(self, data=None, save=True):
         order = Order(self).set_from_dict(data)
         if save and (data is not None):
@@ -30,5 +112,8 @@ class Orders(BaseResource, OrdersData):
     def get(self, id, params=None):
         return self.create(save=False).get(id, params=params)
 
+    def iter_all(self, params=None, prefetch=False):
+        return self._iter_all(params, prefetch)
+
     def list(self, params):
         return self._get_data(params=params).order_id_user_id_date
\ No newline at end of file
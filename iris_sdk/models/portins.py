@@ -30,5 +30,8 @@ class PortIns(BaseResource, PortInsData):
     def get(self, id, params):
         return PortIn(self).get(id, params=params)
 
+    def iter_all(self, params=None, prefetch=False):
+        return self._iter_all(params, prefetch)
+
     def list(self, params):
         return self._get_data(params=params).lnp_port_info_for_given_status
\ No newline at end of file
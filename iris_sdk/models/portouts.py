@@ -20,5 +20,8 @@ class PortOuts(BaseResource, PortOutsData):
         super().__init__(parent, client)
         PortOutsData.__init__(self, self)
 
+    def iter_all(self, params=None, prefetch=False):
+        return self._iter_all(params, prefetch)
+
     def list(self, params):
         return self._get_data(params=params).lnp_port_info_for_given_status
\ No newline at end of file
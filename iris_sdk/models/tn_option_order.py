@@ -11,6 +11,7 @@ XPATH_TN_OPTION_ORDER = "/{}"
 
 class TnOptionOrder(BaseResource, TnOptionOrderData):
 
+    _compiled_xml = True
     _node_name = XML_NAME_TN_OPTION_ORDER
     _xpath = XPATH_TN_OPTION_ORDER
 
@@ -31,5 +32,5 @@ class TnOptionOrder(BaseResource, TnOptionOrderData):
     def save(self):
         str = self._save(True)
         self.clear()
-        self._from_xml(self._element_from_string(str))
+        self._load(str)
         return True
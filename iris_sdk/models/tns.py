@@ -3,11 +3,20 @@
 from __future__ import division, absolute_import, print_function
 from future.builtins import super
 
-from iris_sdk.models.base_resource import BaseResource, BaseResourceList
+from iris_sdk.models.base_resource import BaseResource, BaseResourceList, \
+    SubResource
 from iris_sdk.models.data.tns import TnsData
 from iris_sdk.models.data.telephone_numbers import TelephoneNumbers
 from iris_sdk.models.telephone_number import TelephoneNumber
+from iris_sdk.utils.columns import TnTable
+from iris_sdk.utils.concurrency import DEFAULT_MAX_WORKERS, Failure, \
+    map_concurrent
 
+TN_RESOURCES = ("history", "lca", "sip_peer", "site", "tn_lata",
+    "tn_rate_center", "tndetails")
+
+XML_NAME_TELEPHONE_NUMBER = "TelephoneNumber"
+XML_NAME_TELEPHONE_NUMBERS = "TelephoneNumbers"
 XML_NAME_TNS = "TelephoneNumbersResponse"
 XPATH_TNS = "/tns"
 
@@ -15,6 +24,7 @@ class Tns(BaseResource, TnsData):
 
     """Telephone numbers directory"""
 
+    _count_property = "telephone_number_count"
     _node_name = XML_NAME_TNS
     _xpath = XPATH_TNS
 
@@ -27,9 +37,77 @@ class Tns(BaseResource, TnsData):
         TnsData.__init__(self)
         self._telephone_numbers = TelephoneNumbers(self)
 
+    def enrich(self, numbers, resources=TN_RESOURCES, get=True,
+            max_workers=DEFAULT_MAX_WORKERS):
+
+        """
+        Fetches the data of many numbers at once.
+
+        Returns a TelephoneNumber per number, in the order of "numbers",
+        with its "resources" (TN_RESOURCES by default) fetched, and the list
+        of Failure tuples (see utils.concurrency) of the requests that
+        failed: the number's index, (number, resource name) and the
+        exception. The resource name is None for the number's own data,
+        fetched first with "get", numbers failing it are skipped.
+        Up to "max_workers" requests are sent at a time, a client with
+        "pool_block" set makes them wait for pooled connections.
+        """
+
+        if getattr(type(self._client), "_async", False):
+            raise TypeError("Use asyncio.gather with an AsyncClient")
+
+        tns = []
+        for number in numbers:
+            tn = TelephoneNumber(self)
+            tn.id = number
+            tns.append(tn)
+
+        failures = []
+        if get:
+            results, failures = map_concurrent(lambda tn: tn.get(), tns,
+                max_workers)
+            failures = [Failure(failure.index, (failure.item.id, None),
+                failure.error) for failure in failures]
+            # A stateless client loads the data into new instances
+            for index, result in enumerate(results):
+                if result is not None:
+                    tns[index] = result
+
+        failed = set(failure.index for failure in failures)
+        requests = [(index, name) for index in range(len(tns))
+            if index not in failed for name in resources]
+
+        def fetch(request):
+            return getattr(tns[request[0]], request[1]).get()
+
+        results, errors = map_concurrent(fetch, requests, max_workers)
+        for (index, name), result in zip(requests, results):
+            if result is not None:
+                SubResource.attach(tns[index], name, result)
+        failures.extend(Failure(error.item[0],
+            (tns[error.item[0]].id, error.item[1]), error.error)
+            for error in errors)
+        failures.sort(key=lambda failure: failure.index)
+
+        return tns, failures
+
+    def export(self, params=None, sink=None):
+
+        """
+        Exports the numbers of every page into "sink", a TnTable of the
+        TN_COLUMNS by default, or a CsvWriter (see utils.columns), without
+        creating TelephoneNumber objects. Returns the sink.
+        """
+
+        return self._export((TnTable() if sink is None else sink), params,
+            XML_NAME_TELEPHONE_NUMBERS, XML_NAME_TELEPHONE_NUMBER)
+
     def get(self, id):
         return TelephoneNumber(self).get(id)
 
+    def iter_all(self, params=None, prefetch=False, max_workers=None):
+        return self._iter_all(params, prefetch, max_workers)
+
     def list(self, params):
-        self._get_data(params=params)
-        return self.telephone_numbers.telephone_number
\ No newline at end of file
+        return self._get_data(params=params).telephone_numbers.\
+            telephone_number
\ No newline at end of file
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+import asyncio
+
+from base64 import b64encode
+
+from requests.exceptions import ConnectionError, Timeout
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from iris_sdk.utils.rest import DEFAULT_POOL_MAXSIZE, HEADERS, METHODS, \
+    raise_for_error
+
+AUTHORIZATION = "Authorization"
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+class AsyncRestClient(object):
+
+    """
+    Asyncio HTTP requests wrapper, requires aiohttp.
+
+    Connections are pooled in an "aiohttp.ClientSession" created on the first
+    request. "pool_maxsize" limits the connections per host and
+    "max_concurrency" - the number of requests in flight, the rest wait
+    for their turn.
+    Responses are returned as "requests.Response" objects and errors are
+    raised exactly like RestClient does, timeouts and connection errors as
+    the "requests" exceptions.
+    """
+
+    @property
+    def session(self):
+        return self._session
+
+    def __init__(self, session=None, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+            max_concurrency=None):
+
+        if aiohttp is None:
+            raise ImportError("AsyncRestClient requires aiohttp")
+
+        self._max_concurrency = max_concurrency
+        self._owns_session = (session is None)
+        self._pool_maxsize = pool_maxsize
+        self._semaphore = None
+        self._session = session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _send(self, method, url, auth, params, data, headers,
+            timeout=None):
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self._pool_maxsize))
+
+        if auth is not None:
+            headers = dict(headers)
+            headers[AUTHORIZATION] = "Basic " + b64encode(
+                "{}:{}".format(*auth).encode("latin1")).decode("ascii")
+
+        # Same as requests: skip empty parameters
+        if params is not None:
+            params = dict((key, str(value)) for key, value in
+                params.items() if value is not None)
+
+        # Same as requests: a number or a (connect, read) tuple
+        options = {}
+        if timeout is not None:
+            connect, read = (timeout if isinstance(timeout, tuple) else
+                (timeout, timeout))
+            options["timeout"] = aiohttp.ClientTimeout(sock_connect=connect,
+                sock_read=read)
+
+        async with self._session.request(method, url, params=params,
+                data=data, headers=headers, **options) as http_response:
+            response = Response()
+            response._content = await http_response.read()
+            response._content_consumed = True
+            response.headers = CaseInsensitiveDict(http_response.headers)
+            response.reason = http_response.reason
+            response.status_code = http_response.status
+            response.url = str(http_response.url)
+            return response
+
+    async def close(self):
+
+        """Releases the pooled connections of an owned session"""
+
+        if self._owns_session and (self._session is not None):
+            await self._session.close()
+            self._session = None
+
+    async def request(self, method, url, auth, params=None, data=None,
+            headers=None, timeout=None):
+        return raise_for_error(await self.send(method, url, auth, params,
+            data, headers, timeout))
+
+    async def send(self, method, url, auth, params=None, data=None,
+            headers=None, timeout=None):
+
+        """"request" returning the response whatever its status"""
+
+        assert method in METHODS
+
+        headers = (HEADERS if headers is None else headers)
+
+        try:
+            if self._max_concurrency is None:
+                return await self._send(method, url, auth, params, data,
+                    headers, timeout)
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            async with self._semaphore:
+                return await self._send(method, url, auth, params, data,
+                    headers, timeout)
+        except asyncio.TimeoutError as error:
+            raise Timeout(error) from error
+        except aiohttp.ClientConnectionError as error:
+            raise ConnectionError(error) from error
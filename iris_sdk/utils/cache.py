@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+
+import json
+import sqlite3
+
+from collections import namedtuple, OrderedDict
+from fnmatch import fnmatchcase
+from threading import local, Lock
+from time import time
+from urllib.parse import urlencode
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from iris_sdk.utils.rest import HEADERS, HTTP_OK
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_DISK_CACHE_SIZE = 65536
+# Reference data: path pattern -> seconds to keep the responses for
+DEFAULT_TTLS = OrderedDict([
+    ("/accounts/*/availableNpaNxx", 300),
+    ("/cities", 86400),
+    ("/coveredratecenters", 86400),
+    ("/coveredratecenters/*", 86400),
+    ("/ratecenters", 86400),
+    ("*/tns/*/lata", 86400),
+    ("*/tns/*/lca", 86400)
+])
+HEADER_ETAG = "ETag"
+HEADER_IF_MODIFIED_SINCE = "If-Modified-Since"
+HEADER_IF_NONE_MATCH = "If-None-Match"
+HEADER_LAST_MODIFIED = "Last-Modified"
+HTTP_NOT_MODIFIED = 304
+
+CacheEntry = namedtuple("CacheEntry",
+    ["url", "content", "headers", "expires"])
+ResponseCacheInfo = namedtuple("ResponseCacheInfo",
+    ["hits", "misses", "revalidated", "currsize"])
+
+class MemoryCache(object):
+
+    """In-process ResponseCache backend, keeps "maxsize" recent entries"""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = maxsize
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is not None:
+                self._data[key] = entry
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = entry
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+class DiskCache(object):
+
+    """
+    ResponseCache backend storing the entries in the SQLite database file
+    "path", so they're shared by the processes using the same file.
+    Keeps "maxsize" recently used entries.
+    """
+
+    def __init__(self, path, maxsize=DEFAULT_DISK_CACHE_SIZE):
+        self._local = local()
+        self._maxsize = maxsize
+        self._path = path
+        with self._connection() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, url TEXT, content BLOB, headers TEXT,"
+                " expires REAL, accessed REAL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed"
+                " ON responses (accessed)")
+
+    def __len__(self):
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _connection(self):
+
+        # SQLite connections can't be shared by threads
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, timeout=30)
+            self._local.connection = connection
+        return connection
+
+    def clear(self):
+        with self._connection() as connection:
+            connection.execute("DELETE FROM responses")
+
+    def get(self, key):
+        with self._connection() as connection:
+            row = connection.execute("SELECT url, content, headers, expires "
+                "FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE responses SET accessed = ? "
+                "WHERE key = ?", (time(), key))
+        return CacheEntry(row[0], bytes(row[1]), json.loads(row[2]), row[3])
+
+    def set(self, key, entry):
+        with self._connection() as connection:
+            connection.execute("INSERT OR REPLACE INTO responses "
+                "VALUES (?, ?, ?, ?, ?, ?)", (key, entry.url,
+                sqlite3.Binary(entry.content), json.dumps(entry.headers),
+                entry.expires, time()))
+            connection.execute("DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed DESC "
+                "LIMIT -1 OFFSET ?)", (self._maxsize,))
+
+class ResponseCache(object):
+
+    """
+    Client GET response cache for rarely changing reference data.
+
+    Only the paths matching the patterns of "ttls" (path pattern -> seconds,
+    DEFAULT_TTLS by default) are cached, keyed by the method, URI and
+    parameters. Once expired, entries with an ETag or Last-Modified header
+    are revalidated with a conditional request and reused if the server
+    answers "304 Not Modified".
+    "backend" stores the entries, a MemoryCache by default, or a DiskCache
+    to share them between processes.
+    """
+
+    @property
+    def backend(self):
+        return self._backend
+
+    def __init__(self, backend=None, ttls=None):
+        self._backend = (MemoryCache() if backend is None else backend)
+        self._hits = 0
+        self._lock = Lock()
+        self._misses = 0
+        self._revalidated = 0
+        self._ttls = list((DEFAULT_TTLS if ttls is None else ttls).items())
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @staticmethod
+    def _response(entry):
+        response = Response()
+        response._content = entry.content
+        response._content_consumed = True
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.reason = "OK"
+        response.status_code = HTTP_OK
+        response.url = entry.url
+        return response
+
+    def clear(self):
+        self._backend.clear()
+
+    def info(self):
+        with self._lock:
+            return ResponseCacheInfo(self._hits, self._misses,
+                self._revalidated, len(self._backend))
+
+    def request(self, path, url, params, send):
+
+        """
+        Returns the response to GET "url" with "params", calling
+        "send(headers)" to request it if needed.
+        """
+
+        ttl = self.ttl(path)
+        if ttl is None:
+            return send(None)
+
+        key = "GET " + url
+        if params:
+            key += "?" + urlencode(sorted((name, str(value))
+                for name, value in params.items() if value is not None))
+
+        entry = self._backend.get(key)
+
+        if (entry is not None) and (entry.expires > time()):
+            self._count("_hits")
+            return self._response(entry)
+
+        headers = None
+        if entry is not None:
+            validators = CaseInsensitiveDict(entry.headers)
+            headers = dict(HEADERS)
+            if HEADER_ETAG in validators:
+                headers[HEADER_IF_NONE_MATCH] = validators[HEADER_ETAG]
+            if HEADER_LAST_MODIFIED in validators:
+                headers[HEADER_IF_MODIFIED_SINCE] = \
+                    validators[HEADER_LAST_MODIFIED]
+
+        response = send(headers)
+
+        if (entry is not None) and \
+                (response.status_code == HTTP_NOT_MODIFIED):
+            response.close()
+            self._count("_revalidated")
+            entry = entry._replace(expires=time() + ttl)
+            self._backend.set(key, entry)
+            return self._response(entry)
+
+        self._count("_misses")
+
+        if response.status_code == HTTP_OK:
+            self._backend.set(key, CacheEntry(url, response.content,
+                dict(response.headers), time() + ttl))
+
+        return response
+
+    def ttl(self, path):
+
+        """Seconds to keep the responses of "path" for, None if not cached"""
+
+        for pattern, ttl in self._ttls:
+            if fnmatchcase(path, pattern):
+                return ttl
+        return None
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+
+"""
+Column buffers for telephone number exports.
+
+Rows are added as dicts of XML tag -> text and kept per column: numbers in
+an array("q"), repeated strings (statuses, rate centers, states, ...)
+dictionary-encoded as array("H") codes into a list of categories, other
+strings in a list. The arrays support the buffer protocol, e.g.
+numpy.frombuffer(table["full_number"].values, "int64"), and the codes and
+categories map onto the dictionary-encoded columns of Arrow or Parquet.
+"""
+
+import csv
+
+from array import array
+from collections import namedtuple
+
+CATEGORY_CODES = "H"
+CATEGORY_CODES_WIDE = "I"
+COLUMN_CATEGORY = "category"
+COLUMN_NUMBER = "number"
+COLUMN_TEXT = "text"
+NUMBER_TYPE = "q"
+
+ColumnSpec = namedtuple("ColumnSpec", ["name", "tag", "type"])
+
+IN_SERVICE_COLUMNS = (
+    ColumnSpec("full_number", "TelephoneNumber", COLUMN_NUMBER),
+)
+
+TN_COLUMNS = (
+    ColumnSpec("full_number", "FullNumber", COLUMN_NUMBER),
+    ColumnSpec("status", "Status", COLUMN_CATEGORY),
+    ColumnSpec("rate_center", "RateCenter", COLUMN_CATEGORY),
+    ColumnSpec("state", "State", COLUMN_CATEGORY),
+    ColumnSpec("city", "City", COLUMN_CATEGORY),
+    ColumnSpec("lata", "Lata", COLUMN_CATEGORY),
+    ColumnSpec("tier", "Tier", COLUMN_CATEGORY),
+    ColumnSpec("vendor_id", "VendorId", COLUMN_CATEGORY),
+    ColumnSpec("vendor_name", "VendorName", COLUMN_CATEGORY),
+    ColumnSpec("account_id", "AccountId", COLUMN_CATEGORY),
+)
+
+class CategoryColumn(object):
+
+    """
+    Dictionary-encoded strings. "codes" index "categories", code 0 is a
+    missing value (None). Codes widen to 32 bits past 65535 categories.
+    """
+
+    def __init__(self, spec):
+        self.categories = [None]
+        self.codes = array(CATEGORY_CODES)
+        self.spec = spec
+        self._index = {None: 0}
+
+    def __getitem__(self, index):
+        return self.categories[self.codes[index]]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def append(self, text):
+        code = self._index.get(text)
+        if code is None:
+            code = len(self.categories)
+            if (code > 0xFFFF) and (self.codes.typecode == CATEGORY_CODES):
+                self.codes = array(CATEGORY_CODES_WIDE, self.codes)
+            self.categories.append(text)
+            self._index[text] = code
+        self.codes.append(code)
+
+class NumberColumn(object):
+
+    """Integers in "values", 0 for missing values"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.values = array(NUMBER_TYPE)
+
+    def __getitem__(self, index):
+        return (self.values[index] or None)
+
+    def __len__(self):
+        return len(self.values)
+
+    def append(self, text):
+        self.values.append(int(text) if text else 0)
+
+class TextColumn(object):
+
+    """Strings in "values", None for missing values"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.values = []
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __len__(self):
+        return len(self.values)
+
+    def append(self, text):
+        self.values.append(text)
+
+COLUMNS = {COLUMN_CATEGORY: CategoryColumn, COLUMN_NUMBER: NumberColumn,
+    COLUMN_TEXT: TextColumn}
+
+class CsvWriter(object):
+
+    """
+    Export sink writing the rows straight to the "file" opened for
+    writing text, with a header of the column names.
+    """
+
+    def __init__(self, file, columns=TN_COLUMNS):
+        self._tags = [spec.tag for spec in columns]
+        self._writer = csv.writer(file)
+        self._writer.writerow([spec.name for spec in columns])
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, record):
+        get = record.get
+        self._writer.writerow([get(tag) for tag in self._tags])
+        self.count += 1
+
+class TnTable(object):
+
+    """
+    Export sink keeping the rows in column buffers, one per ColumnSpec of
+    "columns". Columns are looked up by name: table["status"].
+    """
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def __init__(self, columns=TN_COLUMNS):
+        self._columns = [COLUMNS[spec.type](spec) for spec in columns]
+        self._names = dict((column.spec.name, column)
+            for column in self._columns)
+        self._appenders = [(column.spec.tag, column.append)
+            for column in self._columns]
+
+    def __getitem__(self, name):
+        return self._names[name]
+
+    def __len__(self):
+        return (len(self._columns[0]) if self._columns else 0)
+
+    def append(self, record):
+        get = record.get
+        for tag, append in self._appenders:
+            append(get(tag))
+
+    def rows(self):
+
+        """Yields the rows as tuples, in the order of "columns" """
+
+        for index in range(len(self)):
+            yield tuple(column[index] for column in self._columns)
+
+    def to_csv(self, file):
+
+        """Writes the table to the text "file", with a header"""
+
+        writer = csv.writer(file)
+        writer.writerow([column.spec.name for column in self._columns])
+        writer.writerows(self.rows())
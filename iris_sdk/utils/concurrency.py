@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from iris_sdk.utils.deadline import propagate
+
+DEFAULT_MAX_WORKERS = 4
+
+Failure = namedtuple("Failure", ["index", "item", "error"])
+
+def chunks(items, size):
+
+    """Splits "items" into lists of "size" items at most"""
+
+    if size < 1:
+        raise ValueError("Chunk size must be positive")
+
+    items = list(items)
+    return [items[pos:pos + size] for pos in range(0, len(items), size)]
+
+def map_concurrent(func, items, max_workers=DEFAULT_MAX_WORKERS):
+
+    """
+    Calls "func" for every item, at most "max_workers" at a time.
+
+    Returns the results in the order of "items" and the list of Failure
+    tuples of the calls that raised an exception, whose results are None.
+    Keep "max_workers" within the connection pool size of the client
+    (see RestClient) so the requests don't wait for connections.
+    The calls run in the Deadline (see utils.deadline) of the caller.
+    """
+
+    items = list(items)
+    results = [None] * len(items)
+    failures = []
+
+    if not items:
+        return results, failures
+
+    func = propagate(func)
+    with ThreadPoolExecutor(max(1, min(max_workers, len(items)))) as pool:
+        futures = [pool.submit(func, item) for item in items]
+        for index, future in enumerate(futures):
+            try:
+                results[index] = future.result()
+            except Exception as error:
+                failures.append(Failure(index, items[index], error))
+
+    return results, failures
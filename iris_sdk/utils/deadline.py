@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+from functools import wraps
+from threading import local
+from time import monotonic
+
+from iris_sdk.utils.rest import RestError
+
+_deadlines = local()
+
+class DeadlineExceeded(RestError):
+
+    """Raised instead of sending requests once the deadline has passed"""
+
+    pass
+
+class Deadline(object):
+
+    """
+    Wall-clock budget of an operation made of several requests.
+
+    The requests made in the "with" block of a deadline give up "seconds"
+    after it was created: the timeout of every request is shortened to the
+    time remaining and DeadlineExceeded is raised instead of sending
+    requests once there's none left, or when a request times out because
+    of it.
+    "timeout" - the connect and read timeouts of the requests made in the
+    block instead of the client's (see Client), either seconds or a
+    (connect, read) tuple. A deadline can set just that, without "seconds".
+    Deadlines nest, the earliest one applies. The helpers sending requests
+    on other threads (Tns.enrich, Loas.create_all, Orders.bulk, OrderWatcher,
+    ...) pass the deadline of the calling thread on to them.
+    """
+
+    @property
+    def expires(self):
+
+        """The "time.monotonic" time of the deadline, None if there's none"""
+
+        return self._expires
+
+    def __init__(self, seconds=None, timeout=None):
+        self._expires = (None if seconds is None else monotonic() + seconds)
+        self._timeout = timeout
+
+    def __enter__(self):
+        outer = current_deadline()
+        _stack().append(self if outer is None else self._nested(outer))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _stack().pop()
+
+    def _nested(self, outer):
+
+        """The deadline applying inside "outer": the earliest, own timeout"""
+
+        expires = self._expires
+        if (outer.expires is not None) and \
+                ((expires is None) or (outer.expires < expires)):
+            expires = outer.expires
+        timeout = (outer._timeout if self._timeout is None else self._timeout)
+        if (expires == self._expires) and (timeout is self._timeout):
+            return self
+        inst = Deadline(timeout=timeout)
+        inst._expires = expires
+        return inst
+
+    def check(self):
+
+        """Raises DeadlineExceeded if the deadline has passed"""
+
+        if self.expired():
+            raise DeadlineExceeded("Deadline exceeded")
+
+    def expired(self):
+        return (self._expires is not None) and (monotonic() >= self._expires)
+
+    def remaining(self):
+
+        """Seconds left, None if there's no deadline"""
+
+        if self._expires is None:
+            return None
+        return max(0, self._expires - monotonic())
+
+    def timeout(self, timeout=None):
+
+        """
+        The timeout of the next request: the deadline's own one if set,
+        "timeout" (the client's) otherwise, shortened to the time remaining.
+        Raises DeadlineExceeded if there's none.
+        """
+
+        if self._timeout is not None:
+            timeout = self._timeout
+        if self._expires is None:
+            return timeout
+        self.check()
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple((remaining if value is None
+                else min(value, remaining)) for value in timeout)
+        return min(timeout, remaining)
+
+def _stack():
+    try:
+        return _deadlines.stack
+    except AttributeError:
+        _deadlines.stack = []
+        return _deadlines.stack
+
+def current_deadline():
+
+    """The deadline of the "with" block the calling thread is in, if any"""
+
+    stack = getattr(_deadlines, "stack", None)
+    return (stack[-1] if stack else None)
+
+def propagate(func):
+
+    """
+    Returns "func" running in the deadline of the calling thread, if any,
+    for running on other threads.
+    """
+
+    deadline = current_deadline()
+    if deadline is None:
+        return func
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with deadline:
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+
+from bisect import bisect_left
+from collections import namedtuple
+from contextlib import contextmanager
+from threading import local, Lock
+from timeit import default_timer
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+# Histogram bucket upper bounds in seconds, 1us to ~95s, 2 per octave
+BUCKETS = tuple(0.000001 * 2 ** (exp / 2.0) for exp in range(54))
+PHASE_FROM_XML = "from_xml"
+PHASE_FROMSTRING = "fromstring"
+PHASE_HTTP = "http"
+PHASE_PARSE_STREAM = "parse_stream"
+PHASE_SERIALIZE = "serialize"
+TRACER_NAME = "iris_sdk"
+
+HistogramSummary = namedtuple("HistogramSummary",
+    ["count", "total", "min", "max", "p50", "p95", "p99", "bytes"])
+
+_scope = local()
+
+class Span(object):
+
+    """
+    A timed phase of a request: "serialize", "http", "fromstring",
+    "from_xml" or "parse_stream" (streamed responses, download included).
+    "resource" is the resource class name, "endpoint" - the xpath template
+    ("/accounts/{}/orders/{}"), "size" - the bytes sent or parsed.
+    "context" is free for the instrumentation to use.
+    """
+
+    __slots__ = ("context", "duration", "endpoint", "error", "method", "name",
+        "resource", "size", "start", "status", "url")
+
+    def __init__(self, name, resource=None, endpoint=None, method=None,
+            url=None, size=None):
+        self.context = None
+        self.duration = None
+        self.endpoint = endpoint
+        self.error = None
+        self.method = method
+        self.name = name
+        self.resource = resource
+        self.size = size
+        self.start = None
+        self.status = None
+        self.url = url
+
+class Instrumentation(object):
+
+    """
+    Client instrumentation hooks, called around every phase of the requests
+    (see Span). The base class does nothing.
+    """
+
+    def finish(self, span):
+        pass
+
+    def start(self, span):
+        pass
+
+class Instruments(Instrumentation):
+
+    """Passes the spans to several instrumentations"""
+
+    def __init__(self, *instrumentations):
+        self._instrumentations = instrumentations
+
+    def finish(self, span):
+        for instrumentation in reversed(self._instrumentations):
+            instrumentation.finish(span)
+
+    def start(self, span):
+        for instrumentation in self._instrumentations:
+            instrumentation.start(span)
+
+class Histogram(object):
+
+    """Durations of a phase of an endpoint, in exponential buckets"""
+
+    def __init__(self):
+        self._bytes = 0
+        self._count = 0
+        self._counts = [0] * (len(BUCKETS) + 1)
+        self._max = 0
+        self._min = None
+        self._total = 0
+
+    def add(self, seconds, size=None):
+        self._bytes += (size or 0)
+        self._count += 1
+        self._counts[bisect_left(BUCKETS, seconds)] += 1
+        self._max = max(self._max, seconds)
+        self._min = (seconds if self._min is None else min(self._min, seconds))
+        self._total += seconds
+
+    def percentile(self, percent):
+
+        """Upper bound of the bucket holding the "percent" percentile"""
+
+        rank = self._count * percent / 100.0
+        seen = 0
+        for pos, count in enumerate(self._counts):
+            seen += count
+            if count and (seen >= rank):
+                if pos == len(BUCKETS):
+                    return self._max
+                return min(self._max, BUCKETS[pos])
+        return None
+
+    def summary(self):
+        return HistogramSummary(self._count, self._total, self._min,
+            self._max, self.percentile(50), self.percentile(95),
+            self.percentile(99), self._bytes)
+
+class Collector(Instrumentation):
+
+    """
+    Aggregates the spans into a Histogram per endpoint and phase:
+
+        collector = Collector()
+        client = Client(..., instrumentation=collector)
+        ...
+        for (endpoint, phase), stats in collector.summary().items():
+            print(endpoint, phase, stats.count, stats.p95)
+    """
+
+    def __init__(self):
+        self._histograms = {}
+        self._lock = Lock()
+
+    def clear(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def finish(self, span):
+        key = (span.endpoint, span.name)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.add(span.duration, span.size)
+
+    def summary(self):
+        with self._lock:
+            return dict((key, histogram.summary())
+                for key, histogram in self._histograms.items())
+
+class OpenTelemetryInstrumentation(Instrumentation):
+
+    """
+    Emits the spans as OpenTelemetry spans, requires opentelemetry-api.
+    "tracer" - the tracer to use, the "iris_sdk" one of the global tracer
+    provider by default.
+    """
+
+    def __init__(self, tracer=None):
+        if trace is None:
+            raise ImportError(
+                "OpenTelemetryInstrumentation requires opentelemetry-api")
+        self._tracer = (trace.get_tracer(TRACER_NAME) if tracer is None
+            else tracer)
+
+    def finish(self, span):
+        otel_span = span.context
+        if otel_span is None:
+            return
+        if span.status is not None:
+            otel_span.set_attribute("http.status_code", span.status)
+        if span.size is not None:
+            otel_span.set_attribute("iris.size", span.size)
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(trace.Status(trace.StatusCode.ERROR))
+        otel_span.end()
+
+    def start(self, span):
+        attributes = {"iris.phase": span.name}
+        for name, value in (("iris.resource", span.resource),
+                ("iris.endpoint", span.endpoint),
+                ("http.method", span.method), ("http.url", span.url)):
+            if value is not None:
+                attributes[name] = value
+        span.context = self._tracer.start_span(
+            "iris {} {}".format(span.name, span.endpoint or ""),
+            attributes=attributes)
+
+def current_scope():
+
+    """The (resource class name, endpoint) requesting in this thread"""
+
+    return getattr(_scope, "resource", None)
+
+@contextmanager
+def measure(instrumentation, name, resource=None, endpoint=None, size=None,
+        method=None, url=None):
+
+    """Times the "with" block, passing its Span to the instrumentation"""
+
+    if (resource is None) and (endpoint is None):
+        resource, endpoint = (current_scope() or (None, None))
+
+    span = Span(name, resource, endpoint, method, url, size)
+    instrumentation.start(span)
+    span.start = default_timer()
+    try:
+        yield span
+    except Exception as error:
+        span.error = error
+        raise
+    finally:
+        span.duration = default_timer() - span.start
+        instrumentation.finish(span)
+
+@contextmanager
+def scope(resource, endpoint):
+
+    """Attributes the requests made in the "with" block to a resource"""
+
+    previous = getattr(_scope, "resource", None)
+    _scope.resource = (resource, endpoint)
+    try:
+        yield
+    finally:
+        _scope.resource = previous
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+
+from collections import namedtuple
+from email.utils import parsedate_tz, mktime_tz
+from random import random
+from threading import Lock
+from time import sleep, time
+
+import requests
+
+from iris_sdk.utils.rest import RestError
+
+DEFAULT_BACKOFF = 0.5
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_MAX_BACKOFF = 30
+DEFAULT_RESET_TIMEOUT = 30
+DEFAULT_RETRIES = 3
+HEADER_RETRY_AFTER = "Retry-After"
+IDEMPOTENT_METHODS = ("DELETE", "GET", "PUT")
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Responses counted as the service being down by the circuit breaker
+SERVER_ERROR_MIN = 500
+STATE_CLOSED = "closed"
+STATE_HALF_OPEN = "half-open"
+STATE_OPEN = "open"
+
+PolicyInfo = namedtuple("PolicyInfo",
+    ["requests", "retries", "throttled", "rejected", "failures", "state"])
+
+class CircuitOpenError(RestError):
+
+    """Raised instead of sending requests while the circuit is open"""
+
+    pass
+
+class CircuitBreaker(object):
+
+    """
+    Fails requests fast once "failure_threshold" requests in a row failed
+    with a connection error or a 5xx response. After "reset_timeout" seconds
+    one trial request is let through, closing the circuit if it succeeds.
+    """
+
+    @property
+    def state(self):
+        with self._lock:
+            if (self._state == STATE_OPEN) and \
+                    (time() >= self._opened + self._reset_timeout):
+                return STATE_HALF_OPEN
+            return self._state
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+            reset_timeout=DEFAULT_RESET_TIMEOUT):
+        self._failure_threshold = failure_threshold
+        self._failures = 0
+        self._lock = Lock()
+        self._opened = 0
+        self._reset_timeout = reset_timeout
+        self._state = STATE_CLOSED
+        self._trial = False
+
+    def allow(self):
+
+        """Whether a request can be sent now"""
+
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return True
+            if self._trial or (time() < self._opened + self._reset_timeout):
+                return False
+            self._trial = True
+            return True
+
+    def failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial = False
+            if (self._state != STATE_CLOSED) or \
+                    (self._failures >= self._failure_threshold):
+                self._opened = time()
+                self._state = STATE_OPEN
+
+    def release(self):
+
+        """
+        Ends the trial request without a verdict, when it failed with
+        neither a response nor a connection error. The next request is the
+        trial then.
+        """
+
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                self._trial = False
+
+    def success(self):
+        with self._lock:
+            self._failures = 0
+            self._trial = False
+            self._state = STATE_CLOSED
+
+class RateLimiter(object):
+
+    """
+    Token bucket allowing "rate" requests per second with bursts of up to
+    "burst" requests, with a separate bucket for every key (account).
+    """
+
+    def __init__(self, rate, burst=None):
+        self._buckets = {}
+        self._burst = (max(1, rate) if burst is None else burst)
+        self._lock = Lock()
+        self._rate = rate
+
+    def acquire(self, key=None):
+
+        """Waits for a token, returns the number of seconds waited"""
+
+        with self._lock:
+            now = time()
+            tokens, updated = self._buckets.get(key, (self._burst, now))
+            tokens = min(self._burst, tokens + (now - updated) * self._rate)
+            # Taken in advance, the bucket goes negative while waiting
+            tokens -= 1
+            self._buckets[key] = (tokens, now)
+
+        wait = (-tokens / self._rate if tokens < 0 else 0)
+        if wait:
+            sleep(wait)
+        return wait
+
+class RequestPolicy(object):
+
+    """
+    Retries, rate limiting and circuit breaking of RestClient requests.
+
+    Requests failing with a connection error or a "retry_statuses" response
+    are retried up to "retries" times, waiting "backoff" seconds doubled on
+    every retry up to "max_backoff", with jitter, or as long as the
+    response's Retry-After header says. Only the "methods" requests are
+    retried, add "POST" to retry the non idempotent ones too. A Retry-After
+    longer than "max_backoff" isn't waited for.
+    "rate_limiter" - a RateLimiter, its buckets are keyed by account id.
+    "circuit_breaker" - a CircuitBreaker, CircuitOpenError is raised while
+    it's open.
+    A policy can be shared by clients to share the limits.
+    """
+
+    @property
+    def circuit_breaker(self):
+        return self._circuit_breaker
+
+    @property
+    def rate_limiter(self):
+        return self._rate_limiter
+
+    def __init__(self, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF,
+            max_backoff=DEFAULT_MAX_BACKOFF, methods=IDEMPOTENT_METHODS,
+            retry_statuses=RETRY_STATUSES, rate_limiter=None,
+            circuit_breaker=None):
+        self._backoff = backoff
+        self._circuit_breaker = circuit_breaker
+        self._counters = dict.fromkeys(PolicyInfo._fields[:-1], 0)
+        self._lock = Lock()
+        self._max_backoff = max_backoff
+        self._methods = tuple(methods)
+        self._rate_limiter = rate_limiter
+        self._retries = retries
+        self._retry_statuses = tuple(retry_statuses)
+
+    def _count(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _delay(self, attempt, response=None):
+        if response is not None:
+            retry_after = retry_after_seconds(response)
+            if retry_after is not None:
+                return retry_after
+        delay = min(self._max_backoff, self._backoff * 2 ** attempt)
+        return delay * (0.5 + random() / 2)
+
+    def info(self):
+        with self._lock:
+            counters = dict(self._counters)
+        state = (STATE_CLOSED if self._circuit_breaker is None
+            else self._circuit_breaker.state)
+        return PolicyInfo(state=state, **counters)
+
+    def send(self, method, send, key=None, retry=True, deadline=None):
+
+        """
+        Returns the response of "send()" for a "method" request. Requests
+        whose data can't be sent twice are passed with "retry" unset.
+        Retries that would have to wait past "deadline" (see utils.deadline)
+        aren't made.
+        """
+
+        retry = retry and (method in self._methods)
+        breaker = self._circuit_breaker
+        attempt = 0
+
+        while True:
+
+            if (breaker is not None) and (not breaker.allow()):
+                self._count("rejected")
+                raise CircuitOpenError("Circuit open, request not sent")
+
+            if self._rate_limiter is not None:
+                if self._rate_limiter.acquire(key):
+                    self._count("throttled")
+
+            self._count("requests")
+            response = None
+
+            try:
+                response = send()
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout) as error:
+                self._count("failures")
+                if breaker is not None:
+                    breaker.failure()
+                if (not retry) or (attempt >= self._retries):
+                    raise
+                failure = error
+            except Exception:
+                # E.g. DeadlineExceeded, the service's state is unknown
+                if breaker is not None:
+                    breaker.release()
+                raise
+            else:
+                failed = (response.status_code >= SERVER_ERROR_MIN)
+                if failed:
+                    self._count("failures")
+                if (breaker is not None) and failed:
+                    breaker.failure()
+                elif breaker is not None:
+                    breaker.success()
+                if (not retry) or (attempt >= self._retries) or \
+                        (response.status_code not in self._retry_statuses):
+                    return response
+
+            delay = self._delay(attempt, response)
+            if delay > self._max_backoff:
+                return response
+            remaining = (None if deadline is None else deadline.remaining())
+            if (remaining is not None) and (delay >= remaining):
+                if response is None:
+                    raise failure
+                return response
+            if response is not None:
+                response.close()
+
+            self._count("retries")
+            attempt += 1
+            sleep(delay)
+
+def retry_after_seconds(response):
+
+    """The Retry-After header of "response" in seconds, None if missing"""
+
+    value = response.headers.get(HEADER_RETRY_AFTER)
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+    return max(0, mktime_tz(date) - time())
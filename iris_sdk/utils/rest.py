@@ -1,15 +1,25 @@
 #!/usr/bin/env python
 
 from future.utils import raise_from
+from urllib.parse import urlsplit
 
 import requests
-from xml.etree import ElementTree
+from requests.adapters import HTTPAdapter
 
+from iris_sdk.utils.instrumentation import current_scope, measure, PHASE_HTTP
+from iris_sdk.utils.xml_backend import get_backend
+
+DEFAULT_POOL_BLOCK = False
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
 ERROR_TAG = "ErrorList"
 ERROR_TEMPLATE = "{} Iris error: {}"
 HEADERS = {"content-type": "application/xml"}
 HTTP_OK = 200
 HTTP_OK_MAX = 299
+METHODS = ("GET", "POST", "DELETE", "PUT")
+REPLAYABLE_TYPES = (bytes, bytearray, dict, str)
+SESSION_PREFIXES = ("http://", "https://")
 
 class RestError(Exception):
 
@@ -19,50 +29,156 @@ class RestError(Exception):
 
 class RestClient(object):
 
-    """HTTP requests wrapper"""
+    """
+    HTTP requests wrapper.
 
-    def request(self, method, url, auth, params=None, data=None,headers=None):
+    Requests go through a single keep-alive "requests.Session", so the
+    connections are reused across calls. "pool_connections" is the number of
+    hosts to keep pools for, "pool_maxsize" - the number of connections kept
+    per host, "pool_block" makes callers wait for a free connection instead
+    of opening extra ones when the pool is exhausted.
+    A session passed to the constructor is used as is and is not closed by
+    "close".
+    "policy" - a RequestPolicy (see utils.policy) retrying, rate limiting
+    and circuit breaking the requests.
+    "instrumentation" - an Instrumentation (see utils.instrumentation)
+    timing the requests.
+    "timeout" - the connect and read timeouts of the requests in seconds,
+    as a number or a (connect, read) tuple, None to wait forever.
+    """
 
-        assert method in ("GET", "POST", "DELETE", "PUT")
+    @property
+    def instrumentation(self):
+        return self._instrumentation
 
-        response = None
-        try:
+    @property
+    def policy(self):
+        return self._policy
+
+    @property
+    def session(self):
+        return self._session
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    def __init__(self, session=None, pool_connections=DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=DEFAULT_POOL_BLOCK,
+            policy=None, instrumentation=None, timeout=None):
+
+        self._owns_session = (session is None)
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize, pool_block=pool_block)
+            for prefix in SESSION_PREFIXES:
+                session.mount(prefix, adapter)
+
+        self._instrumentation = instrumentation
+        self._policy = policy
+        self._session = session
+        self._timeout = timeout
+
+    def __enter__(self):
+        return self
 
-            response = requests.request(method, url, auth=auth,
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+
+        """Releases the pooled connections of an owned session"""
+
+        if self._owns_session:
+            self._session.close()
+
+    def _send(self, method, url, auth, params, data, headers, stream, key,
+            timeout, deadline):
+
+        timeout = (self._timeout if timeout is None else timeout)
+
+        def send():
+            return self._session.request(method, url, auth=auth,
                 headers=(HEADERS if headers is None else headers),
-                data=data, params=params)
-
-            response.raise_for_status()
-
-            return response
-
-        except requests.exceptions.HTTPError as http_exception:
-
-            if (response is None) or (response.content == b"") or \
-                    (response.status_code <= HTTP_OK_MAX):
-                raise http_exception
-
-            # Logical error descriptions in response body
-
-            error_msg = None
-
-            try:
-                root = ElementTree.fromstring(response.content)
-                msg_node = root
-                # In data responses (orders, etc.) the error list element
-                # can be anywhere. Scan the first two levels and give up.
-                el = root.find(ERROR_TAG)
-                if el is None:
-                    children = root.getchildren()
-                    for elem in children:
-                        el = elem.find(ERROR_TAG)
-                        if el is not None:
-                            break
-                msg_node = (el if el is not None else msg_node)
-                error_msg = ERROR_TEMPLATE.format(
-                    msg_node[0][0].text, msg_node[0][1].text)
-            except:
-                error_msg = response.content
-
-            # Suppress the HTTP exception
-            raise_from(RestError(error_msg), None)
\ No newline at end of file
+                data=data, params=params, stream=stream,
+                timeout=(timeout if deadline is None
+                    else deadline.timeout(timeout)))
+
+        if self._policy is None:
+            return send()
+
+        # Files and iterators can't be sent again
+        replayable = (data is None) or isinstance(data, REPLAYABLE_TYPES)
+        return self._policy.send(method, send, key, replayable, deadline)
+
+    def request(self, method, url, auth, params=None, data=None,headers=None,
+            stream=False, key=None, timeout=None, deadline=None):
+
+        """
+        "key" - the account the request is made for, to rate limit the
+        accounts separately.
+        "timeout" - the request's timeouts instead of the client's.
+        "deadline" - a Deadline (see utils.deadline) shortening them.
+        """
+
+        assert method in METHODS
+
+        if self._instrumentation is None:
+            return raise_for_error(self._send(method, url, auth, params, data,
+                headers, stream, key, timeout, deadline))
+
+        resource, endpoint = (current_scope() or (None, urlsplit(url).path))
+        with measure(self._instrumentation, PHASE_HTTP, resource, endpoint,
+                method=method, url=url) as span:
+            response = self._send(method, url, auth, params, data, headers,
+                stream, key, timeout, deadline)
+            span.status = response.status_code
+            if not stream:
+                span.size = len(response.content)
+            return raise_for_error(response)
+
+def raise_for_error(response):
+
+    """
+    Returns the response if it's successful, raises HTTPError otherwise.
+    Iris error descriptions found in the response body are raised as
+    RestError.
+    """
+
+    try:
+
+        response.raise_for_status()
+
+        return response
+
+    except requests.exceptions.HTTPError as http_exception:
+
+        if (response.content == b"") or \
+                (response.status_code <= HTTP_OK_MAX):
+            raise http_exception
+
+        # Logical error descriptions in response body
+
+        error_msg = None
+
+        try:
+            root = get_backend().fromstring(response.content)
+            msg_node = root
+            # In data responses (orders, etc.) the error list element
+            # can be anywhere. Scan the first two levels and give up.
+            el = root.find(ERROR_TAG)
+            if el is None:
+                for elem in root:
+                    el = elem.find(ERROR_TAG)
+                    if el is not None:
+                        break
+            msg_node = (el if el is not None else msg_node)
+            error_msg = ERROR_TEMPLATE.format(
+                msg_node[0][0].text, msg_node[0][1].text)
+        except:
+            error_msg = response.content
+
+        # Suppress the HTTP exception
+        raise_from(RestError(error_msg), None)
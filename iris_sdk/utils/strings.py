@@ -1,17 +1,115 @@
 #!/usr/bin/env python
 
-from re import sub
+from collections import namedtuple
+from re import compile
+from threading import Lock
+
+CACHE_SIZE = 4096
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_CAMELCASE = compile(r'_([a-zA-Z])')
+_UNDERSCORE_FIRST = compile('(.)([A-Z][a-z]+)')
+_UNDERSCORE_SECOND = compile('([a-z0-9])([A-Z])')
+
+class StringCache(object):
+
+    """
+    Bounded, thread-safe memo of a string conversion.
+    When full, the oldest entries are dropped first.
+    """
+
+    def __init__(self, func, maxsize=CACHE_SIZE):
+        self._data = {}
+        self._func = func
+        self._hits = 0
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self._misses = 0
+
+    def __call__(self, string):
+        try:
+            result = self._data[string]
+        except KeyError:
+            result = self._func(string)
+            with self._lock:
+                self._misses += 1
+                self._add(string, result)
+            return result
+        with self._lock:
+            self._hits += 1
+        return result
+
+    def _add(self, string, result):
+        if (string not in self._data) and \
+                (len(self._data) >= self._maxsize):
+            self._data.pop(next(iter(self._data)), None)
+        self._data[string] = result
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize,
+                len(self._data))
+
+    def seed(self, strings):
+
+        """Converts "strings" in advance, not counted as misses"""
+
+        for string in strings:
+            result = self._func(string)
+            with self._lock:
+                self._add(string, result)
+
+def _to_camelcase(string):
+    if string.upper() == 'URL':
+        return 'URL'
+    str = _CAMELCASE.sub(lambda m: m.group(1).upper(), string)
+    return str[0].upper() + str[1:]
+
+def _to_underscore(string):
+    str = _UNDERSCORE_FIRST.sub(r'\1_\2', string)
+    return _UNDERSCORE_SECOND.sub(r'\1_\2', str).lower()
+
+_camelcase_cache = StringCache(_to_camelcase)
+_underscore_cache = StringCache(_to_underscore)
 
 class Converter(object):
 
-    """String case conversions"""
+    """
+    String case conversions.
+
+    The results are memoized process-wide, shared by all the instances.
+    """
+
+    @staticmethod
+    def cache_info():
+
+        """Hits, misses and sizes of the conversion caches"""
+
+        return {
+            "to_camelcase": _camelcase_cache.info(),
+            "to_underscore": _underscore_cache.info()
+        }
+
+    @staticmethod
+    def seed(names):
+
+        """
+        Warms up the caches with property names and their CamelCase tags.
+        """
+
+        names = list(names)
+        _camelcase_cache.seed(names)
+        _underscore_cache.seed([_to_camelcase(name) for name in names])
 
     def to_camelcase(self, string):
-        if string.upper() == 'URL':
-            return 'URL'
-        str = sub(r'_([a-zA-Z])', lambda m: m.group(1).upper(), string)
-        return str[0].upper() + str[1:]
+        return _camelcase_cache(string)
 
     def to_underscore(self, string):
-        str = sub('(.)([A-Z][a-z]+)', r'\1_\2', string)
-        return sub('([a-z0-9])([A-Z])', r'\1_\2', str).lower()
\ No newline at end of file
+        return _underscore_cache(string)
@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+
+"""
+Sets of telephone numbers for reconciling inventories.
+
+A TnSet keeps 10-digit numbers as a sorted int64 array without duplicates:
+a NumPy array when NumPy is installed, an array("q") otherwise. Unions,
+differences and intersections are merges of the sorted arrays (vectorized
+with NumPy), numbers are grouped by NPA or NPA-NXX prefix and into ranges
+of consecutive numbers. TnSet.load reads the numbers of Tns,
+InServiceNumbers or DiscNumbers through their "export", without creating
+objects per number.
+
+    iris = TnSet.load(account.in_service_numbers, {"size": 1000})
+    report = reconcile(iris, TnSet(billed_numbers))
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from itertools import groupby, islice
+from operator import lt
+
+from iris_sdk.utils.columns import IN_SERVICE_COLUMNS, NUMBER_TYPE, \
+    TN_COLUMNS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NPA_DIGITS = 3
+NPA_NXX_DIGITS = 6
+NUMBER_DIGITS = 10
+NUMBER_TAGS = (TN_COLUMNS[0].tag, IN_SERVICE_COLUMNS[0].tag)
+
+Reconciliation = namedtuple("Reconciliation", ["not_billed", "not_in_iris",
+    "matched"])
+
+class _NumberSink(object):
+
+    """Export sink keeping just the numbers, in an array("q")"""
+
+    def __init__(self):
+        self.values = array(NUMBER_TYPE)
+
+    def __len__(self):
+        return len(self.values)
+
+    def append(self, record):
+        for tag in NUMBER_TAGS:
+            number = record.get(tag)
+            if number:
+                self.values.append(int(number))
+                return
+
+class TnSet(object):
+
+    """
+    Immutable set of 10-digit telephone numbers, given as integers or
+    strings. Iterating yields the numbers as integers, in ascending order.
+    "values" is the sorted array itself, a NumPy array when NumPy is
+    installed.
+    """
+
+    @property
+    def values(self):
+        return self._values
+
+    def __init__(self, numbers=()):
+        if isinstance(numbers, TnSet):
+            self._values = numbers.values
+        elif numpy is not None:
+            self._values = _numpy_unique(numpy.sort(_to_numpy(numbers)))
+        else:
+            self._values = _unique(numbers)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __contains__(self, number):
+        number = int(number)
+        index = (int(numpy.searchsorted(self._values, number))
+            if numpy is not None else bisect_left(self._values, number))
+        return (index < len(self._values)) and \
+            bool(self._values[index] == number)
+
+    def __eq__(self, other):
+        if not isinstance(other, TnSet):
+            return NotImplemented
+        if numpy is not None:
+            return bool(numpy.array_equal(self._values, other.values))
+        return self._values == other.values
+
+    def __iter__(self):
+        if numpy is not None:
+            return iter(self._values.tolist())
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return (result if result is NotImplemented else not result)
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __repr__(self):
+        return "TnSet({} numbers)".format(len(self))
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    @classmethod
+    def _sorted(cls, values):
+
+        """A TnSet of "values", already sorted and unique"""
+
+        inst = cls()
+        inst._values = values
+        return inst
+
+    def difference(self, other):
+
+        """The numbers not in "other" """
+
+        other = _tn_set(other)
+        if numpy is not None:
+            return self._sorted(numpy.setdiff1d(self._values, other.values,
+                assume_unique=True))
+        return self._sorted(_merge_difference(self._values, other.values))
+
+    def intersection(self, other):
+
+        """The numbers also in "other" """
+
+        other = _tn_set(other)
+        if numpy is not None:
+            return self._sorted(numpy.intersect1d(self._values, other.values,
+                assume_unique=True))
+        return self._sorted(_merge_intersection(self._values, other.values))
+
+    @classmethod
+    def load(cls, resource, params=None):
+
+        """
+        The numbers of every page of "resource", Tns, InServiceNumbers or
+        DiscNumbers, listed with "params".
+        """
+
+        return cls(resource.export(params, _NumberSink()).values)
+
+    def prefix(self, prefix):
+
+        """The numbers starting with the digits of "prefix", e.g. "919555" """
+
+        prefix = str(prefix)
+        scale = 10 ** (NUMBER_DIGITS - len(prefix))
+        low = int(prefix) * scale
+        high = low + scale
+        if numpy is not None:
+            start, stop = numpy.searchsorted(self._values, [low, high])
+        else:
+            start = bisect_left(self._values, low)
+            stop = bisect_left(self._values, high, start)
+        return self._sorted(self._values[start:stop])
+
+    def prefixes(self, digits=NPA_NXX_DIGITS):
+
+        """
+        (prefix, count) tuples of the numbers grouped by their first
+        "digits" digits, NPA-NXX by default, NPA_DIGITS for the area codes.
+        """
+
+        scale = 10 ** (NUMBER_DIGITS - digits)
+        if not len(self._values):
+            return []
+        if numpy is not None:
+            keys = self._values // scale
+            starts = numpy.flatnonzero(numpy.concatenate(([True],
+                keys[1:] != keys[:-1])))
+            counts = numpy.diff(numpy.append(starts, len(keys)))
+            return list(zip(keys[starts].tolist(), counts.tolist()))
+        return [(key, sum(1 for number in group)) for key, group in
+            groupby(self._values, lambda number: number // scale)]
+
+    def ranges(self):
+
+        """(first, last) tuples of the runs of consecutive numbers"""
+
+        values = self._values
+        if not len(values):
+            return []
+        if numpy is not None:
+            breaks = numpy.flatnonzero(numpy.diff(values) != 1)
+            firsts = values[numpy.concatenate(([0], breaks + 1))]
+            lasts = values[numpy.concatenate((breaks, [len(values) - 1]))]
+            return list(zip(firsts.tolist(), lasts.tolist()))
+        ranges = []
+        first = last = values[0]
+        for number in islice(values, 1, None):
+            if number != last + 1:
+                ranges.append((first, last))
+                first = number
+            last = number
+        ranges.append((first, last))
+        return ranges
+
+    def union(self, other):
+
+        """The numbers in either set"""
+
+        other = _tn_set(other)
+        if numpy is not None:
+            return self._sorted(_numpy_unique(numpy.sort(numpy.concatenate(
+                (self._values, other.values)), kind="stable")))
+        return self._sorted(_merge_union(self._values, other.values))
+
+def _merge_difference(first, second):
+
+    """The values of the sorted array "first" not in "second" """
+
+    result = array(NUMBER_TYPE)
+    append = result.append
+    others = iter(second)
+    other = next(others, None)
+    values = iter(first)
+    for value in values:
+        while (other is not None) and (other < value):
+            other = next(others, None)
+        if other is None:
+            append(value)
+            result.extend(values)
+            break
+        if value != other:
+            append(value)
+    return result
+
+def _merge_intersection(first, second):
+
+    """The values of the sorted arrays "first" and "second" in both"""
+
+    result = array(NUMBER_TYPE)
+    append = result.append
+    others = iter(second)
+    other = next(others, None)
+    for value in first:
+        while (other is not None) and (other < value):
+            other = next(others, None)
+        if other is None:
+            break
+        if value == other:
+            append(value)
+    return result
+
+def _merge_union(first, second):
+
+    """The values of the sorted arrays "first" and "second" in either"""
+
+    result = array(NUMBER_TYPE)
+    append = result.append
+    others = iter(second)
+    other = next(others, None)
+    for value in first:
+        while (other is not None) and (other < value):
+            append(other)
+            other = next(others, None)
+        if value == other:
+            other = next(others, None)
+        append(value)
+    if other is not None:
+        append(other)
+        result.extend(others)
+    return result
+
+def _numpy_unique(values):
+
+    """The sorted NumPy array "values" without duplicates"""
+
+    if len(values) < 2:
+        return values
+    return values[numpy.concatenate(([True], values[1:] != values[:-1]))]
+
+def _sorted_unique(values):
+    return all(map(lt, values, islice(values, 1, None)))
+
+def _tn_set(numbers):
+    return (numbers if isinstance(numbers, TnSet) else TnSet(numbers))
+
+def _to_numpy(numbers):
+    if isinstance(numbers, numpy.ndarray):
+        return numbers.astype(numpy.int64, copy=False)
+    if isinstance(numbers, array) and (numbers.typecode == NUMBER_TYPE):
+        return numpy.frombuffer(numbers, numpy.int64)
+    return numpy.fromiter((int(number) for number in numbers), numpy.int64)
+
+def _unique(numbers):
+    if isinstance(numbers, array) and (numbers.typecode == NUMBER_TYPE):
+        numbers = array(NUMBER_TYPE, numbers)
+    else:
+        numbers = array(NUMBER_TYPE, (int(number) for number in numbers))
+    if _sorted_unique(numbers):
+        return numbers
+    return array(NUMBER_TYPE, sorted(set(numbers)))
+
+def reconcile(iris, billed):
+
+    """
+    Compares the numbers in Iris with the "billed" ones. Returns a
+    Reconciliation of TnSets: the numbers in Iris but not billed, the
+    billed ones not in Iris and the ones in both.
+    """
+
+    iris = _tn_set(iris)
+    billed = _tn_set(billed)
+    return Reconciliation(iris - billed, billed - iris, iris & billed)
@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+
+import asyncio
+
+from collections import deque
+from concurrent.futures import as_completed, Future, ThreadPoolExecutor, \
+    TimeoutError
+from heapq import heappop, heappush
+from itertools import count
+from random import random
+from threading import Condition, Thread
+from time import time
+
+from iris_sdk.utils.concurrency import DEFAULT_MAX_WORKERS
+from iris_sdk.utils.deadline import current_deadline, DeadlineExceeded
+
+DEFAULT_FACTOR = 2
+DEFAULT_INITIAL_DELAY = 1
+DEFAULT_JITTER = 0.5
+DEFAULT_MAX_DELAY = 60
+DEFAULT_MAX_ERRORS = 3
+PENDING_STATUSES = ("PROCESSING", "RECEIVED")
+STATUS_PROPERTIES = ("processing_status", "order_status")
+
+def order_status(response):
+
+    """The processing or order status of a get() result, None if missing"""
+
+    for name in STATUS_PROPERTIES:
+        status = getattr(response, name, None)
+        if status is not None:
+            return status
+    return None
+
+class _Watch(object):
+
+    """An order being polled"""
+
+    def __init__(self, key, resource, pending, deadline, delay, budget,
+            expired):
+        self.budget = budget
+        self.claimed = False
+        self.deadline = deadline
+        self.delay = delay
+        self.errors = 0
+        self.expired = expired
+        self.future = Future()
+        self.key = key
+        self.pending = pending
+        self.resource = resource
+
+class _Completions(object):
+
+    """Async iterator over the results of futures as they complete"""
+
+    def __init__(self, loop, futures):
+        self._done = deque()
+        self._loop = loop
+        self._remaining = len(futures)
+        self._waiter = None
+        for future in futures:
+            future.add_done_callback(self._done_threadsafe)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        if self._remaining == 0:
+            raise StopAsyncIteration
+        self._remaining -= 1
+        waiter = self._loop.create_future()
+        if self._done:
+            self._resolve(waiter, self._done.popleft())
+        else:
+            self._waiter = waiter
+        return waiter
+
+    def _done_threadsafe(self, future):
+        self._loop.call_soon_threadsafe(self._put, future)
+
+    def _put(self, future):
+        if (self._waiter is None) or self._waiter.done():
+            self._done.append(future)
+        else:
+            self._resolve(self._waiter, future)
+            self._waiter = None
+
+    @staticmethod
+    def _resolve(waiter, future):
+        if future.cancelled():
+            waiter.cancel()
+        elif future.exception() is not None:
+            waiter.set_exception(future.exception())
+        else:
+            waiter.set_result(future.result())
+
+class OrderWatcher(object):
+
+    """
+    Polls orders (Order, Disconnect, PortIn, Lidb, TnOptionOrder, ...)
+    until their status leaves "pending", PENDING_STATUSES by default.
+
+    The orders are polled on a shared pool of "max_workers" threads, the
+    first time "initial_delay" seconds after being watched, then at
+    intervals growing by "factor" up to "max_delay" seconds. The intervals
+    are shortened by a random fraction up to "jitter" so that orders
+    watched together don't keep being polled together.
+    Watching an order already watched returns the same future.
+    A watch fails after "max_errors" consecutive failed requests.
+
+    The watcher is an async iterator over the results of the orders
+    watched, as they complete. Like as_completed(), an iteration covers
+    the orders pending and those finished since the previous iteration
+    started: each finished order is yielded by one iteration only. The
+    futures of the finished orders no iteration has covered yet are kept
+    until one does, or until the watcher is closed.
+    """
+
+    @property
+    def futures(self):
+
+        """The futures the next iteration would cover"""
+
+        with self._condition:
+            return self._futures_pending()
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS,
+            initial_delay=DEFAULT_INITIAL_DELAY, max_delay=DEFAULT_MAX_DELAY,
+            factor=DEFAULT_FACTOR, jitter=DEFAULT_JITTER,
+            max_errors=DEFAULT_MAX_ERRORS, pending=PENDING_STATUSES):
+        self._closed = False
+        self._condition = Condition()
+        self._factor = factor
+        self._finished = []
+        self._initial_delay = initial_delay
+        self._jitter = jitter
+        self._max_delay = max_delay
+        self._max_errors = max_errors
+        self._pending = tuple(pending)
+        self._pool = ThreadPoolExecutor(max_workers)
+        self._queue = []
+        self._sequence = count()
+        self._thread = None
+        self._watches = {}
+
+    def __aiter__(self):
+        # Outside a coroutine this raises before the futures are claimed
+        return _Completions(asyncio.get_running_loop(), self._claim())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self._watches)
+
+    def _claim(self):
+
+        """The futures to iterate over, marked as covered"""
+
+        with self._condition:
+            futures = self._futures_pending()
+            for watch in self._watches.values():
+                watch.claimed = True
+            self._finished = []
+        return futures
+
+    def _delay(self, watch):
+        delay = watch.delay
+        watch.delay = min(self._max_delay, delay * self._factor)
+        return delay * (1 - self._jitter * random())
+
+    def _finish(self, watch, result=None, error=None):
+        with self._condition:
+            # Cancelled by close()
+            if self._watches.pop(watch.key, None) is None:
+                return
+            if not watch.claimed:
+                self._finished.append(watch.future)
+        if error is None:
+            watch.future.set_result(result)
+        else:
+            watch.future.set_exception(error)
+
+    def _futures_pending(self):
+        return [watch.future for watch in self._watches.values()] + \
+            self._finished
+
+    def _poll(self, watch):
+
+        resource = watch.resource
+        fresh = type(resource)(resource._parent, resource.client)
+        fresh.id = resource.id
+
+        try:
+            if watch.budget is None:
+                result = fresh.get()
+            else:
+                with watch.budget:
+                    result = fresh.get()
+        except DeadlineExceeded as error:
+            self._finish(watch, error=error)
+            return
+        except Exception as error:
+            watch.errors += 1
+            if watch.errors >= self._max_errors:
+                self._finish(watch, error=error)
+            else:
+                self._schedule(watch)
+            return
+
+        watch.errors = 0
+
+        if order_status(result) not in watch.pending:
+            self._finish(watch, result)
+        elif (watch.deadline is not None) and (time() >= watch.deadline):
+            self._finish(watch, error=watch.expired(
+                "Order {} still {}".format(resource.id, order_status(result))))
+        else:
+            self._schedule(watch)
+
+    def _run(self):
+        with self._condition:
+            while not self._closed:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                wait = self._queue[0][0] - time()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                self._pool.submit(self._poll, heappop(self._queue)[2])
+
+    def _schedule(self, watch):
+        with self._condition:
+            if self._closed:
+                return
+            due = time() + self._delay(watch)
+            if watch.deadline is not None:
+                due = min(due, watch.deadline)
+            heappush(self._queue, (due, next(self._sequence), watch))
+            self._condition.notify()
+
+    def as_completed(self, timeout=None):
+
+        """
+        Iterates over the futures of the orders pending and of those
+        finished since the previous iteration, as they complete.
+        """
+
+        return as_completed(self._claim(), timeout)
+
+    def close(self):
+
+        """Stops polling, cancelling the futures of the orders pending"""
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            watches = list(self._watches.values())
+            self._watches.clear()
+            self._finished = []
+        for watch in watches:
+            watch.future.cancel()
+        self._pool.shutdown()
+
+    def watch(self, resource, callback=None, pending=None, timeout=None):
+
+        """
+        Starts polling the saved order "resource".
+
+        Returns a concurrent.futures.Future of the last get() result, also
+        passed to "callback(future)" when the status leaves "pending",
+        the watcher's pending statuses by default. The future fails with a
+        TimeoutError if still pending after "timeout" seconds. Watched in
+        the "with" block of a Deadline (see utils.deadline), the order is
+        polled within it and the future fails with DeadlineExceeded once it
+        has passed.
+        """
+
+        if getattr(type(resource.client), "_async", False):
+            raise TypeError("OrderWatcher requires a synchronous Client")
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("OrderWatcher is closed")
+            key = (type(resource), resource.get_xpath())
+            watch = self._watches.get(key)
+            if watch is None:
+                budget = current_deadline()
+                deadline = (None if timeout is None else time() + timeout)
+                expired = TimeoutError
+                if (budget is not None) and (budget.expires is not None):
+                    expires = time() + budget.remaining()
+                    if (deadline is None) or (expires < deadline):
+                        deadline = expires
+                        expired = DeadlineExceeded
+                watch = _Watch(key, resource,
+                    (self._pending if pending is None else tuple(pending)),
+                    deadline, self._initial_delay, budget, expired)
+                self._watches[key] = watch
+                self._schedule(watch)
+                if self._thread is None:
+                    self._thread = Thread(target=self._run)
+                    self._thread.daemon = True
+                    self._thread.start()
+
+        if callback is not None:
+            watch.future.add_done_callback(callback)
+
+        return watch.future
@@ -8,15 +8,21 @@ setup(
     maintainer       = "Bandwidth",
     url              = "https://github.com/scottbarstow/iris-python",
     license          = "MIT",
-    packages         = find_packages(),
+    packages         = find_packages(exclude=("benchmarks", "benchmarks.*",
+        "tests", "tests.*")),
     long_description = "Python client library for IRIS / BBS API",
     classifiers = [
-        "Programming Language :: Python :: 2.7",
-        "Programming Language :: Python :: 3.3",
-        "Programming Language :: Python :: 3.4",
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
+        "Programming Language :: Python :: 3.7",
     ],
+    python_requires=">=3.7",
     install_requires=[
         "future",
         "requests",
-    ]
+    ],
+    extras_require={
+        "async": ["aiohttp"],
+        "lxml": ["lxml"],
+    }
 )
\ No newline at end of file
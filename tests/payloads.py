@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+
+"""Synthetic Iris API payloads of arbitrary size"""
+
+FIRST_TN = 2012000000
+
+XML_DECLARATION = b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+
+XML_TN = (
+    "<TelephoneNumber><City>JERSEY CITY</City><Lata>224</Lata>"
+    "<State>NJ</State><FullNumber>{}</FullNumber><Tier>0</Tier>"
+    "<VendorId>49</VendorId><VendorName>Bandwidth CLEC</VendorName>"
+    "<RateCenter>JERSEYCITY</RateCenter><Status>Inservice</Status>"
+    "<AccountId>9500249</AccountId>"
+    "<LastModified>2015-07-14T13:53:58.000Z</LastModified>"
+    "</TelephoneNumber>"
+)
+
+XML_ORDER_SUMMARY = (
+    "<OrderIdUserIdDate><CountOfTNs>1</CountOfTNs>"
+    "<CustomerOrderId>{0}</CustomerOrderId><userId>byo_dev</userId>"
+    "<lastModifiedDate>2015-06-13T16:14:46.017Z</lastModifiedDate>"
+    "<OrderDate>2015-06-13T16:14:45.956Z</OrderDate>"
+    "<OrderType>new_number</OrderType>"
+    "<orderId>00000000-0000-4000-8000-{0:012d}</orderId>"
+    "<OrderStatus>COMPLETE</OrderStatus></OrderIdUserIdDate>"
+)
+
+XML_PORTIN_SUMMARY = (
+    "<lnpPortInfoForGivenStatus><CountOfTNs>1</CountOfTNs>"
+    "<userId>byo_dev</userId>"
+    "<lastModifiedDate>2015-06-03T15:10:13.384Z</lastModifiedDate>"
+    "<OrderDate>2015-06-03T15:10:12.808Z</OrderDate>"
+    "<OrderId>00000000-0000-4000-9000-{0:012d}</OrderId>"
+    "<OrderType>port_in</OrderType>"
+    "<BillingTelephoneNumber>{1}</BillingTelephoneNumber>"
+    "<LNPLosingCarrierId>1537</LNPLosingCarrierId>"
+    "<LNPLosingCarrierName>Test Losing Carrier L3</LNPLosingCarrierName>"
+    "<ProcessingStatus>SUBMITTED</ProcessingStatus>"
+    "<RequestedFOCDate>2015-06-03T15:30:00.000Z</RequestedFOCDate>"
+    "<VendorId>49</VendorId><VendorName>Bandwidth CLEC</VendorName>"
+    "<PON>BWC1433343996123</PON></lnpPortInfoForGivenStatus>"
+)
+
+XML_TN_DETAIL = (
+    "<TelephoneNumberDetail><City>ALLENTOWN</City><LATA>222</LATA>"
+    "<RateCenter>ALLENTOWN</RateCenter><State>NJ</State>"
+    "<FullNumber>{}</FullNumber><Tier>0</Tier><VendorId>49</VendorId>"
+    "<VendorName>Bandwidth CLEC</VendorName></TelephoneNumberDetail>"
+)
+
+def numbers(count, start=0):
+    return range(FIRST_TN + start, FIRST_TN + start + count)
+
+def in_service_numbers(count, start=0, next_page=None, total=None):
+
+    """"TNs" document of an /inserviceNumbers page"""
+
+    return b"".join([XML_DECLARATION,
+        b"<TNs><TotalCount>", str(total or count).encode(), b"</TotalCount>",
+        _links(next_page), b"<TelephoneNumbers><Count>",
+        str(count).encode(), b"</Count>",
+        "".join("<TelephoneNumber>{}</TelephoneNumber>".format(tn)
+            for tn in numbers(count, start)).encode(),
+        b"</TelephoneNumbers></TNs>"])
+
+def search_result(count, detail=False):
+
+    """"SearchResult" document of an /availableNumbers search"""
+
+    if detail:
+        items = [b"<TelephoneNumberDetailList>",
+            "".join(XML_TN_DETAIL.format(tn) for tn in numbers(count)).encode(),
+            b"</TelephoneNumberDetailList>"]
+    else:
+        items = [b"<TelephoneNumberList>",
+            "".join("<TelephoneNumber>{}</TelephoneNumber>".format(tn)
+                for tn in numbers(count)).encode(),
+            b"</TelephoneNumberList>"]
+    return b"".join([XML_DECLARATION, b"<SearchResult><ResultCount>",
+        str(count).encode(), b"</ResultCount>"] + items + [b"</SearchResult>"])
+
+def tns(count, start=0, next_page=None, total=None):
+
+    """"TelephoneNumbersResponse" document of a /tns page"""
+
+    return b"".join([XML_DECLARATION,
+        b"<TelephoneNumbersResponse><TelephoneNumberCount>",
+        str(total or count).encode(), b"</TelephoneNumberCount>",
+        _links(next_page), b"<TelephoneNumbers>",
+        "".join(XML_TN.format(tn) for tn in numbers(count, start)).encode(),
+        b"</TelephoneNumbers></TelephoneNumbersResponse>"])
+
+def _links(next_page):
+    if next_page is None:
+        return b"<Links></Links>"
+    return ("<Links><next>Link=&lt;http://localhost/api?page={}&gt;;"
+        "rel=\"next\";</next></Links>".format(next_page)).encode()
+
+def order_response(count=10):
+
+    """"OrderResponse" of an existing numbers order"""
+
+    return b"".join([XML_DECLARATION,
+        b"<OrderResponse><Order><CustomerOrderId>123456789</CustomerOrderId>"
+        b"<Name>Available Telephone Number order</Name>"
+        b"<OrderCreateDate>2015-06-20T10:54:08.042Z</OrderCreateDate>"
+        b"<BackOrderRequested>false</BackOrderRequested>"
+        b"<id>f30a31a1-1de4-4939-b094-4521bbe5c8df</id>"
+        b"<ExistingTelephoneNumberOrderType><TelephoneNumberList>",
+        "".join("<TelephoneNumber>{}</TelephoneNumber>".format(tn)
+            for tn in numbers(count)).encode(),
+        b"</TelephoneNumberList></ExistingTelephoneNumberOrderType>"
+        b"<PartialAllowed>true</PartialAllowed><SiteId>2297</SiteId></Order>"
+        b"<OrderStatus>RECEIVED</OrderStatus></OrderResponse>"])
+
+def portin(count=10):
+
+    """"LnpOrderResponse" of a port-in"""
+
+    return b"".join([XML_DECLARATION,
+        b"<LnpOrderResponse>"
+        b"<OrderId>d28b36f7-fa96-49eb-9556-a40fca49f7c6</OrderId><Status>"
+        b"<Code>201</Code><Description></Description></Status>"
+        b"<ProcessingStatus>PENDING_DOCUMENTS</ProcessingStatus>"
+        b"<LoaAuthorizingPerson>John Doe</LoaAuthorizingPerson><Subscriber>"
+        b"<SubscriberType>BUSINESS</SubscriberType>"
+        b"<BusinessName>Acme Corporation</BusinessName><ServiceAddress>"
+        b"<HouseNumber>1623</HouseNumber>"
+        b"<StreetName>Brockton Ave #1</StreetName><City>Los Angeles</City>"
+        b"<StateCode>CA</StateCode><Zip>90025</Zip><Country>USA</Country>"
+        b"</ServiceAddress></Subscriber>"
+        b"<BillingTelephoneNumber>6882015002</BillingTelephoneNumber>"
+        b"<ListOfPhoneNumbers>",
+        "".join("<PhoneNumber>{}</PhoneNumber>".format(tn)
+            for tn in numbers(count)).encode(),
+        b"</ListOfPhoneNumbers><Triggered>false</Triggered>"
+        b"<BillingType>PORTIN</BillingType></LnpOrderResponse>"])
+
+def telephone_number():
+
+    """"TelephoneNumberResponse" with the number details"""
+
+    return (XML_DECLARATION +
+        b"<TelephoneNumberResponse><TelephoneNumberDetails>"
+        b"<City>JERSEY CITY</City><Lata>224</Lata><State>NJ</State>"
+        b"<FullNumber>2018981023</FullNumber><Tier>0</Tier>"
+        b"<VendorId>49</VendorId><VendorName>Bandwidth CLEC</VendorName>"
+        b"<RateCenter>JERSEYCITY</RateCenter><Status>Inservice</Status>"
+        b"<AccountId>14</AccountId>"
+        b"<LastModified>2014-07-30T11:29:37.000Z</LastModified><Features>"
+        b"<Lidb><Status>Pending</Status>"
+        b"<SubscriberInformation>Fred</SubscriberInformation>"
+        b"<UseType>BUSINESS</UseType><Visibility>PUBLIC</Visibility>"
+        b"</Lidb></Features></TelephoneNumberDetails>"
+        b"</TelephoneNumberResponse>")
+
+def account(account_id=9500249):
+
+    """"AccountResponse" of an account"""
+
+    return b"".join([XML_DECLARATION,
+        b"<AccountResponse><Account><AccountId>", str(account_id).encode(),
+        b"</AccountId><CompanyName>Spam</CompanyName>"
+        b"<AccountType>Business</AccountType><Tiers><Tier>0</Tier></Tiers>"
+        b"<Address><HouseNumber>900</HouseNumber>"
+        b"<StreetName>Main Campus Dr</StreetName><City>Raleigh</City>"
+        b"<StateCode>NC</StateCode><Zip>27606</Zip><Country>USA</Country>"
+        b"</Address><Contact><FirstName>Eggs</FirstName>"
+        b"<LastName>Ham</LastName><Phone>9195551234</Phone>"
+        b"<Email>spam@example.com</Email></Contact></Account>"
+        b"</AccountResponse>"])
+
+def lnpchecker(checked):
+
+    """"NumberPortabilityResponse" for the numbers checked"""
+
+    tn_list = "".join("<Tn>{}</Tn>".format(tn) for tn in checked).encode()
+    return b"".join([XML_DECLARATION,
+        b"<NumberPortabilityResponse><PortableNumbers>", tn_list,
+        b"</PortableNumbers><SupportedRateCenters><RateCenterGroup>"
+        b"<RateCenter>JERSEYCITY</RateCenter><City>JERSEY CITY</City>"
+        b"<State>NJ</State><LATA>224</LATA><TnList>", tn_list,
+        b"</TnList></RateCenterGroup></SupportedRateCenters>"
+        b"<SupportedLosingCarriers><LosingCarrierTnList>"
+        b"<LosingCarrierSPID>9998</LosingCarrierSPID>"
+        b"<LosingCarrierName>Carrier L3</LosingCarrierName><TnList>", tn_list,
+        b"</TnList></LosingCarrierTnList></SupportedLosingCarriers>"
+        b"</NumberPortabilityResponse>"])
+
+def orders(count, start=0, next_page=None, total=None):
+
+    """"ResponseSelectWrapper" document of an /orders page"""
+
+    return b"".join([XML_DECLARATION,
+        b"<ResponseSelectWrapper><ListOrderIdUserIdDate><TotalCount>",
+        str(total or count).encode(), b"</TotalCount>", _links(next_page),
+        "".join(XML_ORDER_SUMMARY.format(pos)
+            for pos in range(start, start + count)).encode(),
+        b"</ListOrderIdUserIdDate></ResponseSelectWrapper>"])
+
+def portins(count, start=0, next_page=None, total=None):
+
+    """"LNPResponseWrapper" document of a /portins page"""
+
+    return b"".join([XML_DECLARATION,
+        b"<LNPResponseWrapper><TotalCount>", str(total or count).encode(),
+        b"</TotalCount>", _links(next_page),
+        "".join(XML_PORTIN_SUMMARY.format(pos, tn) for pos, tn in
+            zip(range(start, start + count), numbers(count, start))).encode(),
+        b"</LNPResponseWrapper>"])
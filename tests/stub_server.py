@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+"""
+Local stand-in for the Iris API used by the tests and benchmarks.
+
+Routes map a path prefix to a callable taking (method, path, query, body)
+and returning (status, body) or (status, body, headers), or None to drop the
+connection without answering. Unknown paths get a 404.
+"""
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from threading import Thread
+from urllib.parse import parse_qs, urlparse
+
+CONTENT_TYPE = "application/xml"
+HOST = "127.0.0.1"
+XML_TN_GET = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<TelephoneNumberResponse><TelephoneNumber>7576768750</TelephoneNumber>"
+    b"<Status>Inservice</Status><SiteId>2297</SiteId>"
+    b"<AccountId>9500249</AccountId></TelephoneNumberResponse>"
+)
+
+def faults(route, script):
+
+    """
+    Wraps "route" to fail the first requests: every item of "script" is
+    the response to a request - a status, a (status, headers) tuple or None
+    to drop the connection - then "route" answers the rest.
+    """
+
+    script = list(script)
+
+    def faulty(method, path, query, body):
+        if not script:
+            return route(method, path, query, body)
+        fault = script.pop(0)
+        if fault is None:
+            return None
+        if isinstance(fault, tuple):
+            return fault[0], b"", fault[1]
+        return fault, b""
+
+    return faulty
+
+def tn_get(method, path, query, body):
+    return 200, XML_TN_GET
+
+class _ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+class _Handler(BaseHTTPRequestHandler):
+
+    # Keep-alive
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _handle(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get("content-length") or 0)
+        body = (self.rfile.read(length) if length else b"")
+        response = (404, b"")
+        for prefix, route in self.server.routes:
+            if url.path.startswith(prefix):
+                response = route(self.command, url.path,
+                    parse_qs(url.query), body)
+                break
+        if response is None:
+            self.close_connection = True
+            return
+        status, content = response[:2]
+        self.send_response(status)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (response[2] if len(response) > 2 else {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_DELETE = do_GET = do_POST = do_PUT = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+class StubServer(object):
+
+    """Threaded HTTP server running in the background"""
+
+    @property
+    def url(self):
+        return "http://{}:{}/api".format(HOST, self._server.server_port)
+
+    def __init__(self, routes=None):
+        self._server = _ThreadingServer((HOST, 0), _Handler)
+        # Longest prefixes first
+        self._server.routes = sorted((routes or {}).items(),
+            key=lambda route: -len(route[0]))
+        self._thread = Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def route(self, prefix, route):
+
+        """Adds or replaces the route of a path prefix"""
+
+        routes = dict(self._server.routes)
+        routes[prefix] = route
+        self._server.routes = sorted(routes.items(),
+            key=lambda route: -len(route[0]))
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
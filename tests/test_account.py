@@ -12,6 +12,8 @@ from unittest import main, TestCase
 import requests
 import requests_mock
 
+from xml.etree.ElementTree import fromstring
+
 from iris_sdk.client import Client
 from iris_sdk.models.account import Account
 from iris_sdk.utils.rest import RestError
@@ -220,6 +222,36 @@ XML_RESPONSE_LNP_CHECKER = (
     b"</NumberPortabilityResponse>"
 )
 
+XML_RESPONSE_LNP_CHECKER_CHUNK = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\"?>"
+    "<NumberPortabilityResponse>"
+    "    <PortableNumbers>{0}</PortableNumbers>"
+    "    <SupportedRateCenters>"
+    "        <RateCenterGroup>"
+    "            <RateCenter>BALTIMORE</RateCenter>"
+    "            <City>BALTIMORE</City>"
+    "            <State>MD</State>"
+    "            <LATA>238</LATA>"
+    "            <TnList>{0}</TnList>"
+    "        </RateCenterGroup>"
+    "    </SupportedRateCenters>"
+    "    <SupportedLosingCarriers>"
+    "        <LosingCarrierTnList>"
+    "            <LosingCarrierSPID>{1}</LosingCarrierSPID>"
+    "            <LosingCarrierName>Carrier {1}</LosingCarrierName>"
+    "            <TnList>{0}</TnList>"
+    "        </LosingCarrierTnList>"
+    "    </SupportedLosingCarriers>"
+    "</NumberPortabilityResponse>"
+)
+
+XML_RESPONSE_LNP_CHECKER_ERROR = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\"?>"
+    b"<NumberPortabilityResponse><Errors><Code>7529</Code>"
+    b"<Description>Invalid number</Description></Errors>"
+    b"</NumberPortabilityResponse>"
+)
+
 XML_RESPONSE_TN_RESERVATION_GET = (
     b"<?xml version=\"1.0\"?>"
     b"<ReservationResponse>"
@@ -268,6 +300,28 @@ class ClassAccountTest(TestCase):
             self.assertEqual(self._account.address.house_number, "900")
             self.assertEqual(self._account.contact.first_name, "Eggs")
 
+    def test_account_sub_resources(self):
+
+        account = Account(client=self._client)
+
+        self.assertNotIn("_orders", vars(account))
+
+        orders = account.orders
+        self.assertIs(account.orders, orders)
+        self.assertIs(account._orders, orders)
+        self.assertIs(account._portins, account.portins)
+        self.assertIs(orders.client, self._client)
+        self.assertEqual(orders.get_xpath(), "/accounts/bar/orders")
+
+        with self.assertRaises(AttributeError):
+            account.orders = None
+        with self.assertRaises(AttributeError):
+            account._foo
+
+        account = Account(client=self._client)
+        account.clear()
+        self.assertNotIn("_orders", vars(account))
+
     def test_available_numbers(self):
 
         with requests_mock.Mocker() as m:
@@ -428,6 +482,52 @@ class ClassAccountTest(TestCase):
             self.assertEqual(grp.tn_list.tn.items,
                 ["4109255199","4104685864","4103431313","4103431561"])
 
+    def test_lnpchecker_bulk(self):
+
+        def check(request, context):
+            numbers = fromstring(request.body).findall("TnList/Tn")
+            if numbers[0].text == "4109255105":
+                context.status_code = 400
+                return XML_RESPONSE_LNP_CHECKER_ERROR
+            # Different losing carriers for the numbers of the last chunk
+            return XML_RESPONSE_LNP_CHECKER_CHUNK.format("".join(
+                "<Tn>{}</Tn>".format(tn.text) for tn in numbers),
+                (9997 if numbers[0].text == "4109255110" else 9998)).encode()
+
+        numbers = [str(number) for number in range(4109255100, 4109255112)]
+
+        with requests_mock.Mocker() as m:
+
+            url = self._account.client.config.url +\
+                self._account.lnpchecker.get_xpath(True)
+            m.post(url, content=check)
+
+            response = self._account.lnpchecker.bulk(numbers, chunk_size=5,
+                max_workers=2)
+
+            self.assertEqual(m.call_count, 3)
+
+        self.assertEqual(response.portable_numbers.items,
+            numbers[:5] + numbers[10:])
+
+        groups = response.supported_rate_centers.items
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(groups[0].rate_center, "BALTIMORE")
+        self.assertEqual(groups[0].tn_list.items, numbers[:5] + numbers[10:])
+
+        carriers = response.losing_carriers
+        self.assertEqual([(carrier.losing_carrier_name, carrier.tn_list.items)
+            for carrier in carriers], [("Carrier 9998", numbers[:5]),
+            ("Carrier 9997", numbers[10:])])
+        self.assertIs(
+            response.supported_losing_carriers.losing_carrier_tn_list,
+            carriers[0])
+
+        self.assertEqual(len(response.errors), 1)
+        self.assertEqual(response.errors[0].index, 1)
+        self.assertEqual(response.errors[0].item, numbers[5:10])
+        self.assertIsInstance(response.errors[0].error, RestError)
+
     def test_npa_nxx(self):
 
         with requests_mock.Mocker() as m:
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+# For coverage.
+if __package__ is None:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+from unittest import main, skipIf, TestCase
+from unittest.mock import patch
+
+import asyncio
+
+from requests.exceptions import Timeout
+from requests.models import Response
+
+try:
+    import aiohttp
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:
+    aiohttp = None
+
+from iris_sdk.async_client import AsyncClient
+from iris_sdk.models.account import Account
+from iris_sdk.models.portin import PortIn
+from iris_sdk.models.tns import Tns
+from iris_sdk.utils.cache import ResponseCache
+from iris_sdk.utils.deadline import Deadline, DeadlineExceeded
+from iris_sdk.utils.instrumentation import Collector
+from iris_sdk.utils.policy import RequestPolicy
+from iris_sdk.utils.rest import RestError
+
+XML_RESPONSE_ERROR = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<TelephoneNumbersResponse><ErrorList><Error><Code>5005</Code>"
+    b"<Description>Bad page size</Description></Error></ErrorList>"
+    b"</TelephoneNumbersResponse>"
+)
+
+XML_RESPONSE_ORDER_GET = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<OrderResponse><Order><Name>Available Telephone Number order</Name>"
+    b"<id>f30a31a1-1de4-4939-b094-4521bbe5c8df</id><SiteId>2297</SiteId>"
+    b"</Order><OrderStatus>RECEIVED</OrderStatus></OrderResponse>"
+)
+
+XML_RESPONSE_TN_LIST = (
+    b"<TelephoneNumbersResponse>"
+    b"<TelephoneNumberCount>2</TelephoneNumberCount><TelephoneNumbers>"
+    b"<TelephoneNumber><FullNumber>4109235436</FullNumber>"
+    b"<Status>PortInPendingFoc</Status></TelephoneNumber>"
+    b"<TelephoneNumber><FullNumber>4109235437</FullNumber>"
+    b"<Status>PortInPendingFoc</Status></TelephoneNumber>"
+    b"</TelephoneNumbers></TelephoneNumbersResponse>"
+)
+
+XML_RESPONSE_TN_LIST_PAGE_1 = (
+    b"<TelephoneNumbersResponse><Links>"
+    b"<next>Link=&lt;http://foo/tns?page=4109235437&amp;size=1&gt;;"
+    b"rel=\"next\";</next></Links><TelephoneNumbers><TelephoneNumber>"
+    b"<FullNumber>4109235436</FullNumber></TelephoneNumber>"
+    b"</TelephoneNumbers></TelephoneNumbersResponse>"
+)
+
+def response_stub(content, status_code=200):
+    response = Response()
+    response._content = content
+    response._content_consumed = True
+    response.status_code = status_code
+    return response
+
+@skipIf(aiohttp is None, "aiohttp is not installed")
+class ClassAsyncClientTest(TestCase):
+
+    """Test asyncio requests"""
+
+    def setUp(self):
+        self._client = AsyncClient("http://foo", "bar", "baz", "qux")
+        self.addCleanup(patch.stopall)
+
+    def test_async_client_request(self):
+        send = patch("iris_sdk.utils.async_rest.AsyncRestClient._send",
+            return_value=response_stub(b"foo")).start()
+        response = asyncio.run(self._client.get("/tns", {"page": 1}))
+        self.assertEqual(response.content, b"foo")
+        send.assert_called_once_with("GET", "http://foo/tns", ("baz", "qux"),
+            {"page": 1}, None, {"content-type": "application/xml"}, None)
+
+    def test_async_client_list(self):
+        patch("iris_sdk.utils.async_rest.AsyncRestClient._send",
+            return_value=response_stub(XML_RESPONSE_TN_LIST)).start()
+        tns = Tns(client=self._client)
+        items = asyncio.run(tns.list({"page": 1, "size": 10})).items
+        self.assertEqual(len(items), 2)
+        self.assertEqual(items[0].full_number, "4109235436")
+
+    def test_async_client_iter_all(self):
+
+        def send(method, url, auth, params, data, headers, timeout):
+            if params["page"] == 1:
+                return response_stub(XML_RESPONSE_TN_LIST_PAGE_1)
+            return response_stub(XML_RESPONSE_TN_LIST)
+
+        send = patch("iris_sdk.utils.async_rest.AsyncRestClient._send",
+            side_effect=send).start()
+        tns = Tns(client=self._client)
+
+        async def run(prefetch):
+            return [tn.full_number async for tn in
+                tns.iter_all({"page": 1, "size": 1}, prefetch)]
+
+        for prefetch in (False, True):
+            self.assertEqual(asyncio.run(run(prefetch)),
+                ["4109235436", "4109235436", "4109235437"])
+        self.assertEqual(send.call_args[0][3]["page"], "4109235437")
+
+    def test_async_client_nested(self):
+        send = patch("iris_sdk.utils.async_rest.AsyncRestClient._send",
+            return_value=response_stub(XML_RESPONSE_ORDER_GET)).start()
+        account = Account(client=self._client)
+        order = asyncio.run(account.orders.get(
+            "f30a31a1-1de4-4939-b094-4521bbe5c8df"))
+        self.assertEqual(order.id, "f30a31a1-1de4-4939-b094-4521bbe5c8df")
+        self.assertEqual(order.order_status, "RECEIVED")
+        self.assertEqual(send.call_count, 1)
+        self.assertEqual(send.call_args[0][1], "http://foo/accounts/bar"
+            "/orders/f30a31a1-1de4-4939-b094-4521bbe5c8df")
+
+    def test_async_client_run(self):
+
+        send = patch("iris_sdk.utils.async_rest.AsyncRestClient._send",
+            side_effect=[response_stub(XML_RESPONSE_ERROR, 400),
+                response_stub(XML_RESPONSE_TN_LIST)]).start()
+        runs = []
+
+        def fetch():
+            # Runs once, the requests don't leave it through its handlers
+            runs.append(1)
+            tns = Tns(client=self._client)
+            try:
+                tns.list({"page": 1})
+            except Exception as error:
+                runs.append(type(error))
+            return tns.list({"page": 2}).items
+
+        items = asyncio.run(self._client.run(fetch))
+        self.assertEqual([item.full_number for item in items],
+            ["4109235436", "4109235437"])
+        self.assertEqual(runs, [1, RestError])
+        self.assertEqual([call[0][3]["page"] for call in send.call_args_list],
+            [1, 2])
+
+    def test_async_client_settings(self):
+
+        send = patch("iris_sdk.utils.async_rest.AsyncRestClient._send",
+            side_effect=[response_stub(b"", 503),
+                response_stub(XML_RESPONSE_TN_LIST)]).start()
+        sleep = patch("iris_sdk.utils.policy.sleep").start()
+        collector = Collector()
+        client = AsyncClient("http://foo", "bar", "baz", "qux",
+            cache=ResponseCache(ttls={"/tns": 60}), policy=RequestPolicy(),
+            instrumentation=collector, stateless=True, timeout=(3, 5))
+        tns = Tns(client=client)
+
+        async def run():
+            return [await tns.list({"page": 1}) for i in range(2)]
+
+        # Retried, then cached, into new objects
+        for result in asyncio.run(run()):
+            self.assertEqual(len(result.items), 2)
+            self.assertIsNot(result, tns)
+        self.assertEqual(len(tns.telephone_numbers.items), 0)
+        self.assertEqual(send.call_count, 2)
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(send.call_args[0][6], (3, 5))
+        self.assertEqual(collector.summary()[("/tns", "http")].count, 1)
+
+    def test_async_client_timeout(self):
+
+        patch("iris_sdk.utils.async_rest.AsyncRestClient._send",
+            side_effect=asyncio.TimeoutError()).start()
+        tns = Tns(client=self._client)
+
+        with self.assertRaises(Timeout):
+            asyncio.run(tns.list({"page": 1}))
+
+        async def run():
+            with Deadline(0):
+                await tns.list({"page": 1})
+
+        with self.assertRaises(DeadlineExceeded):
+            asyncio.run(run())
+
+    def test_async_client_loa_upload(self):
+
+        def send(method, url, auth, params, data, headers, timeout):
+            # The file must still be readable when the request is sent
+            uploads.append((method, url, data.read()))
+            response = response_stub(b"")
+            response.headers["location"] = url + "/fname.pdf"
+            return response
+
+        uploads = []
+        patch("iris_sdk.utils.async_rest.AsyncRestClient._send",
+            side_effect=send).start()
+        portin = PortIn(Account(client=self._client).portins)
+        portin.id = "1"
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+            "loa_upload.pdf")
+        with open(path, "wb") as file:
+            file.write(b"%PDF-1.4 foo")
+        self.addCleanup(os.remove, path)
+        headers = {"content-type": "application/pdf"}
+
+        for mmap in (False, True):
+            self.assertEqual(asyncio.run(portin.loas.create(path, headers,
+                mmap)), "fname.pdf")
+        self.assertTrue(asyncio.run(portin.loas.update("fname.pdf", path,
+            headers)))
+        url = "http://foo/accounts/bar/portins/1/loas"
+        self.assertEqual(uploads, [("POST", url, b"%PDF-1.4 foo")] * 2 +
+            [("PUT", url + "/fname.pdf", b"%PDF-1.4 foo")])
+
+        with self.assertRaises(TypeError):
+            portin.loas.create_all([path], headers)
+
+    def test_async_client_thread_helpers(self):
+
+        send = patch("iris_sdk.utils.async_rest.AsyncRestClient._send").start()
+        account = Account(client=self._client)
+
+        with self.assertRaises(TypeError):
+            account.lnpchecker.bulk(["4109255100", "4109255101"])
+        with self.assertRaises(TypeError):
+            account.orders.bulk({"name": "foo"}, ["4109255100"])
+        with self.assertRaises(TypeError):
+            Tns(client=self._client).enrich(["4109255100"])
+        self.assertFalse(send.called)
+
+    def test_async_client_concurrency(self):
+
+        state = {"active": 0, "peak": 0}
+
+        async def send(*args):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return response_stub(XML_RESPONSE_TN_LIST)
+
+        patch("iris_sdk.utils.async_rest.AsyncRestClient._send",
+            side_effect=send).start()
+        client = AsyncClient("http://foo", "bar", "baz", "qux",
+            max_concurrency=2)
+
+        async def run():
+            return await asyncio.gather(*[Tns(client=client).list({})
+                for i in range(6)])
+
+        results = asyncio.run(run())
+        self.assertEqual([len(result.items) for result in results], [2] * 6)
+        self.assertEqual(state["peak"], 2)
+
+    def test_async_client_error(self):
+
+        async def handler(request):
+            return web.Response(status=400, body=XML_RESPONSE_ERROR)
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/api/tns", handler)
+            async with TestServer(app) as server:
+                async with AsyncClient(str(server.make_url("/api")), "bar",
+                        "baz", "qux") as client:
+                    await Tns(client=client).list({"size": 0})
+
+        with self.assertRaisesRegex(RestError,
+                "5005 Iris error: Bad page size"):
+            asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ from future.builtins import super
 import os
 import sys
 
+from io import BytesIO
+
 # For coverage.
 if __package__ is None:
     sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
@@ -21,7 +23,8 @@ else:
 
 from xml.etree.ElementTree import Element, ElementTree, fromstring
 
-from iris_sdk.models.base_resource import BaseResource
+from iris_sdk.models.base_resource import BaseResource, \
+    BaseResourceList, BaseResourceSimpleList, binding
 from iris_sdk.models.maps.base_map import BaseMap
 
 class FooMap(BaseMap):
@@ -43,21 +46,19 @@ class Foo(BaseResource, FooMap):
 class Bar(BaseResource, BarMap):
     pass
 
+class CompiledFoo(Foo):
+    _compiled_xml = True
+
 class ClassBaseResourceInitTest(TestCase):
 
     """Test class initialization and properties"""
 
-    def setUp(self):
-        _patcher = patch("iris_sdk.utils.strings.Converter.__init__",
-            return_value=None)
-        self._converter = _patcher.start()
-        self.addCleanup(patch.stopall)
-
     def test_baseresource_init(self):
 
         self._base_resource = BaseResource("foo", "bar")
 
-        self._converter.assert_any_call()
+        self.assertIs(self._base_resource._converter,
+            BaseResource(client="baz")._converter)
         self.assertEqual(self._base_resource._parent, "foo")
         self.assertEqual(self._base_resource._client, "bar")
 
@@ -88,6 +89,29 @@ class ClassBaseResourceXmlTest(TestCase):
         self.assertEqual(self.foo.fred, "A")
         self.assertEqual(self.foo.qux_quux, "R")
 
+    def test_baseresource_from_xml_stream(self):
+
+        data = self.str.encode("UTF-8")
+        self.foo.clear()
+        self.foo._from_xml_stream(data[i:i+7] for i in range(0,len(data),7))
+
+        self.assertEqual(self.foo.barney, "B")
+        self.assertEqual(self.foo.fred, "A")
+        self.assertEqual(self.foo.qux_quux, "R")
+        self.assertEqual(self.foo.bar.eggs, "3")
+
+    def test_baseresource_binding(self):
+
+        self.assertIs(binding(Foo), binding(Foo))
+        self.assertEqual(binding(Foo).fields, [("bar", "Bar"),
+            ("barney", "Barney"), ("fred", "Fred"), ("qux_quux", "QuxQuux")])
+        self.assertEqual(binding(Foo).property("QuxQuux", self.foo),
+            ("qux_quux", True))
+        self.assertEqual(binding(Foo).property("Garply", self.foo),
+            ("garply", False))
+        self.assertTrue(binding(Bar).has_parent)
+        self.assertIsNone(binding(BaseResource).fields)
+
     def test_baseresource_to_xml(self):
 
         xml = self.foo._serialize()
@@ -97,5 +121,42 @@ class ClassBaseResourceXmlTest(TestCase):
 
         self.assertEqual(self.str, xml)
 
+    def test_baseresource_to_xml_compiled(self):
+
+        foo = CompiledFoo()
+        self.assertEqual(foo._serialize().decode("UTF-8"),
+            self.str.replace("Foo>", "CompiledFoo>"))
+
+        foo.fred = "<Fred> & \u00e9"
+        foo.barney = ""
+        foo.qux_quux = BaseResourceSimpleList()
+        foo.qux_quux.items.extend(["1", "", 3])
+        foo.bar = BaseResourceList(Bar)
+        foo.bar.add()
+        foo.bar.add().spam = None
+        bar = foo.bar.add()
+        bar.spam = bar.ham = bar.eggs = None
+
+        xml = foo._serialize()
+        self.assertEqual(xml, element_tree_xml(foo))
+        self.assertEqual(xml.decode("UTF-8"),
+            "<?xml version='1.0' encoding='UTF-8'?>\n<CompiledFoo><Bar>"
+            "<Eggs>3</Eggs><Ham>2</Ham><Spam>1</Spam></Bar><Bar><Eggs>3"
+            "</Eggs><Ham>2</Ham></Bar><Bar /><Barney /><Fred>&lt;Fred&gt; "
+            "&amp; \u00e9</Fred><QuxQuux>1</QuxQuux><QuxQuux /><QuxQuux>3"
+            "</QuxQuux></CompiledFoo>")
+
+        foo.bar = Bar()
+        foo.bar.spam = foo.bar.ham = foo.bar.eggs = None
+        foo.fred = foo.barney = foo.qux_quux = None
+        self.assertEqual(foo._serialize(), element_tree_xml(foo))
+        self.assertTrue(foo._serialize().endswith(b"\n<CompiledFoo />"))
+
+def element_tree_xml(resource):
+    data_io = BytesIO()
+    ElementTree(resource._to_xml()).write(data_io, encoding="UTF-8",
+        xml_declaration=True)
+    return data_io.getvalue()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+# For coverage.
+if __package__ is None:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import main, TestCase
+from unittest.mock import patch
+
+import requests_mock
+
+from iris_sdk.client import Client
+from iris_sdk.models.covered_rate_centers import CoveredRateCenters
+from iris_sdk.models.rate_centers import RateCenters
+from iris_sdk.models.tns import Tns
+from iris_sdk.utils.cache import CacheEntry, DiskCache, MemoryCache, \
+    ResponseCache
+
+XML_RESPONSE_RC_LIST = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<RateCenterResponse><ResultCount>1</ResultCount><RateCenters>"
+    b"<RateCenter><Abbreviation>AGOURA</Abbreviation><Name>AGOURA</Name>"
+    b"</RateCenter></RateCenters></RateCenterResponse>"
+)
+
+XML_RESPONSE_TN_LIST = (
+    b"<TelephoneNumbersResponse><TelephoneNumberCount>1"
+    b"</TelephoneNumberCount><TelephoneNumbers><TelephoneNumber>"
+    b"<FullNumber>4109235436</FullNumber></TelephoneNumber>"
+    b"</TelephoneNumbers></TelephoneNumbersResponse>"
+)
+
+def entry(url):
+    return CacheEntry(url, b"foo", {"ETag": "bar"}, 0)
+
+class ClassCacheBackendTest(TestCase):
+
+    """Test the cache backends"""
+
+    def setUp(self):
+        self._dir = mkdtemp()
+        self.addCleanup(rmtree, self._dir)
+
+    def test_disk_cache(self):
+
+        path = os.path.join(self._dir, "cache.db")
+        cache = DiskCache(path, maxsize=2)
+        cache.set("a", entry("http://a"))
+        self.assertEqual(cache.get("a"), entry("http://a"))
+
+        # Another process
+        self.assertEqual(DiskCache(path).get("a"), entry("http://a"))
+
+        with patch("iris_sdk.utils.cache.time", side_effect=range(10, 100)):
+            cache.set("b", entry("http://b"))
+            cache.get("a")
+            cache.set("c", entry("http://c"))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a").url, "http://a")
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_memory_cache(self):
+
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", entry("http://a"))
+        cache.set("b", entry("http://b"))
+        cache.get("a")
+        cache.set("c", entry("http://c"))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a").url, "http://a")
+
+class ClassResponseCacheTest(TestCase):
+
+    """Test caching client responses"""
+
+    def setUp(self):
+        self._cache = ResponseCache()
+        self._client = Client("http://foo", "bar", "baz", "qux",
+            cache=self._cache)
+
+    def test_cache_hit(self):
+
+        rc = RateCenters(client=self._client)
+
+        with requests_mock.Mocker() as m:
+
+            m.get("http://foo/ratecenters", content=XML_RESPONSE_RC_LIST)
+
+            for i in range(3):
+                self.assertEqual(rc.list({"state": "CA"}).items[0].name,
+                    "AGOURA")
+            rc.list({"state": "NJ"})
+
+            self.assertEqual(m.call_count, 2)
+            self.assertEqual(tuple(self._cache.info()), (2, 2, 0, 2))
+
+    def test_cache_not_cached(self):
+
+        tns = Tns(client=self._client)
+
+        with requests_mock.Mocker() as m:
+
+            m.get("http://foo/tns", content=XML_RESPONSE_TN_LIST)
+            tns.list({})
+            tns.list({})
+
+            self.assertEqual(m.call_count, 2)
+            self.assertEqual(tuple(self._cache.info()), (0, 0, 0, 0))
+
+    def test_cache_revalidate(self):
+
+        crc = CoveredRateCenters(client=self._client)
+        url = "http://foo/coveredratecenters"
+
+        with requests_mock.Mocker() as m:
+
+            m.get(url, content=XML_RESPONSE_RC_LIST,
+                headers={"ETag": "\"1\"", "Last-Modified": "Mon"})
+            crc.list({})
+
+            m.get(url, status_code=304)
+            with patch("iris_sdk.utils.cache.time", return_value=1e12):
+                crc.list({})
+
+            self.assertEqual(m.call_count, 2)
+            headers = m.request_history[1].headers
+            self.assertEqual(headers["If-None-Match"], "\"1\"")
+            self.assertEqual(headers["If-Modified-Since"], "Mon")
+            self.assertEqual(tuple(self._cache.info()), (0, 1, 1, 1))
+
+            # Changed
+            m.get(url, content=XML_RESPONSE_RC_LIST,
+                headers={"ETag": "\"2\""})
+            with patch("iris_sdk.utils.cache.time", return_value=1e13):
+                crc.list({})
+            with patch("iris_sdk.utils.cache.time", return_value=1e14):
+                crc.list({})
+            headers = m.request_history[3].headers
+            self.assertEqual(headers["If-None-Match"], "\"2\"")
+            self.assertNotIn("If-Modified-Since", headers)
+
+    def test_cache_stream(self):
+
+        client = Client("http://foo", "bar", "baz", "qux", stream=True,
+            cache=ResponseCache(ttls={"/ratecenters": 60}))
+        rc = RateCenters(client=client)
+
+        with requests_mock.Mocker() as m:
+
+            m.get("http://foo/ratecenters", content=XML_RESPONSE_RC_LIST)
+            for i in range(2):
+                self.assertEqual(rc.list({}).items[0].abbreviation, "AGOURA")
+
+            self.assertEqual(m.call_count, 1)
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,8 @@ else:
     from mock import patch, MagicMock, PropertyMock
 
 from iris_sdk.client import Client
+from iris_sdk.utils.rest import DEFAULT_POOL_BLOCK, DEFAULT_POOL_CONNECTIONS,\
+    DEFAULT_POOL_MAXSIZE
 
 class ClassClientInitTest(TestCase):
 
@@ -50,7 +52,21 @@ class ClassClientConfigTest(TestCase):
     def test_client_init(self, mock1, mock2):
         self._client = Client("foo", "bar", "baz", "qux", "quux")
         mock1.assert_called_once_with("foo", "bar", "baz", "qux", "quux")
-        mock2.assert_any_call()
+        mock2.assert_called_once_with(None, DEFAULT_POOL_CONNECTIONS,
+            DEFAULT_POOL_MAXSIZE, DEFAULT_POOL_BLOCK, None, None, None)
+
+    @patch("iris_sdk.utils.rest.RestClient.__init__", return_value = None)
+    @patch("iris_sdk.utils.config.Config.__init__", return_value = None)
+    def test_client_init_pool(self, mock1, mock2):
+        self._client = Client(session="foo", pool_connections=1,
+            pool_maxsize=2, pool_block=True)
+        mock2.assert_called_once_with("foo", 1, 2, True, None, None, None)
+
+    @patch("iris_sdk.utils.rest.RestClient.close")
+    def test_client_close(self, mock_close):
+        with Client("foo") as client:
+            self._client = client
+        mock_close.assert_called_once_with()
 
 class ClassClientStrings(TestCase):
 
@@ -81,6 +97,8 @@ class ClassClientRequests(TestCase):
     def setUp(self):
 
         patcher_req = patch("iris_sdk.utils.rest.RestClient.request")
+        patcher_account = patch("iris_sdk.utils.config.Config.account_id",
+            new_callable = PropertyMock, return_value = "qux")
         patcher_url = patch("iris_sdk.utils.config.Config.url",
             new_callable = PropertyMock, return_value = "foo")
         patcher_pass = patch("iris_sdk.utils.config.Config.password",
@@ -88,6 +106,7 @@ class ClassClientRequests(TestCase):
         patcher_user = patch("iris_sdk.utils.config.Config.username",
             new_callable = PropertyMock, return_value = "baz")
 
+        self._account = patcher_account.start()
         self._url = patcher_url.start()
         self._pass = patcher_pass.start()
         self._request = patcher_req.start()
@@ -118,21 +137,24 @@ class ClassClientRequests(TestCase):
         self._request.assert_called_once_with("DELETE",
             url="foo/qux",
             auth=(self._user.return_value, self._pass.return_value),
-            params=None, data=None, headers=None)
+            params=None, data=None, headers=None, stream=False,
+            key=self._account.return_value, timeout=None, deadline=None)
 
     def test_client_get(self):
         res = self._client.get("", "qux")
         self._request.assert_called_once_with("GET",
             url=self._url.return_value,
             auth=(self._user.return_value, self._pass.return_value),
-            params="qux", data=None, headers=None)
+            params="qux", data=None, headers=None, stream=False,
+            key=self._account.return_value, timeout=None, deadline=None)
 
     def test_client_post(self):
         res = self._client.post("", "qux", "quux")
         self._request.assert_called_once_with("POST",
             url=self._url.return_value,
             auth=(self._user.return_value, self._pass.return_value),
-            params="qux", data="quux", headers=None)
+            params="qux", data="quux", headers=None, stream=False,
+            key=self._account.return_value, timeout=None, deadline=None)
 
     def test_client_put(self):
         self._request.return_value.status_code = 200
@@ -140,7 +162,8 @@ class ClassClientRequests(TestCase):
         self._request.assert_called_once_with("PUT",
             url=self._url.return_value, 
             auth=(self._user.return_value, self._pass.return_value),
-            params="qux", data="quux", headers=None)
+            params="qux", data="quux", headers=None, stream=False,
+            key=self._account.return_value, timeout=None, deadline=None)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+# For coverage.
+if __package__ is None:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+from io import StringIO
+from unittest import main, TestCase
+
+import requests_mock
+
+from iris_sdk.client import Client
+from iris_sdk.models.account import Account
+from iris_sdk.models.tns import Tns
+from iris_sdk.utils.columns import CategoryColumn, ColumnSpec, \
+    COLUMN_CATEGORY, COLUMN_NUMBER, COLUMN_TEXT, CsvWriter, TnTable
+
+XML_RESPONSE_IN_SERVICE_NUMBERS = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<TNs><TotalCount>2</TotalCount><Links><first></first></Links>"
+    b"<TelephoneNumbers><Count>2</Count>"
+    b"<TelephoneNumber>8043024183</TelephoneNumber>"
+    b"<TelephoneNumber>8042121778</TelephoneNumber>"
+    b"</TelephoneNumbers></TNs>"
+)
+
+XML_RESPONSE_TNS_PAGE = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<TelephoneNumbersResponse><TelephoneNumberCount>3"
+    "</TelephoneNumberCount><Links>{}</Links><TelephoneNumbers>{}"
+    "</TelephoneNumbers></TelephoneNumbersResponse>"
+)
+
+XML_TN = (
+    "<TelephoneNumber><City>JERSEY CITY</City><Lata>224</Lata>"
+    "<State>NJ</State><FullNumber>{}</FullNumber><Tier>0</Tier>"
+    "<VendorId>49</VendorId><VendorName>Bandwidth CLEC</VendorName>"
+    "<RateCenter>JERSEYCITY</RateCenter><Status>{}</Status>"
+    "<AccountId>14</AccountId>"
+    "<LastModified>2015-07-14T13:53:58.000Z</LastModified>"
+    "</TelephoneNumber>"
+)
+
+XML_LINK_NEXT = (
+    "<next>&lt;https://api.inetwork.com:443/v1.0/tns?page=2&amp;size=2&gt;;"
+    "rel=\"next\";</next>"
+)
+
+TNS_PAGES = [
+    XML_RESPONSE_TNS_PAGE.format(XML_LINK_NEXT,
+        XML_TN.format("2012000000", "Inservice") +
+        XML_TN.format("2012000001", "Aging")).encode(),
+    XML_RESPONSE_TNS_PAGE.format("",
+        XML_TN.format("2012000002", "Inservice")).encode(),
+]
+
+class ClassExportTest(TestCase):
+
+    """Test exporting numbers into columns"""
+
+    def mock_tns(self, m):
+        m.get("http://foo/tns?size=2", content=TNS_PAGES[0])
+        m.get("http://foo/tns?page=2&size=2", content=TNS_PAGES[1])
+
+    def test_tns_export(self):
+
+        for stream in (False, True):
+
+            client = Client("http://foo", "bar", "baz", "qux", stream=stream)
+
+            with requests_mock.Mocker() as m:
+                self.mock_tns(m)
+                table = Tns(client=client).export({"size": 2})
+
+            self.assertEqual(len(table), 3)
+            self.assertEqual(list(table["full_number"].values),
+                [2012000000, 2012000001, 2012000002])
+            status = table["status"]
+            self.assertEqual(status.categories, [None, "Inservice", "Aging"])
+            self.assertEqual(list(status.codes), [1, 2, 1])
+            self.assertEqual(list(table.rows())[1], (2012000001, "Aging",
+                "JERSEYCITY", "NJ", "JERSEY CITY", "224", "0", "49",
+                "Bandwidth CLEC", "14"))
+
+    def test_tns_export_csv(self):
+
+        client = Client("http://foo", "bar", "baz", "qux")
+        columns = (ColumnSpec("number", "FullNumber", COLUMN_NUMBER),
+            ColumnSpec("status", "Status", COLUMN_CATEGORY),
+            ColumnSpec("modified", "LastModified", COLUMN_TEXT),
+            ColumnSpec("site", "SiteId", COLUMN_CATEGORY))
+        csv = StringIO()
+
+        with requests_mock.Mocker() as m:
+            self.mock_tns(m)
+            writer = Tns(client=client).export({"size": 2},
+                CsvWriter(csv, columns))
+
+            table = Tns(client=client).export({"size": 2}, TnTable(columns))
+
+        self.assertEqual(len(writer), 3)
+        self.assertEqual(csv.getvalue().splitlines(), [
+            "number,status,modified,site",
+            "2012000000,Inservice,2015-07-14T13:53:58.000Z,",
+            "2012000001,Aging,2015-07-14T13:53:58.000Z,",
+            "2012000002,Inservice,2015-07-14T13:53:58.000Z,"])
+
+        csv = StringIO()
+        table.to_csv(csv)
+        self.assertEqual(csv.getvalue().splitlines()[1:],
+            ["2012000000,Inservice,2015-07-14T13:53:58.000Z,",
+            "2012000001,Aging,2015-07-14T13:53:58.000Z,",
+            "2012000002,Inservice,2015-07-14T13:53:58.000Z,"])
+
+    def test_in_service_numbers_export(self):
+
+        for stream in (False, True):
+
+            client = Client("http://foo", "bar", "baz", "qux", stream=stream)
+            account = Account(client=client)
+
+            with requests_mock.Mocker() as m:
+                m.get("http://foo/accounts/bar/inserviceNumbers",
+                    content=XML_RESPONSE_IN_SERVICE_NUMBERS)
+                table = account.in_service_numbers.export()
+
+            self.assertEqual(list(table["full_number"].values),
+                [8043024183, 8042121778])
+            self.assertEqual(list(table.rows()),
+                [(8043024183,), (8042121778,)])
+
+    def test_category_column(self):
+
+        column = CategoryColumn(ColumnSpec("foo", "Foo", COLUMN_CATEGORY))
+        for value in range(70000):
+            column.append(str(value))
+        column.append(None)
+
+        self.assertEqual(column.codes.itemsize, 4)
+        self.assertEqual(column[69999], "69999")
+        self.assertEqual(column[70000], None)
+        self.assertEqual(len(column), 70001)
+
+if __name__ == "__main__":
+    main()
@@ -122,5 +122,30 @@ class ClassCoveredRateCentersTest(TestCase):
                 ["3105100","3105101","3109498","3109499","4242260"])
             self.assertEqual(item.id, "1")
 
+    def test_rate_centers_list_compact(self):
+
+        client = Client("http://foo", "bar", "bar", "qux", compact=True)
+        crc = CoveredRateCenters(client=client)
+
+        with requests_mock.Mocker() as m:
+
+            url = client.config.url + crc.get_xpath()
+            m.get(url, content=XML_RESPONSE_CRC_LIST_GET)
+
+            centers = crc.list({"page": 1, "size": 2})
+
+            first, second = centers.items
+
+            self.assertFalse(hasattr(first, "__dict__"))
+            self.assertEqual(first.name, "AVALON")
+            self.assertEqual(first.id, "1")
+            self.assertEqual(first.zip_codes.zip_code.items, ["90731"])
+            self.assertEqual(second.zip_codes.zip_code.items,
+                ["90013", "90014", "90015", "91504", "91505"])
+            self.assertEqual(second.cities.city.items[-1], "VAN NUYS")
+            self.assertEqual(second.npa_nxx_xs.npa_nxx_x.items[0], "3102010")
+            self.assertIs(first.state, second.state)
+            self.assertEqual(first.local_rate_centers.items, [])
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+# For coverage.
+if __package__ is None:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+from time import sleep
+from unittest import main, TestCase
+from unittest.mock import patch
+
+import requests_mock
+
+from requests.exceptions import HTTPError, ReadTimeout
+
+from iris_sdk.client import Client
+from iris_sdk.models.account import Account
+from iris_sdk.models.tns import Tns
+from iris_sdk.utils.deadline import current_deadline, Deadline, \
+    DeadlineExceeded
+from iris_sdk.utils.policy import RequestPolicy
+from iris_sdk.watcher import OrderWatcher
+from tests.stub_server import faults, StubServer, tn_get
+
+XML_ORDER_RESPONSE = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<OrderResponse><Order><id>1</id></Order>"
+    b"<OrderStatus>RECEIVED</OrderStatus></OrderResponse>"
+)
+
+XML_TN = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<TelephoneNumberResponse><TelephoneNumber>7576768750</TelephoneNumber>"
+    b"<Status>Inservice</Status></TelephoneNumberResponse>"
+)
+
+class ClassDeadlineTest(TestCase):
+
+    """Test request timeouts and deadlines"""
+
+    def setUp(self):
+        self._client = Client("http://foo", "bar", "baz", "qux",
+            timeout=(3, 30))
+
+    def get_timeout(self, func):
+        with requests_mock.Mocker() as m:
+            m.get("http://foo/tns/7576768750", content=XML_TN)
+            func()
+        return m.last_request.timeout
+
+    def test_client_timeout(self):
+
+        tns = Tns(client=self._client)
+
+        self.assertEqual(self._client.timeout, (3, 30))
+        self.assertEqual(self.get_timeout(lambda: tns.get("7576768750")),
+            (3, 30))
+        self.assertEqual(self.get_timeout(
+            lambda: self._client.get("tns/7576768750", timeout=5)), 5)
+
+        with Deadline(timeout=1):
+            self.assertEqual(self.get_timeout(lambda: tns.get("7576768750")),
+                1)
+
+    def test_deadline_timeout(self):
+
+        tns = Tns(client=self._client)
+
+        with Deadline(10):
+            connect, read = self.get_timeout(lambda: tns.get("7576768750"))
+            self.assertEqual(connect, 3)
+            self.assertTrue(9 < read <= 10)
+
+            # The earliest deadline applies
+            with Deadline(60, timeout=20):
+                timeout = self.get_timeout(lambda: tns.get("7576768750"))
+                self.assertTrue(9 < timeout <= 10)
+
+            with Deadline(1):
+                connect, read = self.get_timeout(
+                    lambda: tns.get("7576768750"))
+                self.assertTrue(connect <= 1)
+
+        self.assertIsNone(current_deadline())
+
+    def test_deadline_exceeded(self):
+
+        tns = Tns(client=self._client)
+
+        with requests_mock.Mocker() as m:
+            m.get("http://foo/tns/7576768750", content=XML_TN)
+            with Deadline(0):
+                with self.assertRaises(DeadlineExceeded):
+                    tns.get("7576768750")
+            self.assertFalse(m.called)
+
+        def timed_out(request, context):
+            sleep(0.05)
+            raise ReadTimeout()
+
+        with requests_mock.Mocker() as m:
+            m.get("http://foo/tns/7576768750", content=timed_out)
+            with Deadline(0.01):
+                with self.assertRaises(DeadlineExceeded):
+                    tns.get("7576768750")
+            with self.assertRaises(ReadTimeout):
+                tns.get("7576768750")
+
+    def test_enrich(self):
+
+        tns = Tns(client=self._client)
+
+        with requests_mock.Mocker() as m:
+            m.get("http://foo/tns/7576768750", content=XML_TN)
+            m.get("http://foo/tns/7576768750/tndetails",
+                content=XML_TN.replace(b"TelephoneNumberResponse",
+                b"TelephoneNumberDetails"))
+            with Deadline(10):
+                result, failures = tns.enrich(["7576768750"],
+                    resources=("tndetails",))
+            self.assertEqual(failures, [])
+            for request in m.request_history:
+                self.assertTrue(request.timeout[1] <= 10)
+
+        with Deadline(0):
+            result, failures = tns.enrich(["7576768750"])
+        self.assertIsInstance(failures[0].error, DeadlineExceeded)
+
+    def test_policy(self):
+
+        server = StubServer()
+        server.start()
+        self.addCleanup(server.stop)
+        server.route("/api/tns/7576768750", faults(tn_get, [503, 503]))
+        client = Client(server.url, 1, "foo", "bar",
+            policy=RequestPolicy(backoff=10))
+        self.addCleanup(client.close)
+
+        with patch("iris_sdk.utils.policy.sleep") as _sleep:
+            with Deadline(5):
+                with self.assertRaises(HTTPError):
+                    Tns(client=client).get("7576768750")
+            self.assertFalse(_sleep.called)
+
+    def test_watcher(self):
+
+        order = Account(client=self._client).orders.create(save=False)
+        order.id = "1"
+
+        with OrderWatcher(initial_delay=0.01, max_delay=0.02) as watcher:
+            with requests_mock.Mocker() as m:
+                m.get("http://foo/accounts/bar/orders/1",
+                    content=XML_ORDER_RESPONSE)
+                with Deadline(0.2):
+                    future = watcher.watch(order)
+                with self.assertRaises(DeadlineExceeded):
+                    future.result(5)
+            self.assertTrue(m.call_count > 1)
+            self.assertTrue(all(request.timeout[1] <= 0.2
+                for request in m.request_history))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+# For coverage.
+if __package__ is None:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+from unittest import main, skipIf, TestCase
+
+from requests import HTTPError
+
+import requests_mock
+
+from iris_sdk.client import Client
+from iris_sdk.models.account import Account
+from iris_sdk.models.tns import Tns
+from iris_sdk.utils.instrumentation import Collector, Histogram, \
+    Instrumentation, Instruments, OpenTelemetryInstrumentation, trace
+
+XML_RESPONSE_ORDER_CREATE = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<OrderResponse><Order><Name>Available Telephone Number order</Name>"
+    b"<id>f30a31a1-1de4-4939-b094-4521bbe5c8df</id><SiteId>2297</SiteId>"
+    b"</Order><OrderStatus>RECEIVED</OrderStatus></OrderResponse>"
+)
+
+XML_RESPONSE_TN_GET = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<TelephoneNumberResponse><TelephoneNumber>7576768750</TelephoneNumber>"
+    b"<Status>Inservice</Status><SiteId>2297</SiteId>"
+    b"</TelephoneNumberResponse>"
+)
+
+class Recorder(Instrumentation):
+
+    def __init__(self):
+        self.spans = []
+
+    def finish(self, span):
+        self.spans.append(("finish", span.name, span.resource, span.endpoint,
+            span.status, span.error is not None))
+
+    def start(self, span):
+        self.spans.append(("start", span.name))
+
+class ClassInstrumentationTest(TestCase):
+
+    """Test the instrumentation hooks"""
+
+    def setUp(self):
+        self._collector = Collector()
+        self._recorder = Recorder()
+        self._client = Client("http://foo", "bar", "baz", "qux",
+            instrumentation=Instruments(self._collector, self._recorder))
+
+    def test_get(self):
+
+        with requests_mock.Mocker() as m:
+
+            m.get("http://foo/tns/7576768750", content=XML_RESPONSE_TN_GET)
+            Tns(client=self._client).get("7576768750")
+
+        self.assertEqual(self._recorder.spans, [
+            ("start", "http"),
+            ("finish", "http", "TelephoneNumber", "/tns/{}", 200, False),
+            ("start", "fromstring"),
+            ("finish", "fromstring", "TelephoneNumber",
+                "/tns/{}", None, False),
+            ("start", "from_xml"),
+            ("finish", "from_xml", "TelephoneNumber", "/tns/{}", None, False)
+        ])
+
+        summary = self._collector.summary()
+        self.assertEqual(sorted(summary),
+            [("/tns/{}", "from_xml"), ("/tns/{}", "fromstring"),
+                ("/tns/{}", "http")])
+        http = summary[("/tns/{}", "http")]
+        self.assertEqual(http.count, 1)
+        self.assertEqual(http.bytes, len(XML_RESPONSE_TN_GET))
+        self.assertTrue(0 < http.min <= http.p50 <= http.max)
+
+    def test_save(self):
+
+        account = Account(client=self._client)
+
+        with requests_mock.Mocker() as m:
+
+            m.post("http://foo/accounts/bar/orders",
+                content=XML_RESPONSE_ORDER_CREATE)
+            order = account.orders.create({"name": "foo", "site_id": "2297"})
+
+        self.assertEqual(order.id, "f30a31a1-1de4-4939-b094-4521bbe5c8df")
+        summary = self._collector.summary()
+        self.assertEqual(set(summary), set([
+            ("/accounts/{}/orders", "serialize"),
+            ("/accounts/{}/orders", "http"),
+            ("/accounts/{}/orders/{}", "fromstring"),
+            ("/accounts/{}/orders/{}", "from_xml")]))
+        self.assertTrue(summary[("/accounts/{}/orders", "serialize")].bytes)
+
+    def test_error(self):
+
+        with requests_mock.Mocker() as m:
+
+            m.get("http://foo/tns/7576768750", status_code=500)
+            with self.assertRaises(HTTPError):
+                Tns(client=self._client).get("7576768750")
+
+        self.assertEqual(self._recorder.spans[-1],
+            ("finish", "http", "TelephoneNumber", "/tns/{}", 500, True))
+
+    def test_stream(self):
+
+        client = Client("http://foo", "bar", "baz", "qux", stream=True,
+            instrumentation=self._collector)
+
+        with requests_mock.Mocker() as m:
+
+            m.get("http://foo/tns/7576768750", content=XML_RESPONSE_TN_GET)
+            tn = Tns(client=client).get("7576768750")
+
+        self.assertEqual(tn.site_id, "2297")
+        self.assertEqual(sorted(self._collector.summary()),
+            [("/tns/{}", "http"), ("/tns/{}", "parse_stream")])
+
+    def test_client_request(self):
+
+        with requests_mock.Mocker() as m:
+
+            m.get("http://foo/tns", content=b"")
+            self._client.get("tns")
+
+        self.assertEqual(self._recorder.spans[-1],
+            ("finish", "http", None, "/tns", 200, False))
+
+class ClassHistogramTest(TestCase):
+
+    """Test the collector histograms"""
+
+    def test_histogram(self):
+
+        histogram = Histogram()
+        for ms in range(1, 101):
+            histogram.add(ms / 1000.0, 10)
+        histogram.add(1000)
+
+        summary = histogram.summary()
+        self.assertEqual(summary.count, 101)
+        self.assertEqual(summary.bytes, 1000)
+        self.assertEqual(summary.min, 0.001)
+        self.assertEqual(summary.max, 1000)
+        self.assertTrue(0.05 <= summary.p50 <= 0.1)
+        self.assertTrue(0.095 <= summary.p95 <= 0.2)
+        self.assertEqual(Histogram().percentile(50), None)
+
+    @skipIf(trace is not None, "opentelemetry installed")
+    def test_opentelemetry_missing(self):
+        with self.assertRaises(ImportError):
+            OpenTelemetryInstrumentation()
+
+if __name__ == "__main__":
+    main()
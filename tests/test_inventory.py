@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+# For coverage.
+if __package__ is None:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+from unittest import main, TestCase
+
+import requests_mock
+
+from iris_sdk.client import Client
+from iris_sdk.inventory import SOURCE_ASSIGNMENTS, SOURCE_IN_SERVICE, \
+    SOURCE_TNS, TnInventory
+from iris_sdk.models.account import Account
+from iris_sdk.models.tns import Tns
+
+XML_TN = (
+    "<TelephoneNumber><City>{2}</City><Lata>{3}</Lata><State>{1}</State>"
+    "<FullNumber>{0}</FullNumber><Tier>0</Tier><VendorId>49</VendorId>"
+    "<VendorName>Bandwidth CLEC</VendorName><RateCenter>{2}</RateCenter>"
+    "<Status>{4}</Status><AccountId>9500249</AccountId>"
+    "<LastModified>{5}</LastModified></TelephoneNumber>"
+)
+
+XML_IN_SERVICE_NUMBERS = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<TNs><TotalCount>2</TotalCount><Links><first></first></Links>"
+    b"<TelephoneNumbers><Count>2</Count>"
+    b"<TelephoneNumber>4109235436</TelephoneNumber>"
+    b"<TelephoneNumber>8183386251</TelephoneNumber>"
+    b"</TelephoneNumbers></TNs>"
+)
+
+XML_SIP_PEERS = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<TNSipPeersResponse><SipPeers><SipPeer><PeerId>{}</PeerId>"
+    "<PeerName>Test Peer</PeerName></SipPeer></SipPeers></TNSipPeersResponse>"
+)
+
+XML_SIP_PEER_TNS = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<SipPeerTelephoneNumbersResponse><SipPeerTelephoneNumbers>{}"
+    "</SipPeerTelephoneNumbers></SipPeerTelephoneNumbersResponse>"
+)
+
+XML_SITES = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<SitesResponse><Sites><Site><Id>2297</Id><Name>API Test Site</Name>"
+    b"</Site><Site><Id>2301</Id><Name>My First Site</Name></Site>"
+    b"</Sites></SitesResponse>"
+)
+
+XML_TNS = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<TelephoneNumbersResponse><TelephoneNumberCount>{0}"
+    "</TelephoneNumberCount><Links><first></first>{1}</Links>"
+    "<TelephoneNumbers>{2}</TelephoneNumbers></TelephoneNumbersResponse>"
+)
+
+XML_NEXT = (
+    "<next>Link=&lt;http://foo/tns?page=2&amp;size=2&gt;;rel=\"next\";</next>"
+)
+
+MD = ("MD", "MILLERSVL", "238")
+CA = ("CA", "LSAN DA 03", "730")
+
+def tns_pages(numbers):
+
+    """Two pages of "numbers": (number, (state, rate center, lata), status)"""
+
+    items = [XML_TN.format(number, state, rate_center, lata, status,
+        "2015-07-14T13:53:58.000Z") for number, (state, rate_center, lata),
+        status in numbers]
+    return [XML_TNS.format(len(items), XML_NEXT, "".join(items[:2])).encode(),
+        XML_TNS.format(len(items), "", "".join(items[2:])).encode()]
+
+def peer_tns(*numbers):
+    return XML_SIP_PEER_TNS.format("".join(
+        "<SipPeerTelephoneNumber><FullNumber>{}</FullNumber>"
+        "</SipPeerTelephoneNumber>".format(number) for number in numbers)).\
+        encode()
+
+class ClassInventoryTest(TestCase):
+
+    """Test the SQLite TN inventory"""
+
+    def setUp(self):
+        self._client = Client("http://foo", "bar", "baz", "qux")
+        self._inventory = TnInventory()
+        self.addCleanup(self._inventory.close)
+
+    def sync(self, numbers, params=None):
+        first, second = tns_pages(numbers)
+        with requests_mock.Mocker() as m:
+            m.get("http://foo/tns?size=2", content=first)
+            m.get("http://foo/tns?page=2&size=2", content=second)
+            return self._inventory.sync(Tns(client=self._client),
+                dict(params or {}, size=2))
+
+    def test_sync(self):
+
+        inventory = self._inventory
+        numbers = [(4109235436, MD, "Inservice"),
+            (4109235437, MD, "Inservice"),
+            (8183386251, CA, "Inservice"), (8183386252, CA, "Aging")]
+
+        self.assertIsNone(inventory.last_sync())
+        result = self.sync(numbers)
+        self.assertEqual((result.source, result.seen, result.changed,
+            result.removed), (SOURCE_TNS, 4, 4, 0))
+        self.assertIsNotNone(inventory.last_sync())
+        self.assertEqual(len(inventory), 4)
+
+        tn = inventory.get("4109235436")
+        self.assertEqual(tn.full_number, 4109235436)
+        self.assertEqual(tn.state, "MD")
+        self.assertEqual(tn.rate_center, "MILLERSVL")
+        self.assertEqual(tn.lata, "238")
+        self.assertEqual(tn.vendor_name, "Bandwidth CLEC")
+        self.assertEqual(tn.last_modified, "2015-07-14T13:53:58.000Z")
+        self.assertIsNone(tn.site_id)
+        self.assertEqual(tn.in_service, 0)
+        self.assertIsNone(inventory.get(9195551212))
+
+        self.assertEqual(inventory.find(state="MD"),
+            [4109235436, 4109235437])
+        self.assertEqual(inventory.find(state="CA", status="Aging"),
+            [8183386252])
+        self.assertEqual(inventory.find(lata=730, limit=1), [8183386251])
+        self.assertEqual(inventory.count(status="Inservice"), 3)
+        with self.assertRaises(ValueError):
+            inventory.find(foo="bar")
+
+        # Only the changed rows are written, the missing ones removed
+        numbers[3] = (8183386252, CA, "Inservice")
+        numbers[1] = (4109235438, MD, "Inservice")
+        result = self.sync(numbers)
+        self.assertEqual((result.seen, result.changed, result.removed),
+            (4, 2, 1))
+        self.assertIsNone(inventory.get(4109235437))
+        self.assertEqual(inventory.count(status="Inservice"), 4)
+
+        # A filtered sync doesn't remove the numbers it doesn't list
+        result = self.sync(numbers[2:] + [(8183386253, CA, "Aging"),
+            (8183386254, CA, "Aging")], {"state": "CA"})
+        self.assertEqual((result.seen, result.changed, result.removed),
+            (4, 2, 0))
+        self.assertEqual(len(inventory), 6)
+
+    def test_sync_in_service(self):
+
+        inventory = self._inventory
+        self.sync([(4109235436, MD, "Inservice"), (4109235437, MD, "Aging"),
+            (8183386251, CA, "Inservice"), (8183386252, CA, "Aging")])
+        inventory.connection.execute(
+            "UPDATE tns SET in_service = 1 WHERE full_number = 4109235437")
+
+        with requests_mock.Mocker() as m:
+            m.get("http://foo/accounts/bar/inserviceNumbers",
+                content=XML_IN_SERVICE_NUMBERS)
+            result = inventory.sync_in_service(
+                Account(client=self._client).in_service_numbers)
+
+        self.assertEqual((result.source, result.seen, result.changed,
+            result.removed), (SOURCE_IN_SERVICE, 2, 2, 1))
+        self.assertEqual(inventory.find(in_service=1),
+            [4109235436, 8183386251])
+        self.assertIsNotNone(inventory.last_sync(SOURCE_IN_SERVICE))
+
+    def test_sync_assignments(self):
+
+        inventory = self._inventory
+        self.sync([(4109235436, MD, "Inservice"),
+            (4109235437, MD, "Inservice"),
+            (8183386251, CA, "Inservice"), (8183386252, CA, "Inservice")])
+        account = Account(client=self._client)
+        url = "http://foo/accounts/bar/sites"
+
+        with requests_mock.Mocker() as m:
+            m.get(url, content=XML_SITES)
+            m.get(url + "/2297/sippeers", content=XML_SIP_PEERS.format(
+                "500651").encode())
+            m.get(url + "/2301/sippeers", content=XML_SIP_PEERS.format(
+                "500709").encode())
+            m.get(url + "/2297/sippeers/500651/tns",
+                content=peer_tns(4109235436, 4109235437))
+            m.get(url + "/2301/sippeers/500709/tns",
+                content=peer_tns(8183386251))
+            self.assertEqual(inventory.sync_assignments(account), [])
+
+        self.assertEqual(inventory.find(site_id="2297"),
+            [4109235436, 4109235437])
+        self.assertEqual(inventory.find(sip_peer_id="500709"), [8183386251])
+        self.assertIsNone(inventory.get(8183386252).sip_peer_id)
+        self.assertIsNotNone(inventory.last_sync(SOURCE_ASSIGNMENTS))
+
+        # The numbers of the peers that failed keep their assignment
+        with requests_mock.Mocker() as m:
+            m.get(url, content=XML_SITES)
+            m.get(url + "/2297/sippeers", content=XML_SIP_PEERS.format(
+                "500651").encode())
+            m.get(url + "/2301/sippeers", content=XML_SIP_PEERS.format(
+                "500709").encode())
+            m.get(url + "/2297/sippeers/500651/tns",
+                content=peer_tns(4109235437))
+            m.get(url + "/2301/sippeers/500709/tns", status_code=500)
+            failures = inventory.sync_assignments(account)
+
+        self.assertEqual([failure.item for failure in failures],
+            [("2301", "500709")])
+        self.assertEqual(inventory.find(site_id="2297"), [4109235437])
+        self.assertEqual(inventory.find(sip_peer_id="500709"), [8183386251])
+
+    def test_file(self):
+
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+            "inventory.sqlite")
+        self.addCleanup(os.remove, path)
+
+        with TnInventory(path) as inventory:
+            self._inventory = inventory
+            self.sync([(4109235436, MD, "Inservice"),
+                (4109235437, MD, "Inservice")])
+
+        with TnInventory(path) as inventory:
+            self.assertEqual(inventory.find(rate_center="MILLERSVL"),
+                [4109235436, 4109235437])
+            self.assertIsNotNone(inventory.last_sync())
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,18 @@ import sys
 if __package__ is None:
     sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
 
+import re
+
 from unittest import main, TestCase
+from xml.etree.ElementTree import fromstring
 
 import requests
 import requests_mock
 
 from iris_sdk.client import Client
 from iris_sdk.models.account import Account
+from iris_sdk.utils.rest import RestError
+from iris_sdk.watcher import OrderWatcher
 
 XML_RESPONSE_ORDER_CREATE = (
     b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
@@ -67,6 +72,19 @@ XML_RESPONSE_ORDERS_LIST = (
     b"</ListOrderIdUserIdDate></ResponseSelectWrapper>"
 )
 
+XML_RESPONSE_ORDER_BULK = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<OrderResponse>{}<Order><id>{}</id></Order>"
+    "<OrderStatus>{}</OrderStatus></OrderResponse>"
+)
+
+XML_RESPONSE_ORDER_ERROR = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<OrderResponse><ErrorList><Error><Code>5005</Code>"
+    b"<Description>Too many numbers</Description></Error></ErrorList>"
+    b"</OrderResponse>"
+)
+
 class ClassOrdersTest(TestCase):
 
     """Test phone number orders"""
@@ -157,6 +175,98 @@ class ClassOrdersTest(TestCase):
         self.assertEqual(order.npanxx_search_and_order_type.npa_nxx, "919439")
         self.assertEqual(order.npanxx_search_and_order_type.quantity, "1")
 
+    def test_orders_bulk(self):
+
+        numbers = [str(number) for number in range(9193752360, 9193752367)]
+        submitted = {}
+        polls = {}
+
+        def submit(request, context):
+            order = fromstring(request.body)
+            tns = [el.text for el in order.findall(
+                "ExistingTelephoneNumberOrderType/TelephoneNumberList/"
+                "TelephoneNumber")]
+            if tns[0] == numbers[3]:
+                context.status_code = 400
+                return XML_RESPONSE_ORDER_ERROR
+            submitted[tns[0]] = (tns, [el.text for el in order.findall(
+                "ExistingTelephoneNumberOrderType/ReservationIdList/"
+                "ReservationId")], order.find("SiteId").text)
+            return XML_RESPONSE_ORDER_BULK.format("", tns[0],
+                "RECEIVED").encode()
+
+        def poll(request, context):
+            id = request.path.rpartition("/")[2]
+            polls[id] = polls.get(id, 0) + 1
+            tns = submitted[id][0]
+            if polls[id] == 1:
+                return XML_RESPONSE_ORDER_BULK.format("", id,
+                    "PROCESSING").encode()
+            if id == numbers[0]:
+                return XML_RESPONSE_ORDER_BULK.format(
+                    "<CompletedQuantity>3</CompletedQuantity><CompletedNumbers>"
+                    + "".join("<TelephoneNumber><FullNumber>{}</FullNumber>"
+                        "</TelephoneNumber>".format(tn) for tn in tns) +
+                    "</CompletedNumbers>", id, "COMPLETE").encode()
+            return XML_RESPONSE_ORDER_BULK.format(
+                "<CompletedQuantity>0</CompletedQuantity>"
+                "<FailedQuantity>1</FailedQuantity><ErrorList><Error>"
+                "<Code>5011</Code><Description>Unavailable</Description>"
+                "<TelephoneNumber>{0}</TelephoneNumber></Error></ErrorList>"
+                "<FailedNumbers><FullNumber>{0}</FullNumber></FailedNumbers>"
+                .format(tns[0]), id, "FAILED").encode()
+
+        url = self._client.config.url + self._account.orders.get_xpath()
+
+        with requests_mock.Mocker() as m, \
+                OrderWatcher(initial_delay=0.01, max_delay=0.02) as watcher:
+
+            m.post(url, content=submit)
+            m.get(re.compile(re.escape(url) + "/.+"), content=poll)
+
+            response = self._account.orders.bulk({"site_id": "2297"},
+                numbers, {numbers[1]: "r1"}, chunk_size=3, max_workers=2,
+                watcher=watcher)
+
+        self.assertEqual(sorted(submitted), [numbers[0], numbers[6]])
+        self.assertEqual(submitted[numbers[0]],
+            (numbers[:3], ["r1"], "2297"))
+        self.assertEqual(submitted[numbers[6]], (numbers[6:], [], "2297"))
+        self.assertEqual(polls, {numbers[0]: 2, numbers[6]: 2})
+
+        self.assertEqual([order and order.id for order in response.orders],
+            [numbers[0], None, numbers[6]])
+        self.assertEqual(response.order_status, "PARTIAL")
+        self.assertEqual(response.completed_numbers.items, numbers[:3])
+        self.assertEqual(response.completed_quantity, "3")
+        self.assertEqual(response.failed_numbers.items,
+            numbers[3:6] + numbers[6:])
+        self.assertEqual(response.failed_quantity, "4")
+        self.assertEqual([error.code for error in
+            response.error_list.error.items], ["5011"])
+
+        self.assertEqual(len(response.errors), 1)
+        self.assertEqual(response.errors[0].index, 1)
+        self.assertEqual(response.errors[0].item, numbers[3:6])
+        self.assertIsInstance(response.errors[0].error, RestError)
+
+    def test_orders_bulk_no_wait(self):
+
+        url = self._client.config.url + self._account.orders.get_xpath()
+
+        with requests_mock.Mocker() as m:
+
+            m.post(url, content=XML_RESPONSE_ORDER_CREATE)
+            response = self._account.orders.bulk({"site_id": "2297"},
+                ["9193752369", "9193752720"], chunk_size=1, wait=False)
+
+            self.assertEqual(m.call_count, 2)
+
+        self.assertEqual([order.order_status for order in response.orders],
+            ["RECEIVED", "RECEIVED"])
+        self.assertIsNone(response.order_status)
+        self.assertEqual(response.errors, [])
+
     def test_order_create(self):
 
         with requests_mock.Mocker() as m:
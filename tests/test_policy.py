@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+# For coverage.
+if __package__ is None:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+from email.utils import formatdate
+from unittest import main, TestCase
+from unittest.mock import patch
+
+from requests.exceptions import ConnectionError, HTTPError
+
+from iris_sdk.client import Client
+from iris_sdk.models.tns import Tns
+from iris_sdk.utils.deadline import DeadlineExceeded
+from iris_sdk.utils.policy import CircuitBreaker, CircuitOpenError, \
+    RateLimiter, RequestPolicy, retry_after_seconds
+from tests.stub_server import faults, StubServer, tn_get
+
+class ClassRequestPolicyTest(TestCase):
+
+    """Test the request policy against a faulty server"""
+
+    def setUp(self):
+        self._server = StubServer()
+        self._server.start()
+        self.addCleanup(self._server.stop)
+        self._sleep = patch("iris_sdk.utils.policy.sleep").start()
+        self.addCleanup(patch.stopall)
+
+    def client(self, **kwargs):
+        client = Client(self._server.url, 1, "foo", "bar",
+            policy=RequestPolicy(**kwargs))
+        self.addCleanup(client.close)
+        return client
+
+    def route(self, path, script, route=tn_get):
+        calls = []
+        faulty = faults(route, script)
+        def counted(*args):
+            calls.append(args[0])
+            return faulty(*args)
+        self._server.route("/api" + path, counted)
+        return calls
+
+    def test_retry(self):
+
+        client = self.client(backoff=1)
+        calls = self.route("/tns/7576768750", [503, None, 502])
+
+        tn = Tns(client=client).get("7576768750")
+
+        self.assertEqual(tn.site_id, "2297")
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(self._sleep.call_count, 3)
+        for (delay,), limit in zip(
+                [call[0] for call in self._sleep.call_args_list], (1, 2, 4)):
+            self.assertTrue(limit / 2 <= delay <= limit)
+        info = client.policy.info()
+        self.assertEqual((info.requests, info.retries, info.failures),
+            (4, 3, 3))
+
+    def test_retry_after(self):
+
+        client = self.client()
+        self.route("/tns/7576768750", [(429, {"Retry-After": "7"})])
+
+        Tns(client=client).get("7576768750")
+        self._sleep.assert_called_once_with(7)
+        self.assertEqual(client.policy.info().failures, 0)
+
+        # Too long to wait for
+        self.route("/tns/7576768750", [(429, {"Retry-After": "3600"})])
+        with self.assertRaises(HTTPError):
+            Tns(client=client).get("7576768750")
+
+    def test_retry_exhausted(self):
+
+        client = self.client(retries=2)
+        calls = self.route("/tns/7576768750", [None] * 3)
+
+        with self.assertRaises(ConnectionError):
+            Tns(client=client).get("7576768750")
+        self.assertEqual(len(calls), 3)
+
+    def test_retry_post(self):
+
+        post = lambda *args: (201, b"")
+
+        calls = self.route("/tns", [503], post)
+        with self.assertRaises(HTTPError):
+            self.client().post("/tns", data="foo")
+        self.assertEqual(len(calls), 1)
+
+        client = self.client(methods=("GET", "POST"))
+        calls = self.route("/tns", [503], post)
+        self.assertEqual(client.post("/tns", data="foo").status_code, 201)
+        self.assertEqual(len(calls), 2)
+
+        # Can't be sent twice
+        calls = self.route("/tns", [503], post)
+        with self.assertRaises(HTTPError):
+            client.post("/tns", data=iter([b"foo"]))
+        self.assertEqual(len(calls), 1)
+
+    def test_circuit_breaker(self):
+
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        client = self.client(retries=0, circuit_breaker=breaker)
+        calls = self.route("/tns/7576768750", [500, 500])
+
+        for i in range(2):
+            with self.assertRaises(HTTPError):
+                Tns(client=client).get("7576768750")
+        self.assertEqual(breaker.state, "open")
+
+        with self.assertRaises(CircuitOpenError):
+            Tns(client=client).get("7576768750")
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(client.policy.info().rejected, 1)
+
+        with patch("iris_sdk.utils.policy.time", side_effect=lambda: 1e12):
+            self.assertEqual(breaker.state, "half-open")
+            Tns(client=client).get("7576768750")
+        self.assertEqual(breaker.state, "closed")
+        self.assertEqual(client.policy.info().state, "closed")
+
+    def test_circuit_breaker_trial_error(self):
+
+        class response(object):
+            status_code = 200
+
+        def expired():
+            raise DeadlineExceeded("Deadline exceeded")
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        policy = RequestPolicy(circuit_breaker=breaker)
+        breaker.failure()
+
+        with patch("iris_sdk.utils.policy.time", side_effect=lambda: 1e12):
+            # Neither a success nor a failure, the next request is the trial
+            with self.assertRaises(DeadlineExceeded):
+                policy.send("GET", expired)
+            self.assertEqual(breaker.state, "half-open")
+            ok = response()
+            self.assertIs(policy.send("GET", lambda: ok), ok)
+        self.assertEqual(breaker.state, "closed")
+
+class ClassRateLimiterTest(TestCase):
+
+    """Test the token bucket"""
+
+    @patch("iris_sdk.utils.policy.sleep")
+    @patch("iris_sdk.utils.policy.time", return_value=100)
+    def test_acquire(self, mock_time, mock_sleep):
+
+        limiter = RateLimiter(10, burst=2)
+
+        self.assertEqual([limiter.acquire("foo") for i in range(4)],
+            [0, 0, 0.1, 0.2])
+        self.assertEqual(limiter.acquire("bar"), 0)
+
+        mock_time.return_value = 101
+        self.assertEqual(limiter.acquire("foo"), 0)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_retry_after_seconds(self):
+
+        class response(object):
+            headers = {}
+
+        self.assertIsNone(retry_after_seconds(response))
+        response.headers = {"Retry-After": "120"}
+        self.assertEqual(retry_after_seconds(response), 120)
+        response.headers = {"Retry-After": formatdate(0, usegmt=True)}
+        self.assertEqual(retry_after_seconds(response), 0)
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,11 @@ import sys
 if __package__ is None:
     sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
 
+from io import BytesIO
+from mmap import mmap
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
 from unittest import main, TestCase
 
 import requests
@@ -98,6 +103,10 @@ class ClassPortinsTest(TestCase):
         del cls._account
         del cls._client
 
+    def setUp(self):
+        self._dir = mkdtemp()
+        self.addCleanup(rmtree, self._dir)
+
     def test_get_loas(self):
 
         portin = self._portins.create({"order_id":
@@ -234,6 +243,82 @@ class ClassPortinsTest(TestCase):
             self.assertEqual(oh.author, "byo_dev")
             self.assertEqual(oh.status, "PENDING_DOCUMENTS")
 
+    def test_portin_loas_create(self):
+
+        portin = self._portins.create({"order_id":
+            "d28b36f7-fa96-49eb-9556-a40fca49f7c6"}, False)
+        path = os.path.join(self._dir, "loa.pdf")
+        with open(path, "wb") as loa:
+            loa.write(b"%PDF-1.4 foo")
+
+        def chunks():
+            yield b"%PDF-1.4 "
+            yield b"foo"
+
+        def upload(request, context):
+            # Opened and mapped files are closed once the request is sent
+            if hasattr(request.body, "read"):
+                bodies.append(request.body.read())
+            elif isinstance(request.body, (bytes, mmap)):
+                bodies.append(request.body[:])
+            context.headers["location"] = url + "/fname.pdf"
+            return b""
+
+        bodies = []
+        with requests_mock.Mocker() as m:
+
+            url = self._client.config.url + portin.loas.get_xpath()
+            m.post(url, content=upload)
+
+            for filename in (path, os.fsencode(path), Path(path),
+                    BytesIO(b"%PDF-1.4 foo")):
+                self.assertEqual(portin.loas.create(filename,
+                    {"content-type": "application/pdf"}), "fname.pdf")
+            self.assertEqual(portin.loas.create(None,
+                {"content-type": "application/pdf"}, data=b"%PDF-1.4 foo"),
+                "fname.pdf")
+            self.assertEqual(portin.loas.create(path,
+                {"content-type": "application/pdf"}, mmap=True), "fname.pdf")
+            portin.loas.create(chunks(), {"content-type": "application/pdf"})
+
+            for request in m.request_history[:6]:
+                self.assertEqual(request.headers["Content-Length"], "12")
+            self.assertEqual(bodies, [b"%PDF-1.4 foo"] * 6)
+            self.assertEqual(m.request_history[6].headers["Transfer-Encoding"],
+                "chunked")
+
+            m.put(url + "/fname.pdf")
+            self.assertTrue(portin.loas.update("fname.pdf", path,
+                {"content-type": "application/pdf"}, mmap=True))
+
+    def test_portin_loas_create_all(self):
+
+        portin = self._portins.create({"order_id":
+            "d28b36f7-fa96-49eb-9556-a40fca49f7c6"}, False)
+
+        def upload(request, context):
+            body = request.body.read()
+            if body == b"bar":
+                context.status_code = 500
+            else:
+                context.headers["location"] = url + "/" + body.decode()
+            return b""
+
+        with requests_mock.Mocker() as m:
+
+            url = self._client.config.url + portin.loas.get_xpath()
+            m.post(url, content=upload)
+
+            names, failures = portin.loas.create_all([BytesIO(b"foo"),
+                BytesIO(b"bar"), BytesIO(b"baz")],
+                {"content-type": "application/pdf"}, max_workers=2)
+
+            self.assertEqual(names, ["foo", None, "baz"])
+            self.assertEqual(len(failures), 1)
+            self.assertEqual(failures[0].index, 1)
+            self.assertIsInstance(failures[0].error,
+                requests.exceptions.HTTPError)
+
     def test_portin_loas_delete(self):
 
         portin = self._portins.create({"order_id":
@@ -246,6 +331,28 @@ class ClassPortinsTest(TestCase):
 
             portin.loas.delete("fname")
 
+    def test_portin_loas_download(self):
+
+        portin = self._portins.create({"order_id":
+            "d28b36f7-fa96-49eb-9556-a40fca49f7c6"}, False)
+        path = os.path.join(self._dir, "loa.pdf")
+
+        with requests_mock.Mocker() as m:
+
+            url = self._client.config.url + portin.loas.get_xpath() + "/fname"
+            m.get(url, content=b"%PDF-1.4 foo")
+
+            writer = BytesIO()
+            self.assertEqual(portin.loas.download("fname", writer, 4), 12)
+            self.assertEqual(writer.getvalue(), b"%PDF-1.4 foo")
+
+            self.assertEqual(portin.loas.download("fname", path), 12)
+            with open(path, "rb") as loa:
+                self.assertEqual(loa.read(), b"%PDF-1.4 foo")
+
+            self.assertEqual(portin.loas.get("fname").content,
+                b"%PDF-1.4 foo")
+
     def test_portin_loas_get_metadata(self):
 
         portin = self._portins.create({"order_id":
@@ -39,7 +39,7 @@ class ClassRestRequestTest(TestCase):
         cls._rest_client = RestClient()
 
     def setUp(self):
-        patcher_req = patch("requests.request")
+        patcher_req = patch("requests.Session.request")
         patcher_resp = patch("requests.Response")
         patcher_stat = patch("requests.Response.raise_for_status")
 
@@ -66,7 +66,8 @@ class ClassRestRequestTest(TestCase):
 
         self._rest_client.request("GET","foo","bar","baz","qux")
         self._request.assert_called_once_with("GET", "foo", auth="bar",
-            headers=HEADERS, params="baz", data="qux")
+            headers=HEADERS, params="baz", data="qux", stream=False,
+            timeout=None)
         self._stat.assert_any_call
 
         self.assertEqual(self._mock_req_res.status_code, HTTP_OK)
@@ -74,8 +75,10 @@ class ClassRestRequestTest(TestCase):
             b"<something><foo>bar</foo><baz>qux</baz>")
         self.assertEqual(self._mock_req_res.headers["foo"], "bar")
 
-    @patch("xml.etree.ElementTree.fromstring", return_value = "foo")
-    def test_rest_client_exception(self, _fromstring):
+    @patch("iris_sdk.utils.rest.get_backend")
+    def test_rest_client_exception(self, _get_backend):
+
+        _fromstring = _get_backend.return_value.fromstring
 
         class XmlElem(object):
             def __init__(self):
@@ -86,8 +89,8 @@ class ClassRestRequestTest(TestCase):
             def find(self, str):
                 self._call_arg = str
                 return self.find_res
-            def getchildren(self):
-                return self.children
+            def __iter__(self):
+                return iter(self.children)
 
         self._mock_req_res.content = b""
         self._mock_req_res.status_code = 300
@@ -143,5 +146,35 @@ class ClassRestRequestTest(TestCase):
                     ERROR_TEMPLATE.format("bar", "qux")):
                 self._rest_client.request("GET","foo","bar","baz","qux")
 
+class ClassRestSessionTest(TestCase):
+
+    """Test connection pooling"""
+
+    def test_rest_client_pool(self):
+        with RestClient(pool_connections=2, pool_maxsize=5,
+                pool_block=True) as rest_client:
+            for prefix in ("http://", "https://"):
+                adapter = rest_client.session.get_adapter(prefix + "foo")
+                self.assertEqual(adapter._pool_connections, 2)
+                self.assertEqual(adapter._pool_maxsize, 5)
+                self.assertTrue(adapter._pool_block)
+
+    @patch("requests.Session.close")
+    def test_rest_client_close(self, mock_close):
+        rest_client = RestClient()
+        rest_client.close()
+        mock_close.assert_called_once_with()
+
+    def test_rest_client_external_session(self):
+        session = MagicMock()
+        rest_client = RestClient(session)
+        self.assertIs(rest_client.session, session)
+        rest_client.request("GET", "foo", "bar")
+        session.request.assert_called_once_with("GET", "foo", auth="bar",
+            headers=HEADERS, data=None, params=None, stream=False,
+            timeout=None)
+        rest_client.close()
+        self.assertFalse(session.close.called)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
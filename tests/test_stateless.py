@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+# For coverage.
+if __package__ is None:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+import re
+
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+from unittest import main, TestCase
+
+import requests_mock
+
+from iris_sdk.client import Client
+from iris_sdk.models.account import Account
+from iris_sdk.models.order import Order
+from iris_sdk.models.tns import Tns
+
+CALLS = 200
+THREADS = 16
+
+XML_RESPONSE_ORDER_GET = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<OrderResponse><Order><CustomerOrderId>{0}</CustomerOrderId>"
+    "<Name>Order {0}</Name><id>{0}</id>"
+    "<ExistingTelephoneNumberOrderType><TelephoneNumberList>"
+    "<TelephoneNumber>91937{0:05}</TelephoneNumber>"
+    "</TelephoneNumberList></ExistingTelephoneNumberOrderType>"
+    "<SiteId>2297</SiteId></Order>"
+    "<OrderStatus>RECEIVED</OrderStatus></OrderResponse>"
+)
+
+XML_RESPONSE_TNS_PAGE = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<TelephoneNumbersResponse><TelephoneNumberCount>2"
+    "</TelephoneNumberCount><Links><first></first></Links>"
+    "<TelephoneNumbers><TelephoneNumber><FullNumber>20120{0:05}</FullNumber>"
+    "<Status>Inservice</Status></TelephoneNumber><TelephoneNumber>"
+    "<FullNumber>20130{0:05}</FullNumber><Status>Inservice</Status>"
+    "</TelephoneNumber></TelephoneNumbers></TelephoneNumbersResponse>"
+)
+
+def order_response(request, context):
+    # Lets the threads interleave between the request and the parsing
+    sleep(0.001)
+    id = int(request.path.rsplit("/", 1)[1])
+    return XML_RESPONSE_ORDER_GET.format(id).encode()
+
+def tns_response(request, context):
+    sleep(0.001)
+    return XML_RESPONSE_TNS_PAGE.format(int(request.qs["page"][0])).encode()
+
+class ClassStatelessTest(TestCase):
+
+    """Test sharing resources between threads with a stateless client"""
+
+    def run_threads(self, func):
+        with ThreadPoolExecutor(THREADS) as executor:
+            return list(executor.map(func, range(CALLS)))
+
+    def test_orders_get(self):
+
+        client = Client("http://foo", "bar", "baz", "qux", stateless=True)
+        orders = Account(client=client).orders
+        order = Order(orders)
+
+        def get(index):
+            result = orders.get(str(index)).order
+            other = order.get(str(index)).order
+            return (result.id, result.customer_order_id, other.name,
+                result.existing_telephone_number_order_type.
+                telephone_number_list.telephone_number.items)
+
+        with requests_mock.Mocker() as m:
+            m.get(re.compile("http://foo/accounts/bar/orders/\\d+"),
+                content=order_response)
+            results = self.run_threads(get)
+
+        for index, result in enumerate(results):
+            self.assertEqual(result, (str(index), str(index),
+                "Order {}".format(index), ["91937{:05}".format(index)]))
+        self.assertIsNone(order.id)
+        self.assertIsNone(order.name)
+
+    def test_tns_list(self):
+
+        for stream in (False, True):
+
+            client = Client("http://foo", "bar", "baz", "qux", stream=stream,
+                stateless=True)
+            tns = Tns(client=client)
+
+            def list_page(index):
+                return [(tn.full_number, tn.status) for tn in
+                    tns.list({"page": index}).items]
+
+            with requests_mock.Mocker() as m:
+                m.get(re.compile("http://foo/tns"), content=tns_response)
+                results = self.run_threads(list_page)
+
+            for index, result in enumerate(results):
+                self.assertEqual(result,
+                    [("20120{:05}".format(index), "Inservice"),
+                    ("20130{:05}".format(index), "Inservice")])
+            self.assertEqual(tns.telephone_numbers.telephone_number.items,
+                [])
+
+    def test_default_client(self):
+
+        client = Client("http://foo", "bar", "baz", "qux")
+        order = Order(Account(client=client).orders)
+
+        with requests_mock.Mocker() as m:
+            m.get("http://foo/accounts/bar/orders/1", content=order_response)
+            result = order.get("1")
+
+        self.assertIs(result.order, order)
+        self.assertEqual(order.name, "Order 1")
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,8 @@ if __package__ is None:
 
 from unittest import main, TestCase
 
-from iris_sdk.utils.strings import Converter
+from iris_sdk.models.maps import property_names
+from iris_sdk.utils.strings import Converter, StringCache
 
 class ClassStringsConverterTest(TestCase):
 
@@ -46,5 +47,46 @@ class ClassStringsConverterTest(TestCase):
         for input, output in tests:
             self.assertEqual(self._converter.to_underscore(input), output)
 
+class ClassStringsCacheTest(TestCase):
+
+    """Test conversion memoization"""
+
+    def test_cache_counters(self):
+        cache = StringCache(str.upper, 10)
+        self.assertEqual(cache("foo"), "FOO")
+        self.assertEqual(cache("foo"), "FOO")
+        self.assertEqual(cache("bar"), "BAR")
+        self.assertEqual(tuple(cache.info()), (1, 2, 10, 2))
+        cache.clear()
+        self.assertEqual(tuple(cache.info()), (0, 0, 10, 0))
+
+    def test_cache_bounded(self):
+        cache = StringCache(str.upper, 2)
+        for string in ("foo", "bar", "baz", "baz"):
+            cache(string)
+        self.assertEqual(tuple(cache.info()), (1, 3, 2, 2))
+        self.assertEqual(cache("foo"), "FOO")
+        self.assertEqual(cache.info().misses, 4)
+
+    def test_cache_seed(self):
+        cache = StringCache(str.upper, 10)
+        cache.seed(["foo", "bar"])
+        self.assertEqual(cache("foo"), "FOO")
+        self.assertEqual(tuple(cache.info()), (1, 0, 10, 2))
+
+    def test_converter_shared(self):
+        before = Converter.cache_info()["to_camelcase"]
+        Converter().to_camelcase("account_id")
+        Converter().to_camelcase("account_id")
+        after = Converter.cache_info()["to_camelcase"]
+        self.assertEqual(after.hits - before.hits, 2)
+        self.assertEqual(after.misses, before.misses)
+
+    def test_property_names(self):
+        names = property_names()
+        self.assertIn("account_id", names)
+        self.assertIn("full_number", names)
+        self.assertNotIn("__module__", names)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+# For coverage.
+if __package__ is None:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+from array import array
+from contextlib import contextmanager
+from random import Random
+from unittest import main, TestCase
+from unittest.mock import patch
+
+import requests_mock
+
+from iris_sdk.client import Client
+from iris_sdk.models.account import Account
+from iris_sdk.models.tns import Tns
+from iris_sdk.utils import tn_set
+from iris_sdk.utils.tn_set import NPA_DIGITS, reconcile, TnSet
+from tests import payloads
+
+XML_DISC_NUMBERS = (
+    b"<?xml version=\"1.0\"?><TNs><TotalCount>2</TotalCount>"
+    b"<Links><first></first></Links><TelephoneNumbers><Count>2</Count>"
+    b"<TelephoneNumber>4352154439</TelephoneNumber>"
+    b"<TelephoneNumber>4158714245</TelephoneNumber>"
+    b"</TelephoneNumbers></TNs>"
+)
+
+@contextmanager
+def array_backend():
+    with patch.object(tn_set, "numpy", None):
+        yield
+
+@contextmanager
+def default_backend():
+    yield
+
+class ClassTnSetTest(TestCase):
+
+    """Test the TN sets"""
+
+    def backends(self):
+
+        """The array("q") backend, and NumPy if it's installed"""
+
+        backends = [("array", array_backend)]
+        if tn_set.numpy is not None:
+            backends.append(("numpy", default_backend))
+        for name, backend in backends:
+            with self.subTest(backend=name), backend():
+                yield name
+
+    def test_operations(self):
+
+        for backend in self.backends():
+
+            tns = TnSet(["9195551213", 9195551212, 4109235436, 9195551212])
+            other = TnSet(array("q", [9195551213, 8183386251]))
+
+            self.assertEqual(list(tns), [4109235436, 9195551212, 9195551213])
+            self.assertEqual(len(tns), 3)
+            self.assertIn("9195551212", tns)
+            self.assertNotIn(9195551214, tns)
+            self.assertNotIn(9999999999, tns)
+            self.assertEqual(list(tns | other), [4109235436, 8183386251,
+                9195551212, 9195551213])
+            self.assertEqual(list(tns - other), [4109235436, 9195551212])
+            self.assertEqual(list(tns & other), [9195551213])
+            self.assertEqual(list(tns.union([2012000000])), [2012000000,
+                4109235436, 9195551212, 9195551213])
+            self.assertEqual(tns, TnSet([9195551213, 9195551212, 4109235436]))
+            self.assertNotEqual(tns, other)
+            self.assertEqual(len(TnSet() | TnSet()), 0)
+
+    def test_random(self):
+
+        random = Random(0)
+        first = [random.randrange(2012000000, 2012020000) for i in
+            range(5000)]
+        second = [random.randrange(2012000000, 2012020000) for i in
+            range(5000)]
+
+        for backend in self.backends():
+            a, b = TnSet(first), TnSet(second)
+            self.assertEqual(list(a), sorted(set(first)))
+            self.assertEqual(list(a | b), sorted(set(first) | set(second)))
+            self.assertEqual(list(a - b), sorted(set(first) - set(second)))
+            self.assertEqual(list(a & b), sorted(set(first) & set(second)))
+
+    def test_array_merges(self):
+
+        random = Random(1)
+        cases = [([], []), ([1, 2], []), ([], [3]), ([1, 2, 3], [4, 5]),
+            ([4, 5], [1, 2, 3]), ([1, 3, 5], [1, 3, 5]),
+            ([1, 4, 6, 9], [2, 4, 5, 9, 12])]
+        cases.append(tuple(sorted(random.sample(range(2000), 500)) for i in
+            range(2)))
+
+        with array_backend():
+            for first, second in cases:
+                a, b = TnSet(first), TnSet(second)
+                for result, expected in ((a | b, set(first) | set(second)),
+                        (a - b, set(first) - set(second)),
+                        (a & b, set(first) & set(second))):
+                    self.assertIsInstance(result.values, array)
+                    self.assertEqual(list(result), sorted(expected))
+
+    def test_groups(self):
+
+        for backend in self.backends():
+
+            tns = TnSet([9195551212, 9195551213, 9195551214, 9195560000,
+                4109235436, 4109235438])
+
+            self.assertEqual(tns.prefixes(), [(410923, 2), (919555, 3),
+                (919556, 1)])
+            self.assertEqual(tns.prefixes(NPA_DIGITS), [(410, 2), (919, 4)])
+            self.assertEqual(tns.ranges(), [(4109235436, 4109235436),
+                (4109235438, 4109235438), (9195551212, 9195551214),
+                (9195560000, 9195560000)])
+            self.assertEqual(list(tns.prefix("919555")), [9195551212,
+                9195551213, 9195551214])
+            self.assertEqual(list(tns.prefix(919)), [9195551212, 9195551213,
+                9195551214, 9195560000])
+            self.assertEqual(len(tns.prefix("212")), 0)
+            self.assertEqual(TnSet().ranges(), [])
+            self.assertEqual(TnSet().prefixes(), [])
+
+    def test_load(self):
+
+        client = Client("http://foo", "bar", "baz", "qux")
+        account = Account(client=client)
+
+        with requests_mock.Mocker() as m:
+            m.get("http://foo/tns", content=payloads.tns(5))
+            m.get("http://foo/accounts/bar/inserviceNumbers",
+                content=payloads.in_service_numbers(3))
+            m.get("http://foo/accounts/bar/discnumbers",
+                content=XML_DISC_NUMBERS)
+
+            for backend in self.backends():
+                tns = TnSet.load(Tns(client=client), {"size": 5})
+                in_service = TnSet.load(account.in_service_numbers)
+                disconnected = TnSet.load(account.disconnected_numbers)
+
+                self.assertEqual(list(tns), list(payloads.numbers(5)))
+                self.assertEqual(list(in_service), list(payloads.numbers(3)))
+                self.assertEqual(list(disconnected), [4158714245,
+                    4352154439])
+
+    def test_reconcile(self):
+
+        for backend in self.backends():
+
+            report = reconcile(TnSet(payloads.numbers(10)),
+                [str(tn) for tn in payloads.numbers(5, 8)])
+
+            self.assertEqual(list(report.not_billed),
+                list(payloads.numbers(8)))
+            self.assertEqual(list(report.not_in_iris),
+                list(payloads.numbers(3, 10)))
+            self.assertEqual(list(report.matched),
+                list(payloads.numbers(2, 8)))
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import os
+import re
 import sys
 
 # For coverage.
@@ -14,6 +15,7 @@ import requests_mock
 
 from iris_sdk.client import Client
 from iris_sdk.models.account import Account
+from iris_sdk.models.telephone_number import TelephoneNumber
 from iris_sdk.models.tns import Tns
 
 XML_RESPONSE_LCA_GET = (
@@ -73,6 +75,32 @@ XML_RESPONSE_TN_LIST = (
     b"</TelephoneNumbers></TelephoneNumbersResponse>"
 )
 
+XML_RESPONSE_TN_LIST_PAGE_1 = (
+    b"<TelephoneNumbersResponse>"
+    b"<TelephoneNumberCount>3</TelephoneNumberCount><Links>"
+    b"<first>Link=&lt;http://foo/tns?page=1&amp;size=2&gt;;rel=\"first\";"
+    b"</first><next>Link=&lt;http://foo/tns?page=4109235438&amp;size=2&gt;;"
+    b"rel=\"next\";</next></Links><TelephoneNumbers><TelephoneNumber>"
+    b"<FullNumber>4109235436</FullNumber></TelephoneNumber><TelephoneNumber>"
+    b"<FullNumber>4109235437</FullNumber></TelephoneNumber>"
+    b"</TelephoneNumbers></TelephoneNumbersResponse>"
+)
+
+XML_RESPONSE_TN_LIST_PAGE_2 = (
+    b"<TelephoneNumbersResponse>"
+    b"<TelephoneNumberCount>3</TelephoneNumberCount><Links>"
+    b"<first>Link=&lt;http://foo/tns?page=1&amp;size=2&gt;;rel=\"first\";"
+    b"</first></Links><TelephoneNumbers><TelephoneNumber>"
+    b"<FullNumber>4109235438</FullNumber></TelephoneNumber>"
+    b"</TelephoneNumbers></TelephoneNumbersResponse>"
+)
+
+XML_RESPONSE_TN_NUMBERED_PAGE = (
+    "<TelephoneNumbersResponse>"
+    "<TelephoneNumberCount>7</TelephoneNumberCount><Links>{}</Links>"
+    "<TelephoneNumbers>{}</TelephoneNumbers></TelephoneNumbersResponse>"
+)
+
 XML_RESPONSE_SIP_PEER_GET = (
     b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?><SipPeer>"
     b"<Id>500651</Id><Name>Something</Name></SipPeer>"
@@ -146,6 +174,47 @@ class ClassTnsTest(TestCase):
         del cls._tns
         del cls._client
 
+    def test_enrich(self):
+
+        def respond(request, context):
+            path = request.path.split("/")[2:]
+            if path == ["7576768752"]:
+                context.status_code = 404
+                return b""
+            if path == ["7576768751", "lca"]:
+                context.status_code = 500
+                return b""
+            return {1: XML_RESPONSE_TN_GET, 2: {"lca": XML_RESPONSE_LCA_GET,
+                "sites": XML_RESPONSE_SITE_GET}.get(path[-1])}[len(path)]
+
+        numbers = ["7576768750", "7576768751", "7576768752"]
+
+        # A stateless client returns new instances instead of loading them
+        for stateless in (False, True):
+
+            client = Client("http://foo", "bar", "baz", "qux",
+                stateless=stateless)
+
+            with requests_mock.Mocker() as m:
+
+                m.get(re.compile("http://foo/tns/"), content=respond)
+
+                tns, failures = Tns(client=client).enrich(numbers,
+                    ("lca", "site"), max_workers=3)
+
+                self.assertEqual(m.call_count, 7)
+
+            self.assertEqual([tn.id for tn in tns], numbers)
+            self.assertEqual(tns[0].status, "PortInPendingFoc")
+            self.assertEqual(tns[0].site.name, "API Test Site")
+            self.assertEqual(tns[0].lca.listof_npanxx.npanxx.items[0],
+                "240206")
+            self.assertEqual(tns[1].site.id, "2297")
+            self.assertIsNone(tns[2].status)
+
+            self.assertEqual([failure[:2] for failure in failures],
+                [(1, ("7576768751", "lca")), (2, ("7576768752", None))])
+
     def test_history(self):
 
         with requests_mock.Mocker() as m:
@@ -264,6 +333,116 @@ class ClassTnsTest(TestCase):
             self.assertEqual(len(tns.items), 2)
             self.assertEqual(tns.items[0].full_number, "4109235436")
 
+    def test_tn_iter_all(self):
+
+        for prefetch in (False, True):
+
+            with requests_mock.Mocker() as m:
+
+                url = self._client.config.url + self._tns.get_xpath()
+                m.get(url + "?page=1&size=2",
+                    content=XML_RESPONSE_TN_LIST_PAGE_1)
+                m.get(url + "?page=4109235438&size=2",
+                    content=XML_RESPONSE_TN_LIST_PAGE_2)
+
+                tns = self._tns.iter_all({"page": 1, "size": 2}, prefetch)
+
+                self.assertEqual([tn.full_number for tn in tns],
+                    ["4109235436", "4109235437", "4109235438"])
+                self.assertEqual(m.call_count, 2)
+                self.assertEqual(m.request_history[1].qs["page"],
+                    ["4109235438"])
+
+    def test_tn_iter_all_parallel(self):
+
+        url = self._client.config.url + self._tns.get_xpath()
+        numbers = [str(4109235436 + pos) for pos in range(7)]
+
+        with requests_mock.Mocker() as m:
+
+            for page in range(1, 5):
+                links = ("" if page == 4 else "<next>Link=&lt;http://foo/tns?"
+                    "page={}&amp;size=2&gt;;rel=\"next\";</next>".format(
+                    page + 1))
+                m.get(url + "?page={}&size=2".format(page),
+                    content=XML_RESPONSE_TN_NUMBERED_PAGE.format(links,
+                    "".join("<TelephoneNumber><FullNumber>{}</FullNumber>"
+                    "</TelephoneNumber>".format(number) for number in
+                    numbers[page * 2 - 2:page * 2])).encode())
+
+            tns = self._tns.iter_all({"page": 1, "size": 2}, max_workers=2)
+
+            self.assertEqual([tn.full_number for tn in tns], numbers)
+            self.assertEqual(m.call_count, 4)
+            self.assertEqual(sorted(request.qs["page"][0]
+                for request in m.request_history), ["1", "2", "3", "4"])
+
+        # Paged by the first number of the next page
+        with requests_mock.Mocker() as m:
+
+            m.get(url + "?page=1&size=2", content=XML_RESPONSE_TN_LIST_PAGE_1)
+            m.get(url + "?page=4109235438&size=2",
+                content=XML_RESPONSE_TN_LIST_PAGE_2)
+
+            tns = self._tns.iter_all({"page": 1, "size": 2}, max_workers=2)
+
+            self.assertEqual([tn.full_number for tn in tns],
+                ["4109235436", "4109235437", "4109235438"])
+            self.assertEqual(m.call_count, 2)
+
+    def test_tn_list_stream(self):
+
+        client = Client("http://foo", "bar", "bar", "qux", stream=True)
+        tns = Tns(client=client)
+
+        with requests_mock.Mocker() as m:
+
+            m.get(client.config.url + tns.get_xpath(),
+                content=XML_RESPONSE_TN_LIST)
+
+            tn_list = tns.list({"page": 1, "size": 10})
+
+            self.assertEqual(len(tn_list.items), 2)
+            self.assertEqual(tn_list.items[1].full_number, "4109235437")
+            self.assertEqual(tn_list.items[1].last_modified_date,
+                "2015-07-14T19:13:57.000Z")
+            self.assertEqual(tns.result_count, "78")
+
+            m.get(client.config.url + tns.get_xpath(), content=b"")
+            self.assertEqual(len(tns.list({"page": 1}).items), 0)
+
+    def test_tn_list_compact(self):
+
+        for stream in (False, True):
+
+            client = Client("http://foo", "bar", "bar", "qux", stream=stream,
+                compact=True)
+            tns = Tns(client=client)
+
+            with requests_mock.Mocker() as m:
+
+                m.get(client.config.url + tns.get_xpath(),
+                    content=XML_RESPONSE_TN_LIST)
+
+                first, second = tns.list({"page": 1, "size": 10}).items
+
+                self.assertFalse(hasattr(second, "__dict__"))
+                self.assertFalse(hasattr(second, "history"))
+                self.assertEqual(second.full_number, "4109235437")
+                self.assertEqual(second.last_modified_date,
+                    "2015-07-14T19:13:57.000Z")
+                self.assertIsNone(second.order_id)
+                self.assertIs(first.status, second.status)
+
+    def test_tn_sub_resources(self):
+
+        tn = TelephoneNumber(self._tns)
+
+        self.assertNotIn("_history", vars(tn))
+        self.assertIs(tn.history, tn.history)
+        self.assertIs(tn._lata, tn.tn_lata)
+        self.assertIs(tn.tn_lata.client, self._client)
+
     def test_tn_rate_center(self):
 
         with requests_mock.Mocker() as m:
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+# For coverage.
+if __package__ is None:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+import asyncio
+
+from concurrent.futures import TimeoutError
+from unittest import main, TestCase
+
+from requests import HTTPError
+
+import requests_mock
+
+from iris_sdk.client import Client
+from iris_sdk.models.account import Account
+from iris_sdk.watcher import OrderWatcher
+
+XML_ORDER_RESPONSE = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<OrderResponse><Order><id>{}</id></Order>"
+    "<OrderStatus>{}</OrderStatus></OrderResponse>"
+)
+
+XML_RESPONSE_DISCONNECT_GET = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<DisconnectTelephoneNumberOrderResponse><orderRequest>"
+    b"<id>b902dee1-0585-4258-becd-5c7e51ccf5e1</id></orderRequest>"
+    b"<OrderStatus>PARTIAL</OrderStatus>"
+    b"</DisconnectTelephoneNumberOrderResponse>"
+)
+
+XML_RESPONSE_PORTIN_GET = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<LnpOrderResponse><OrderId>d28b36f7-fa96-49eb-9556-a40fca49f7c6"
+    b"</OrderId><ProcessingStatus>{}</ProcessingStatus></LnpOrderResponse>"
+)
+
+def order_responses(id, *statuses):
+    return [{"content": XML_ORDER_RESPONSE.format(id, status).encode()}
+        for status in statuses]
+
+class ClassOrderWatcherTest(TestCase):
+
+    """Test polling orders"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._client = Client("http://foo", "bar", "bar", "qux")
+        cls._account = Account(client=cls._client)
+
+    def setUp(self):
+        self._watcher = OrderWatcher(initial_delay=0.01, max_delay=0.02)
+        self.addCleanup(self._watcher.close)
+
+    def order(self, id):
+        return self._account.orders.create({"id": id}, False)
+
+    def url(self, resource):
+        return self._client.config.url + resource.get_xpath()
+
+    def test_watch(self):
+
+        order = self.order("1")
+        completed = []
+
+        with requests_mock.Mocker() as m:
+
+            m.get(self.url(order), order_responses("1", "RECEIVED",
+                "PROCESSING", "COMPLETE"))
+
+            future = self._watcher.watch(order, completed.append)
+            self.assertIs(self._watcher.watch(order), future)
+            self.assertEqual(len(self._watcher), 1)
+
+            response = future.result(5)
+            self.assertEqual(response.order_status, "COMPLETE")
+            self.assertEqual(response.order.id, "1")
+            self.assertEqual(m.call_count, 3)
+            self.assertEqual(completed, [future])
+            self.assertEqual(len(self._watcher), 0)
+
+    def test_watch_many(self):
+
+        orders = [self.order(str(id)) for id in range(20)]
+
+        with requests_mock.Mocker() as m:
+
+            for order in orders:
+                m.get(self.url(order), order_responses(order.id, "RECEIVED",
+                    "FAILED"))
+            futures = [self._watcher.watch(order) for order in orders]
+
+            done = list(self._watcher.as_completed(5))
+            self.assertEqual(set(done), set(futures))
+            self.assertEqual(
+                set(future.result().order.id for future in futures),
+                set(order.id for order in orders))
+            self.assertEqual(m.call_count, 40)
+
+    def test_watch_disconnect(self):
+
+        disconnect = self._account.disconnects.create(
+            {"id": "b902dee1-0585-4258-becd-5c7e51ccf5e1"}, False)
+
+        with requests_mock.Mocker() as m:
+
+            m.get(self.url(disconnect), content=XML_RESPONSE_DISCONNECT_GET)
+            response = self._watcher.watch(disconnect).result(5)
+
+            self.assertEqual(response.order_status, "PARTIAL")
+            self.assertEqual(disconnect.id,
+                "b902dee1-0585-4258-becd-5c7e51ccf5e1")
+
+    def test_watch_errors(self):
+
+        order = self.order("1")
+
+        with requests_mock.Mocker() as m:
+
+            m.get(self.url(order), [{"status_code": 500}, {"status_code": 500},
+                {"content": XML_ORDER_RESPONSE.format("1", "COMPLETE")
+                    .encode()}])
+            self.assertEqual(
+                self._watcher.watch(order).result(5).order_status, "COMPLETE")
+
+            m.get(self.url(order), status_code=500)
+            with self.assertRaises(HTTPError):
+                self._watcher.watch(order).result(5)
+            self.assertEqual(m.call_count, 6)
+
+    def test_watch_pending(self):
+
+        portin = self._account.portins.create(
+            {"order_id": "d28b36f7-fa96-49eb-9556-a40fca49f7c6"}, False)
+
+        with requests_mock.Mocker() as m:
+
+            m.get(self.url(portin), [{"content":
+                XML_RESPONSE_PORTIN_GET.replace(b"{}", status)}
+                for status in (b"SUBMITTED", b"FOC", b"COMPLETE")])
+            future = self._watcher.watch(portin,
+                pending=("SUBMITTED", "FOC"))
+
+            self.assertEqual(future.result(5).processing_status, "COMPLETE")
+
+    def test_watch_rounds(self):
+
+        watcher = self._watcher
+        first = [self.order(str(id)) for id in range(3)]
+        second = [self.order(str(id)) for id in range(3, 5)]
+
+        with requests_mock.Mocker() as m:
+
+            for order in first + second:
+                m.get(self.url(order), order_responses(order.id, "COMPLETE"))
+
+            futures = [watcher.watch(order) for order in first]
+            self.assertEqual(set(watcher.as_completed(5)), set(futures))
+            self.assertEqual(watcher.futures, [])
+
+            # The orders finished before an iteration are still covered
+            futures = [watcher.watch(order) for order in second]
+            for future in futures:
+                future.result(5)
+            self.assertEqual(set(watcher.futures), set(futures))
+            self.assertEqual(set(watcher.as_completed(5)), set(futures))
+            self.assertEqual(list(watcher.as_completed(5)), [])
+
+            watcher.watch(first[0]).result(5)
+            watcher.close()
+            self.assertEqual(watcher.futures, [])
+
+    def test_watch_timeout(self):
+
+        order = self.order("1")
+
+        with requests_mock.Mocker() as m:
+
+            m.get(self.url(order), order_responses("1", "RECEIVED"))
+            with self.assertRaises(TimeoutError):
+                self._watcher.watch(order, timeout=0.05).result(5)
+
+    def test_close(self):
+
+        order = self.order("1")
+        watcher = OrderWatcher(initial_delay=60)
+        future = watcher.watch(order)
+        watcher.close()
+
+        self.assertTrue(future.cancelled())
+        with self.assertRaises(RuntimeError):
+            watcher.watch(order)
+
+    def test_async_iteration(self):
+
+        orders = [self.order(str(id)) for id in range(5)]
+
+        async def collect():
+            return [response.order.id async for response in self._watcher]
+
+        with requests_mock.Mocker() as m:
+
+            for order in orders:
+                m.get(self.url(order), order_responses(order.id, "COMPLETE"))
+            for order in orders:
+                self._watcher.watch(order)
+
+            with self.assertRaises(RuntimeError):
+                self._watcher.__aiter__()
+            ids = asyncio.run(collect())
+
+            self.assertEqual(sorted(ids), [order.id for order in orders])
+
+if __name__ == "__main__":
+    main()
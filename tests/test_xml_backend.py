@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+# For coverage.
+if __package__ is None:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/..")
+
+from importlib import import_module
+from unittest import defaultTestLoader, main, TestCase
+from unittest.mock import patch
+from xml.etree.ElementTree import canonicalize
+
+import requests_mock
+
+from iris_sdk.client import Client
+from iris_sdk.models.account import Account
+from iris_sdk.models.available_numbers import AvailableNumbers
+from iris_sdk.models.in_service_numbers import InServiceNumbers
+from iris_sdk.utils import xml_backend
+from iris_sdk.utils.rest import RestError
+from iris_sdk.utils.xml_backend import etree, get_backend, LxmlBackend, \
+    set_backend, StdlibBackend
+
+XML_RESPONSE_AVAILABLE_NUMBERS = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<!-- Search -->"
+    "<SearchResult><ResultCount>2</ResultCount><TelephoneNumberDetailList>"
+    "<TelephoneNumberDetail><City>ALLENTOWN</City><LATA>222</LATA>"
+    "<State>NJ</State><FullNumber>6093252507</FullNumber>"
+    "</TelephoneNumberDetail><TelephoneNumberDetail><City>ALLENTOWN</City>"
+    "<LATA>222</LATA><State>NJ</State><FullNumber>6093570994</FullNumber>"
+    "</TelephoneNumberDetail></TelephoneNumberDetailList></SearchResult>"
+)
+
+XML_RESPONSE_ERROR = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<TNs><ErrorList><Error><Code>5005</Code>"
+    b"<Description>Bad page size</Description></Error></ErrorList></TNs>"
+)
+
+XML_RESPONSE_TNS = (
+    b"<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    b"<TNs><TotalCount>2</TotalCount><TelephoneNumbers><Count>2</Count>"
+    b"<TelephoneNumber>8043024183</TelephoneNumber>"
+    b"<TelephoneNumber>8042121778</TelephoneNumber>"
+    b"</TelephoneNumbers></TNs>"
+)
+
+BACKENDS = [StdlibBackend()] + ([LxmlBackend()] if etree is not None else [])
+
+# The modules of the resource tests, run again with the stdlib backend
+MODEL_TESTS = ("test_account", "test_basedata", "test_baseresource",
+    "test_cities", "test_covered_rate_centers", "test_disconnects",
+    "test_dlda", "test_lidb", "test_notes", "test_orders", "test_portins",
+    "test_rc", "test_rest", "test_sip_peers", "test_sites", "test_stateless",
+    "test_subscriptions", "test_tn_option_orders", "test_tns", "test_users")
+
+class ClassXmlBackendTest(TestCase):
+
+    """Test the XML backends give the same results"""
+
+    def setUp(self):
+        self._account = Account(client=Client("http://foo", "bar", "baz",
+            "qux"))
+
+    def run_backends(self, func):
+        results = []
+        for backend in BACKENDS:
+            previous = set_backend(backend)
+            try:
+                results.append(func())
+            finally:
+                set_backend(previous)
+        for result in results[1:]:
+            self.assertEqual(result, results[0])
+        return results[0]
+
+    def test_default(self):
+        self.assertIsInstance(get_backend(),
+            (StdlibBackend if etree is None else LxmlBackend))
+
+    def test_set_backend(self):
+        previous = set_backend("stdlib")
+        try:
+            self.assertIsInstance(get_backend(), StdlibBackend)
+            with self.assertRaises(ValueError):
+                set_backend("foo")
+        finally:
+            set_backend(previous)
+
+    def test_search_result(self):
+
+        def parse():
+            numbers = AvailableNumbers(self._account)
+            numbers._load(XML_RESPONSE_AVAILABLE_NUMBERS)
+            details = numbers.telephone_number_detail_list
+            return ([(item.full_number, item.lata) for item in
+                details.telephone_number_detail.items],
+                canonicalize(numbers._serialize()))
+
+        numbers, xml = self.run_backends(parse)
+        self.assertEqual(numbers,
+            [("6093252507", "222"), ("6093570994", "222")])
+        self.assertTrue(xml.startswith("<SearchResult><ResultCount>2<"))
+
+    def test_tns(self):
+
+        def parse():
+            tns = InServiceNumbers(self._account)
+            tns._load(XML_RESPONSE_TNS)
+            streamed = InServiceNumbers(self._account)
+            streamed._parse_stream(XML_RESPONSE_TNS[i:i + 10]
+                for i in range(0, len(XML_RESPONSE_TNS), 10))
+            return (tns.telephone_numbers.telephone_number.items,
+                streamed.telephone_numbers.telephone_number.items,
+                canonicalize(tns._serialize()))
+
+        numbers, streamed, xml = self.run_backends(parse)
+        self.assertEqual(numbers, ["8043024183", "8042121778"])
+        self.assertEqual(streamed, numbers)
+
+    def test_error(self):
+
+        def request():
+            with requests_mock.Mocker() as m:
+                m.get("http://foo/accounts/bar/inserviceNumbers",
+                    content=XML_RESPONSE_ERROR, status_code=400)
+                with self.assertRaises(RestError) as context:
+                    InServiceNumbers(self._account).list()
+            return str(context.exception)
+
+        self.assertEqual(self.run_backends(request),
+            "5005 Iris error: Bad page size")
+
+    def test_lxml_missing(self):
+        with patch.object(xml_backend, "etree", None):
+            with self.assertRaises(ImportError):
+                LxmlBackend()
+            with self.assertRaises(ImportError):
+                set_backend("lxml")
+        self.assertIsInstance(get_backend(),
+            (StdlibBackend if etree is None else LxmlBackend))
+
+class ClassStdlibBackendTest(TestCase):
+
+    """Run the resource tests with the stdlib backend"""
+
+    def setUp(self):
+        previous = set_backend("stdlib")
+        self.addCleanup(set_backend, previous)
+
+    def test_models(self):
+
+        for name in MODEL_TESTS:
+            module = (import_module(name) if not __package__ else
+                import_module("." + name, __package__))
+            with self.subTest(module=name):
+                result = self.defaultTestResult()
+                defaultTestLoader.loadTestsFromModule(module).run(result)
+                self.assertTrue(result.testsRun)
+                self.assertEqual([(str(test), error) for test, error in
+                    result.errors + result.failures], [])
+
+if __name__ == "__main__":
+    main()